@@ -18,7 +18,7 @@ def get_uptime_seconds() -> float:
 
 
 def create_app(
-    config_override: dict | None = None, setup_signals: bool = True
+    config_override: dict[str, Any] | None = None, setup_signals: bool = True
 ) -> Flask:
     """
     Create and configure the Flask application.
@@ -57,6 +57,11 @@ def create_app(
 
     init_metrics(__version__)
 
+    # Give each request a deadline shared by all of its stages
+    from weather_proxy.middleware.deadline import setup_request_deadline
+
+    setup_request_deadline(app)
+
     # Setup request/response logging (unless testing)
     if not app.config.get("TESTING"):
         setup_request_logging(app)
@@ -80,21 +85,31 @@ def create_app(
     # Register blueprints
     _register_blueprints(app)
 
+    # Keep hot cities warm in the background (unless testing)
+    if app_config.refresh_ahead_enabled and not app.config.get("TESTING"):
+        from weather_proxy.routes.weather import start_refresh_ahead
+
+        start_refresh_ahead()
+
     # Root endpoint - API information
     @app.route("/")
     def api_root() -> tuple[Any, int]:
         """Return API information and available endpoints."""
+        endpoints = {
+            "GET /": "API information (this endpoint)",
+            "GET /weather?city={name}": "Get current weather for a city",
+            "POST /weather/batch": "Get current weather for a list of cities",
+            "GET /health": "Service health check with dependency status",
+            "GET /metrics": "Prometheus-compatible metrics",
+        }
+        if app_config.heavy_hitters_enabled:
+            endpoints["GET /debug/hot-cities"] = "Most requested cities"
         return jsonify(
             {
                 "name": "Weather Proxy API",
                 "version": __version__,
                 "description": "A proxy service for Open-Meteo weather data with caching and resilience patterns",
-                "endpoints": {
-                    "GET /": "API information (this endpoint)",
-                    "GET /weather?city={name}": "Get current weather for a city",
-                    "GET /health": "Service health check with dependency status",
-                    "GET /metrics": "Prometheus-compatible metrics",
-                },
+                "endpoints": endpoints,
                 "example": "GET /weather?city=Berlin",
                 "docs": "https://github.com/ilya1200/meteo_proxy#readme",
             }
@@ -105,6 +120,7 @@ def create_app(
 
 def _register_blueprints(app: Flask) -> None:
     """Register all application blueprints."""
+    from weather_proxy.routes.debug import debug_bp
     from weather_proxy.routes.health import health_bp
     from weather_proxy.routes.weather import weather_bp
     from weather_proxy.utils.metrics import metrics_bp
@@ -112,3 +128,6 @@ def _register_blueprints(app: Flask) -> None:
     app.register_blueprint(health_bp)
     app.register_blueprint(weather_bp)
     app.register_blueprint(metrics_bp)
+    # Hot cities are raw user queries, only exposed when explicitly enabled
+    if get_config().heavy_hitters_enabled:
+        app.register_blueprint(debug_bp)
@@ -0,0 +1,511 @@
+"""ASGI application factory for serving the weather API on an event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import parse_qs
+
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+from weather_proxy import __version__
+from weather_proxy.app import get_uptime_seconds
+from weather_proxy.config import get_config
+from weather_proxy.middleware.logging import configure_logging, get_logger
+from weather_proxy.resilience.deadline import (
+    DeadlineExceeded,
+    cap,
+    parse_timeout_header,
+    request_deadline,
+    stage_timeout,
+)
+from weather_proxy.resilience.single_flight import SingleFlightTimeout
+from weather_proxy.services.async_cache_service import AsyncCacheService
+from weather_proxy.services.async_geocoding_service import AsyncGeocodingService
+from weather_proxy.services.async_http_client import close_async_http_client
+from weather_proxy.services.async_weather_service import AsyncWeatherService
+from weather_proxy.services.cache_service import CacheEntry
+from weather_proxy.services.geocoding_service import CityNotFoundError, GeocodingError
+from weather_proxy.services.responses import (
+    aligned_ttl,
+    build_current_data,
+    build_response_data,
+    build_weather_response,
+    cached_body,
+    is_upstream_unavailable,
+)
+from weather_proxy.services.weather_service import WeatherServiceError
+from weather_proxy.utils.metrics import (
+    init_metrics,
+    record_cache_hit,
+    record_cache_miss,
+    record_degraded_response,
+    record_early_refresh,
+    record_fetch_lease,
+    record_request,
+    record_single_flight,
+)
+from weather_proxy.utils.normalize import query_key
+
+Scope = dict[str, Any]
+Receive = Callable[[], Awaitable[dict[str, Any]]]
+Send = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+@dataclass
+class HttpResponse:
+    """Response produced by a route handler."""
+
+    status: int
+    body: str | bytes
+    content_type: str = "application/json"
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+def _json(body: dict[str, Any], status: int = 200) -> HttpResponse:
+    """Build a JSON response."""
+    return HttpResponse(status, json.dumps(body))
+
+
+def _error(code: str, message: str, request_id: str, status: int) -> HttpResponse:
+    """Build a JSON error response in the API's error format."""
+    return _json(
+        {"error": {"code": code, "message": message, "request_id": request_id}},
+        status,
+    )
+
+
+def _cached(
+    entry: CacheEntry,
+    request_id: str,
+    cache_ttl: int,
+    stale: bool,
+    degraded: bool = False,
+) -> HttpResponse:
+    """Build a response from a cached entry without re-serializing it."""
+    return HttpResponse(
+        200,
+        cached_body(entry, request_id, cache_ttl, stale, degraded),
+        headers={"Age": str(entry.age)},
+    )
+
+
+class AsyncWeatherApp:
+    """
+    The weather API as a plain ASGI application.
+
+    Serves ``/``, ``/weather``, ``/health`` and ``/metrics`` with the async
+    services, so each in-flight upstream call costs a coroutine instead of
+    a worker thread. Entries are shared with the Flask app through Redis:
+    fresh and stale hits, single-flight per key, the cross-pod fetch lease
+    and the last-known-good fallback behave the same way. Optional
+    features of the Flask app (grid cache, location aliases, negative
+    caching, micro-batching, refresh-ahead and the batch endpoint) are
+    only available there.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the app and its async services."""
+        config = get_config()
+        self.cache = AsyncCacheService()
+        self.geocoding_cache = AsyncCacheService(
+            ttl_seconds=config.geocoding_cache_ttl_seconds,
+            key_prefix="geocode",
+            stale_ttl_seconds=0,
+        )
+        self.last_known_good_cache = AsyncCacheService(
+            ttl_seconds=config.last_known_good_ttl_seconds,
+            key_prefix="lkg",
+            stale_ttl_seconds=0,
+        )
+        self.logger = get_logger("asgi")
+        self._inflight: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        self._refreshing: set[str] = set()
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._routes: dict[str, Callable[[Scope, str], Awaitable[HttpResponse]]] = {
+            "/": self._api_root,
+            "/weather": self._get_weather,
+            "/health": self._health_check,
+            "/metrics": self._metrics,
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Dispatch an ASGI connection."""
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, send)
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        """Handle server startup and shutdown."""
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.close()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _http(self, scope: Scope, send: Send) -> None:
+        """Route an HTTP request and send its response."""
+        started = time.time()
+        headers = dict(scope.get("headers", []))
+        request_id = headers.get(b"x-request-id", b"").decode("latin-1") or str(
+            uuid.uuid4()
+        )
+        path = scope["path"]
+        handler = self._routes.get(path)
+
+        if handler is None:
+            response = _error("NOT_FOUND", "Resource not found", request_id, 404)
+        elif scope["method"] not in ("GET", "HEAD"):
+            response = _error(
+                "METHOD_NOT_ALLOWED", "Method not allowed", request_id, 405
+            )
+        else:
+            try:
+                with request_deadline(self._request_budget(headers)):
+                    response = await handler(scope, request_id)
+            except Exception as e:
+                self.logger.exception("unhandled_error", path=path, error=str(e))
+                response = _error(
+                    "INTERNAL_ERROR", "An unexpected error occurred", request_id, 500
+                )
+
+        body = response.body
+        payload = body.encode() if isinstance(body, str) else body
+        headers = {
+            "content-type": response.content_type,
+            "content-length": str(len(payload)),
+            "x-request-id": request_id,
+            **response.headers,
+        }
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status,
+                "headers": [
+                    (name.lower().encode(), value.encode())
+                    for name, value in headers.items()
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": payload})
+        if handler is not None:
+            record_request(
+                scope["method"],
+                path,
+                "success" if response.status < 400 else "error",
+                time.time() - started,
+            )
+
+    @staticmethod
+    def _request_budget(headers: dict[bytes, bytes]) -> float | None:
+        """Get the request's time budget, or None when deadlines are disabled."""
+        config = get_config()
+        if config.request_deadline_seconds <= 0:
+            return None
+        header = config.request_deadline_header.lower().encode("latin-1")
+        value = headers.get(header) if header else None
+        return parse_timeout_header(
+            value.decode("latin-1") if value is not None else None,
+            config.request_deadline_seconds,
+        )
+
+    async def _api_root(self, _scope: Scope, _request_id: str) -> HttpResponse:
+        """Return API information and available endpoints."""
+        body = {
+            "name": "Weather Proxy API",
+            "version": __version__,
+            "description": "A proxy service for Open-Meteo weather data with caching and resilience patterns",
+            "endpoints": {
+                "GET /": "API information (this endpoint)",
+                "GET /weather?city={name}": "Get current weather for a city",
+                "GET /health": "Service health check with dependency status",
+                "GET /metrics": "Prometheus-compatible metrics",
+            },
+            "example": "GET /weather?city=Berlin",
+            "docs": "https://github.com/ilya1200/meteo_proxy#readme",
+        }
+        return _json(body)
+
+    async def _health_check(self, _scope: Scope, _request_id: str) -> HttpResponse:
+        """Report service health with dependency states."""
+        redis_ok, open_meteo_ok = await asyncio.gather(
+            self.cache.is_connected(), AsyncWeatherService().is_available()
+        )
+        dependencies = {
+            "redis": "connected" if redis_ok else "disconnected",
+            "open_meteo": "available" if open_meteo_ok else "unavailable",
+        }
+        body = {
+            "status": "healthy" if redis_ok and open_meteo_ok else "degraded",
+            "version": __version__,
+            "dependencies": dependencies,
+            "uptime_seconds": round(get_uptime_seconds(), 2),
+        }
+        return _json(body)
+
+    async def _metrics(self, _scope: Scope, _request_id: str) -> HttpResponse:
+        """Expose Prometheus metrics."""
+        return HttpResponse(200, generate_latest(), CONTENT_TYPE_LATEST)
+
+    async def _get_weather(self, scope: Scope, request_id: str) -> HttpResponse:
+        """Get weather data for the ``city`` query parameter."""
+        query = parse_qs(scope.get("query_string", b"").decode())
+        city = query.get("city", [""])[0].strip()
+
+        if not city:
+            return _error(
+                "MISSING_PARAMETER", "Missing required parameter: city", request_id, 400
+            )
+        if len(city) > 100:
+            return _error(
+                "INVALID_PARAMETER",
+                "City name too long (max 100 characters)",
+                request_id,
+                400,
+            )
+        cache_key = query_key(city)
+        if not cache_key:
+            return _error(
+                "INVALID_PARAMETER",
+                "City name must contain letters or digits",
+                request_id,
+                400,
+            )
+
+        try:
+            entry = await self.cache.get_entry(cache_key)
+            if entry is not None:
+                record_cache_hit()
+                stale = entry.is_stale
+                if stale or entry.should_refresh_early(get_config().xfetch_beta):
+                    if not stale:
+                        record_early_refresh()
+                    self._schedule_refresh(city, cache_key)
+                return _cached(entry, request_id, entry.fresh_ttl, stale)
+
+            record_cache_miss()
+            data = await self._single_flight(city, cache_key)
+            response = build_weather_response(
+                city=data["city"],
+                country=data["country"],
+                latitude=data["coordinates"]["latitude"],
+                longitude=data["coordinates"]["longitude"],
+                weather_data=data["current"],
+                cached=False,
+                cache_ttl=None,
+                request_id=request_id,
+            )
+            return _json(response)
+
+        except SingleFlightTimeout:
+            fallback = await self._last_known_good(cache_key, request_id)
+            if fallback is not None:
+                return fallback
+            return _error(
+                "SERVICE_UNAVAILABLE",
+                "Timed out waiting for weather data, please retry",
+                request_id,
+                503,
+            )
+
+        except CityNotFoundError as e:
+            return _error("CITY_NOT_FOUND", str(e), request_id, 404)
+
+        except GeocodingError as e:
+            fallback = None
+            if is_upstream_unavailable(e):
+                fallback = await self._last_known_good(cache_key, request_id)
+            return fallback or _error(
+                "GEOCODING_ERROR", f"Failed to geocode city: {e}", request_id, 502
+            )
+
+        except WeatherServiceError as e:
+            fallback = None
+            if is_upstream_unavailable(e):
+                fallback = await self._last_known_good(cache_key, request_id)
+            return fallback or _error(
+                "WEATHER_SERVICE_ERROR",
+                f"Failed to fetch weather data: {e}",
+                request_id,
+                502,
+            )
+
+    async def _single_flight(self, city: str, cache_key: str) -> dict[str, Any]:
+        """
+        Fetch a key once for all concurrent requests in this process.
+
+        Raises:
+            SingleFlightTimeout: If the request has no time left, or the fetch
+                takes longer than configured.
+        """
+        config = get_config()
+        try:
+            # A request with no time left does not start shared upstream work
+            stage_timeout("fetch", config.single_flight_timeout_seconds)
+        except DeadlineExceeded as e:
+            raise SingleFlightTimeout(
+                "Request deadline exceeded before fetching"
+            ) from e
+        future = self._inflight.get(cache_key)
+        if future is None:
+            record_single_flight("leader")
+            future = asyncio.ensure_future(self._fetch_detached(city, cache_key))
+            self._inflight[cache_key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        else:
+            record_single_flight("waiter")
+
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(future), cap(config.single_flight_timeout_seconds)
+            )
+        except TimeoutError as e:
+            raise SingleFlightTimeout(f"Timed out waiting for {cache_key}") from e
+
+    async def _fetch_detached(self, city: str, cache_key: str) -> dict[str, Any]:
+        """
+        Fetch a key for every coalesced request, outside their deadlines.
+
+        The leader's deadline would otherwise fail the fetch for followers
+        whose own budgets still have time; each request caps only its wait.
+        """
+        with request_deadline(None):
+            return await self._fetch_and_cache(city, cache_key)
+
+    async def _fetch_and_cache(self, city: str, cache_key: str) -> dict[str, Any]:
+        """Fetch a key from upstream under the cross-pod fetch lease."""
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        config = get_config()
+        lease_token = await self.cache.acquire_lease(
+            cache_key, ttl=config.fetch_lease_ttl_seconds
+        )
+        if lease_token is None:
+            cached = await self.cache.wait_for(
+                cache_key,
+                timeout=config.fetch_lease_wait_seconds,
+                poll_interval=config.fetch_lease_poll_seconds,
+            )
+            if cached is not None:
+                record_fetch_lease("waited")
+                return cached
+            record_fetch_lease("fallback")
+        else:
+            record_fetch_lease("acquired")
+
+        try:
+            if lease_token is not None:
+                # A holder may have written the value just before releasing
+                entry = await self.cache.get_entry(cache_key, bypass_local=True)
+                if entry is not None:
+                    return entry.payload
+            return await self._fetch_from_upstream(city, cache_key)
+        finally:
+            if lease_token is not None:
+                await self.cache.release_lease(cache_key, lease_token)
+
+    async def _fetch_from_upstream(self, city: str, cache_key: str) -> dict[str, Any]:
+        """Geocode the city, fetch its weather and cache the response data."""
+        started = time.monotonic()
+        coords = await AsyncGeocodingService(cache=self.geocoding_cache).city_to_coords(
+            city
+        )
+        weather = await AsyncWeatherService().get_weather(
+            coords.latitude, coords.longitude
+        )
+        response_data = build_response_data(coords, build_current_data(weather))
+
+        await self.cache.set(
+            cache_key,
+            response_data,
+            ttl=aligned_ttl(weather),
+            fetch_duration=time.monotonic() - started,
+        )
+        await self.last_known_good_cache.set(cache_key, response_data)
+        return response_data
+
+    def _schedule_refresh(self, city: str, cache_key: str) -> None:
+        """Refresh a key in a background task unless one is running."""
+        if cache_key in self._refreshing:
+            return
+        self._refreshing.add(cache_key)
+
+        async def refresh() -> None:
+            try:
+                await self._refresh_in_background(city, cache_key)
+            finally:
+                self._refreshing.discard(cache_key)
+
+        task = asyncio.ensure_future(refresh())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh_in_background(self, city: str, cache_key: str) -> None:
+        """Re-fetch a stale key from upstream, unless another pod is already on it."""
+        try:
+            # Tasks copy the request context; refreshes have no deadline
+            with request_deadline(None):
+                lease_token = await self.cache.acquire_lease(
+                    cache_key, ttl=get_config().fetch_lease_ttl_seconds
+                )
+                if lease_token is None:
+                    return
+                try:
+                    # Read Redis, not the L1 copy another pod may have replaced
+                    entry = await self.cache.get_entry(cache_key, bypass_local=True)
+                    if (
+                        entry is None
+                        or entry.is_stale
+                        or entry.should_refresh_early(get_config().xfetch_beta)
+                    ):
+                        await self._fetch_from_upstream(city, cache_key)
+                finally:
+                    await self.cache.release_lease(cache_key, lease_token)
+        except Exception as e:
+            # The stale copy keeps being served; the next stale hit retries
+            self.logger.warning("background_refresh_failed", city=city, error=str(e))
+
+    async def _last_known_good(
+        self, cache_key: str, request_id: str
+    ) -> HttpResponse | None:
+        """Build a degraded result from the last-known-good copy, if any."""
+        entry = await self.last_known_good_cache.get_entry(cache_key)
+        if entry is None:
+            return None
+        record_degraded_response()
+        return _cached(entry, request_id, cache_ttl=0, stale=True, degraded=True)
+
+    async def close(self) -> None:
+        """Cancel background refreshes and close pooled connections."""
+        for task in list(self._tasks):
+            task.cancel()
+        for cache in (self.cache, self.geocoding_cache, self.last_known_good_cache):
+            await cache.close()
+        await close_async_http_client()
+
+
+def create_async_app() -> AsyncWeatherApp:
+    """
+    Create the ASGI application.
+
+    Run it under an ASGI server with uvloop, for example::
+
+        uvicorn --factory weather_proxy.asgi:create_async_app --loop uvloop
+
+    Returns:
+        ASGI application instance.
+    """
+    configure_logging()
+    init_metrics(__version__)
+    return AsyncWeatherApp()
@@ -19,6 +19,20 @@ def _load_env_file() -> None:
 # Load environment on module import
 _load_env_file()
 
+# Settings used as sizes or divisors, for which zero or less cannot work
+_POSITIVE_SETTINGS = (
+    "grid_cache_resolution_deg",
+    "weather_batch_geocoding_concurrency",
+    "not_found_filter_capacity",
+    "not_found_filter_rotate_seconds",
+    "heavy_hitters_sketch_width",
+    "heavy_hitters_sketch_depth",
+    "heavy_hitters_window_seconds",
+    "retry_budget_window_seconds",
+    "io_executor_max_workers",
+    "http_max_connections",
+)
+
 
 @dataclass
 class Config:
@@ -40,6 +54,41 @@ class Config:
     cache_ttl_seconds: int = field(
         default_factory=lambda: int(os.getenv("CACHE_TTL_SECONDS", "300"))
     )
+    cache_ttl_jitter: float = field(
+        default_factory=lambda: float(os.getenv("CACHE_TTL_JITTER", "0.1"))
+    )
+    xfetch_beta: float = field(
+        default_factory=lambda: float(os.getenv("XFETCH_BETA", "1.0"))
+    )
+
+    cache_stale_ttl_seconds: int = field(
+        default_factory=lambda: int(os.getenv("CACHE_STALE_TTL_SECONDS", "300"))
+    )
+    last_known_good_ttl_seconds: int = field(
+        default_factory=lambda: int(os.getenv("LAST_KNOWN_GOOD_TTL_SECONDS", "86400"))
+    )
+    geocoding_cache_ttl_seconds: int = field(
+        default_factory=lambda: int(os.getenv("GEOCODING_CACHE_TTL_SECONDS", "604800"))
+    )
+
+    # Distributed fetch lease (one pod refreshes a key at a time)
+    fetch_lease_ttl_seconds: int = field(
+        default_factory=lambda: int(os.getenv("FETCH_LEASE_TTL_SECONDS", "10"))
+    )
+    fetch_lease_wait_seconds: float = field(
+        default_factory=lambda: float(os.getenv("FETCH_LEASE_WAIT_SECONDS", "5"))
+    )
+    fetch_lease_poll_seconds: float = field(
+        default_factory=lambda: float(os.getenv("FETCH_LEASE_POLL_SECONDS", "0.05"))
+    )
+
+    # In-process L1 cache settings (per worker, in front of Redis)
+    local_cache_max_size: int = field(
+        default_factory=lambda: int(os.getenv("LOCAL_CACHE_MAX_SIZE", "1024"))
+    )
+    local_cache_ttl_seconds: int = field(
+        default_factory=lambda: int(os.getenv("LOCAL_CACHE_TTL_SECONDS", "10"))
+    )
 
     # Open-Meteo API settings
     open_meteo_base_url: str = field(
@@ -53,6 +102,177 @@ class Config:
         )
     )
 
+    # Upstream update cadence per data type; entries expire when the next
+    # value is published (0 falls back to CACHE_TTL_SECONDS)
+    upstream_interval_current_seconds: int = field(
+        default_factory=lambda: int(
+            os.getenv("UPSTREAM_INTERVAL_CURRENT_SECONDS", "900")
+        )
+    )
+    upstream_interval_hourly_seconds: int = field(
+        default_factory=lambda: int(
+            os.getenv("UPSTREAM_INTERVAL_HOURLY_SECONDS", "3600")
+        )
+    )
+    upstream_interval_daily_seconds: int = field(
+        default_factory=lambda: int(
+            os.getenv("UPSTREAM_INTERVAL_DAILY_SECONDS", "86400")
+        )
+    )
+    upstream_min_ttl_seconds: int = field(
+        default_factory=lambda: int(os.getenv("UPSTREAM_MIN_TTL_SECONDS", "30"))
+    )
+
+    # Batch endpoint settings
+    weather_batch_max_size: int = field(
+        default_factory=lambda: int(os.getenv("WEATHER_BATCH_MAX_SIZE", "200"))
+    )
+    weather_batch_geocoding_concurrency: int = field(
+        default_factory=lambda: int(
+            os.getenv("WEATHER_BATCH_GEOCODING_CONCURRENCY", "8")
+        )
+    )
+
+    # How long unknown city queries are answered as not found (0 disables)
+    negative_cache_ttl_seconds: int = field(
+        default_factory=lambda: int(os.getenv("NEGATIVE_CACHE_TTL_SECONDS", "60"))
+    )
+
+    # Shared Bloom filter rejecting known-unknown city queries locally
+    not_found_filter_enabled: bool = field(
+        default_factory=lambda: (
+            os.getenv("NOT_FOUND_FILTER_ENABLED", "false").lower() == "true"
+        )
+    )
+    not_found_filter_capacity: int = field(
+        default_factory=lambda: int(os.getenv("NOT_FOUND_FILTER_CAPACITY", "100000"))
+    )
+    not_found_filter_error_rate: float = field(
+        default_factory=lambda: float(os.getenv("NOT_FOUND_FILTER_ERROR_RATE", "0.001"))
+    )
+    not_found_filter_rotate_seconds: int = field(
+        default_factory=lambda: int(
+            os.getenv("NOT_FOUND_FILTER_ROTATE_SECONDS", "3600")
+        )
+    )
+    not_found_filter_sync_seconds: float = field(
+        default_factory=lambda: float(os.getenv("NOT_FOUND_FILTER_SYNC_SECONDS", "10"))
+    )
+
+    # Cache weather per canonical location ID instead of per raw query
+    location_aliases_enabled: bool = field(
+        default_factory=lambda: (
+            os.getenv("LOCATION_ALIASES_ENABLED", "false").lower() == "true"
+        )
+    )
+
+    # Share current weather between cities in the same forecast grid cell
+    grid_cache_enabled: bool = field(
+        default_factory=lambda: (
+            os.getenv("GRID_CACHE_ENABLED", "false").lower() == "true"
+        )
+    )
+    grid_cache_resolution_deg: float = field(
+        default_factory=lambda: float(os.getenv("GRID_CACHE_RESOLUTION_DEG", "0.1"))
+    )
+
+    # Cross-request micro-batching of forecast lookups
+    weather_microbatch_enabled: bool = field(
+        default_factory=lambda: (
+            os.getenv("WEATHER_MICROBATCH_ENABLED", "false").lower() == "true"
+        )
+    )
+    weather_microbatch_window_ms: int = field(
+        default_factory=lambda: int(os.getenv("WEATHER_MICROBATCH_WINDOW_MS", "10"))
+    )
+    weather_microbatch_max_size: int = field(
+        default_factory=lambda: int(os.getenv("WEATHER_MICROBATCH_MAX_SIZE", "50"))
+    )
+
+    # Heavy-hitter tracking of requested cities
+    heavy_hitters_enabled: bool = field(
+        default_factory=lambda: (
+            os.getenv("HEAVY_HITTERS_ENABLED", "false").lower() == "true"
+        )
+    )
+    heavy_hitters_k: int = field(
+        default_factory=lambda: int(os.getenv("HEAVY_HITTERS_K", "50"))
+    )
+    heavy_hitters_sketch_width: int = field(
+        default_factory=lambda: int(os.getenv("HEAVY_HITTERS_SKETCH_WIDTH", "2048"))
+    )
+    heavy_hitters_sketch_depth: int = field(
+        default_factory=lambda: int(os.getenv("HEAVY_HITTERS_SKETCH_DEPTH", "4"))
+    )
+    heavy_hitters_flush_seconds: float = field(
+        default_factory=lambda: float(os.getenv("HEAVY_HITTERS_FLUSH_SECONDS", "10"))
+    )
+    heavy_hitters_window_seconds: int = field(
+        default_factory=lambda: int(os.getenv("HEAVY_HITTERS_WINDOW_SECONDS", "3600"))
+    )
+    heavy_hitters_l1_min_count: int = field(
+        default_factory=lambda: int(os.getenv("HEAVY_HITTERS_L1_MIN_COUNT", "0"))
+    )
+
+    # Background refresh-ahead of hot cities
+    refresh_ahead_enabled: bool = field(
+        default_factory=lambda: (
+            os.getenv("REFRESH_AHEAD_ENABLED", "false").lower() == "true"
+        )
+    )
+    refresh_ahead_cities: list[str] = field(
+        default_factory=lambda: [
+            city.strip()
+            for city in os.getenv("REFRESH_AHEAD_CITIES", "").split(",")
+            if city.strip()
+        ]
+    )
+    refresh_ahead_top_n: int = field(
+        default_factory=lambda: int(os.getenv("REFRESH_AHEAD_TOP_N", "20"))
+    )
+    refresh_ahead_interval_seconds: float = field(
+        default_factory=lambda: float(os.getenv("REFRESH_AHEAD_INTERVAL_SECONDS", "30"))
+    )
+    refresh_ahead_margin_seconds: int = field(
+        default_factory=lambda: int(os.getenv("REFRESH_AHEAD_MARGIN_SECONDS", "60"))
+    )
+    refresh_ahead_concurrency: int = field(
+        default_factory=lambda: int(os.getenv("REFRESH_AHEAD_CONCURRENCY", "4"))
+    )
+    refresh_ahead_rate_per_second: float = field(
+        default_factory=lambda: float(os.getenv("REFRESH_AHEAD_RATE_PER_SECOND", "5"))
+    )
+
+    # Bounded background pool for upstream and Redis work of the sync app
+    io_executor_enabled: bool = field(
+        default_factory=lambda: (
+            os.getenv("IO_EXECUTOR_ENABLED", "false").lower() == "true"
+        )
+    )
+    io_executor_max_workers: int = field(
+        default_factory=lambda: int(os.getenv("IO_EXECUTOR_MAX_WORKERS", "32"))
+    )
+    io_executor_max_pending: int = field(
+        default_factory=lambda: int(os.getenv("IO_EXECUTOR_MAX_PENDING", "256"))
+    )
+    io_executor_timeout_seconds: float = field(
+        default_factory=lambda: float(os.getenv("IO_EXECUTOR_TIMEOUT_SECONDS", "8"))
+    )
+
+    # Upstream HTTP connection pool settings
+    http_max_connections: int = field(
+        default_factory=lambda: int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+    )
+    http_max_keepalive_connections: int = field(
+        default_factory=lambda: int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    )
+    http_keepalive_expiry_seconds: float = field(
+        default_factory=lambda: float(os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", "30"))
+    )
+    http2_enabled: bool = field(
+        default_factory=lambda: os.getenv("HTTP2_ENABLED", "false").lower() == "true"
+    )
+
     # Resilience settings
     circuit_breaker_fail_max: int = field(
         default_factory=lambda: int(os.getenv("CIRCUIT_BREAKER_FAIL_MAX", "5"))
@@ -66,11 +286,67 @@ class Config:
     retry_max_attempts: int = field(
         default_factory=lambda: int(os.getenv("RETRY_MAX_ATTEMPTS", "3"))
     )
+    retry_backoff_base_seconds: float = field(
+        default_factory=lambda: float(os.getenv("RETRY_BACKOFF_BASE_SECONDS", "0.2"))
+    )
+    retry_backoff_max_seconds: float = field(
+        default_factory=lambda: float(os.getenv("RETRY_BACKOFF_MAX_SECONDS", "2"))
+    )
+    retry_deadline_seconds: float = field(
+        default_factory=lambda: float(os.getenv("RETRY_DEADLINE_SECONDS", "10"))
+    )
+    retry_budget_ratio: float = field(
+        default_factory=lambda: float(os.getenv("RETRY_BUDGET_RATIO", "0.1"))
+    )
+    retry_budget_min_retries: int = field(
+        default_factory=lambda: int(os.getenv("RETRY_BUDGET_MIN_RETRIES", "10"))
+    )
+    retry_budget_window_seconds: int = field(
+        default_factory=lambda: int(os.getenv("RETRY_BUDGET_WINDOW_SECONDS", "10"))
+    )
+    retry_budget_shared: bool = field(
+        default_factory=lambda: (
+            os.getenv("RETRY_BUDGET_SHARED", "false").lower() == "true"
+        )
+    )
+    retry_budget_sync_seconds: float = field(
+        default_factory=lambda: float(os.getenv("RETRY_BUDGET_SYNC_SECONDS", "1"))
+    )
+    hedging_enabled: bool = field(
+        default_factory=lambda: os.getenv("HEDGING_ENABLED", "false").lower() == "true"
+    )
+    hedge_quantile: float = field(
+        default_factory=lambda: float(os.getenv("HEDGE_QUANTILE", "0.95"))
+    )
+    hedge_min_delay_seconds: float = field(
+        default_factory=lambda: float(os.getenv("HEDGE_MIN_DELAY_SECONDS", "0.05"))
+    )
+    hedge_budget_ratio: float = field(
+        default_factory=lambda: float(os.getenv("HEDGE_BUDGET_RATIO", "0.05"))
+    )
+    single_flight_timeout_seconds: float = field(
+        default_factory=lambda: float(os.getenv("SINGLE_FLIGHT_TIMEOUT_SECONDS", "15"))
+    )
+    request_deadline_seconds: float = field(
+        default_factory=lambda: float(os.getenv("REQUEST_DEADLINE_SECONDS", "10"))
+    )
+    request_deadline_header: str = field(
+        default_factory=lambda: os.getenv(
+            "REQUEST_DEADLINE_HEADER", "X-Request-Timeout"
+        )
+    )
 
     # Logging settings
     log_level: str = field(default_factory=lambda: os.getenv("LOG_LEVEL", "INFO"))
     log_format: str = field(default_factory=lambda: os.getenv("LOG_FORMAT", "json"))
 
+    def __post_init__(self) -> None:
+        """Reject settings that would otherwise fail on every request."""
+        for name in _POSITIVE_SETTINGS:
+            value = getattr(self, name)
+            if value <= 0:
+                raise ValueError(f"{name.upper()} must be positive, got {value}")
+
     @classmethod
     def from_env(cls) -> "Config":
         """Create configuration from environment variables."""
@@ -0,0 +1,42 @@
+"""Request deadline middleware."""
+
+from flask import Flask, g, request
+
+from weather_proxy.config import get_config
+from weather_proxy.resilience.deadline import (
+    parse_timeout_header,
+    reset_deadline,
+    set_deadline,
+)
+
+
+def setup_request_deadline(app: Flask) -> None:
+    """
+    Give every request a deadline that its stages share.
+
+    The budget is ``REQUEST_DEADLINE_SECONDS``, shortened by the client's
+    ``REQUEST_DEADLINE_HEADER`` when sent. A budget of 0 disables deadlines.
+
+    Args:
+        app: Flask application instance.
+    """
+
+    @app.before_request
+    def start_request_deadline() -> None:
+        """Start the deadline of the incoming request."""
+        config = get_config()
+        if config.request_deadline_seconds <= 0:
+            return
+        header = config.request_deadline_header
+        seconds = parse_timeout_header(
+            request.headers.get(header) if header else None,
+            config.request_deadline_seconds,
+        )
+        g.deadline_token = set_deadline(seconds)
+
+    @app.teardown_request
+    def clear_request_deadline(_error: BaseException | None) -> None:
+        """Clear the deadline so it does not leak into the next request."""
+        token = g.pop("deadline_token", None)
+        if token is not None:
+            reset_deadline(token)
@@ -6,10 +6,13 @@ from weather_proxy.resilience.circuit_breaker import (
     get_weather_breaker,
     with_retry,
 )
+from weather_proxy.resilience.single_flight import SingleFlight, SingleFlightTimeout
 
 __all__ = [
     "get_geocoding_breaker",
     "get_weather_breaker",
     "with_retry",
     "CircuitBreakerOpen",
+    "SingleFlight",
+    "SingleFlightTimeout",
 ]
@@ -1,19 +1,19 @@
 """Circuit breaker and retry patterns for resilient external API calls."""
 
-from collections.abc import Callable
+import inspect
+import random
+from collections.abc import Awaitable, Callable
 from functools import wraps
-from typing import ParamSpec, TypeVar
+from typing import Any, ParamSpec, TypeVar
 
 import httpx
 import pybreaker
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+from tenacity import RetryCallState, retry, retry_if_exception
 
 from weather_proxy.config import get_config
+from weather_proxy.resilience import deadline
+from weather_proxy.resilience.retry_budget import get_retry_budget
+from weather_proxy.utils.metrics import record_retry
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -56,42 +56,116 @@ def get_weather_breaker() -> pybreaker.CircuitBreaker:
     return _weather_breaker
 
 
+def is_retryable(error: BaseException) -> bool:
+    """
+    Check whether a failed upstream call is worth retrying.
+
+    Services wrap HTTP errors in their own exception types, so the cause
+    chain is searched for the underlying httpx error. Timeouts, connection
+    errors, 5xx and 429 responses are retryable; other client errors and
+    open circuit breakers are not.
+
+    Args:
+        error: Exception raised by the call.
+
+    Returns:
+        True if the call may succeed when retried.
+    """
+    current: BaseException | None = error
+    while current is not None:
+        if isinstance(current, CircuitBreakerOpen):
+            return False
+        if isinstance(current, httpx.HTTPStatusError):
+            status = current.response.status_code
+            return status >= 500 or status == 429
+        if isinstance(current, (httpx.TimeoutException, httpx.ConnectError)):
+            return True
+        current = current.__cause__
+    return False
+
+
 def with_retry(
     max_attempts: int | None = None,
-    min_wait: float = 1,
-    max_wait: float = 10,
+    min_wait: float | None = None,
+    max_wait: float | None = None,
 ) -> Callable[[Callable[P, R]], Callable[P, R]]:
     """
-    Decorator to add retry logic with exponential backoff.
+    Decorator to add budgeted retries with full-jitter backoff.
+
+    Each call counts as a primary call in the process-wide retry budget,
+    and each retry must be granted by it, so retries stay a small fraction
+    of upstream traffic during outages. Before retry ``n`` the call sleeps
+    a random time between 0 and ``min_wait * 2 ** (n - 1)`` (capped at
+    ``max_wait``), and never past the retry deadline: no retry starts once
+    ``RETRY_DEADLINE_SECONDS`` have passed since the first attempt, or
+    once the request's own deadline has passed. Works on coroutine
+    functions too, sleeping with asyncio between tries.
 
     Args:
-        max_attempts: Maximum number of retry attempts. Defaults to config.
-        min_wait: Minimum wait time between retries in seconds.
-        max_wait: Maximum wait time between retries in seconds.
+        max_attempts: Maximum number of attempts. Defaults to config.
+        min_wait: Backoff base in seconds. Defaults to config.
+        max_wait: Maximum backoff in seconds. Defaults to config.
 
     Returns:
         Decorated function with retry logic.
     """
-    if max_attempts is None:
+
+    def remaining(retry_state: RetryCallState) -> float:
+        """Get the seconds left before the retry or request deadline."""
+        elapsed = retry_state.seconds_since_start or 0.0
+        left = get_config().retry_deadline_seconds - elapsed
+        request_left = deadline.remaining()
+        return left if request_left is None else min(left, request_left)
+
+    def stop(retry_state: RetryCallState) -> bool:
+        """Stop after the last attempt, at the deadline or without budget."""
         config = get_config()
-        max_attempts = config.retry_max_attempts
+        if retry_state.attempt_number >= (max_attempts or config.retry_max_attempts):
+            return True
+        if remaining(retry_state) <= 0:
+            record_retry("deadline")
+            return True
+        if not get_retry_budget().try_acquire():
+            record_retry("budget_exhausted")
+            return True
+        record_retry("retried")
+        return False
+
+    def wait(retry_state: RetryCallState) -> float:
+        """Sleep a full-jitter backoff, capped by the time left."""
+        config = get_config()
+        base = min_wait if min_wait is not None else config.retry_backoff_base_seconds
+        cap = max_wait if max_wait is not None else config.retry_backoff_max_seconds
+        backoff = random.uniform(
+            0, min(cap, base * 2 ** (retry_state.attempt_number - 1))
+        )
+        return max(0.0, min(backoff, remaining(retry_state)))
 
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
-        @retry(
-            stop=stop_after_attempt(max_attempts),
-            wait=wait_exponential(multiplier=1, min=min_wait, max=max_wait),
-            retry=retry_if_exception_type(
-                (
-                    httpx.TimeoutException,
-                    httpx.ConnectError,
-                    httpx.HTTPStatusError,
-                )
-            ),
+        retrying = retry(
+            stop=stop,
+            wait=wait,
+            retry=retry_if_exception(is_retryable),
             reraise=True,
         )
+
+        if inspect.iscoroutinefunction(func):
+            # tenacity only awaits between tries when it wraps a coroutine
+            async_retrying_func = retrying(func)
+
+            @wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+                get_retry_budget().record_call()
+                return await async_retrying_func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        retrying_func = retrying(func)
+
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            return func(*args, **kwargs)
+            get_retry_budget().record_call()
+            return retrying_func(*args, **kwargs)
 
         return wrapper
 
@@ -115,7 +189,8 @@ def with_circuit_breaker(
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
             try:
-                return breaker.call(func, *args, **kwargs)
+                with breaker.calling():
+                    return func(*args, **kwargs)
             except pybreaker.CircuitBreakerError as e:
                 raise CircuitBreakerOpen(
                     f"Circuit breaker {breaker.name} is open"
@@ -126,6 +201,34 @@ def with_circuit_breaker(
     return decorator
 
 
+async def call_with_breaker(
+    breaker: pybreaker.CircuitBreaker,
+    func: Callable[..., Awaitable[Any]],
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    """
+    Await a coroutine function under a circuit breaker.
+
+    pybreaker only calls functions synchronously; its ``calling`` context
+    applies the same state rules around an awaited call.
+
+    Args:
+        breaker: Circuit breaker instance to use.
+        func: Coroutine function to call.
+        *args: Positional arguments for func.
+        **kwargs: Keyword arguments for func.
+
+    Returns:
+        The awaited result of func.
+
+    Raises:
+        pybreaker.CircuitBreakerError: If the breaker is open.
+    """
+    with breaker.calling():
+        return await func(*args, **kwargs)
+
+
 def reset_circuit_breakers() -> None:
     """Reset all circuit breakers (useful for testing)."""
     global _geocoding_breaker, _weather_breaker
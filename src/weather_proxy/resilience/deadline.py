@@ -0,0 +1,138 @@
+"""Request deadlines propagated to every stage of a request."""
+
+import contextvars
+import math
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from weather_proxy.config import get_config
+from weather_proxy.utils.metrics import record_deadline_exceeded
+
+# Monotonic time by which the current request must be answered, if any
+_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "request_deadline", default=None
+)
+
+
+class DeadlineExceeded(Exception):
+    """Exception raised when a request's deadline has passed."""
+
+    pass
+
+
+def set_deadline(seconds: float | None) -> contextvars.Token[float | None]:
+    """
+    Start a deadline for the current context.
+
+    Args:
+        seconds: Time budget from now, or None to run without a deadline.
+
+    Returns:
+        Token for restoring the previous deadline with reset_deadline.
+    """
+    value = time.monotonic() + seconds if seconds is not None else None
+    return _deadline.set(value)
+
+
+def reset_deadline(token: contextvars.Token[float | None]) -> None:
+    """Restore the deadline that was in effect before set_deadline."""
+    _deadline.reset(token)
+
+
+@contextmanager
+def request_deadline(seconds: float | None) -> Iterator[None]:
+    """
+    Run a block under a deadline, or with none if ``seconds`` is None.
+
+    Background work started from a request uses ``request_deadline(None)``
+    so it is not cut short by the request's budget.
+    """
+    token = set_deadline(seconds)
+    try:
+        yield
+    finally:
+        reset_deadline(token)
+
+
+@contextmanager
+def shared_deadline() -> Iterator[None]:
+    """
+    Run work shared by several requests under the configured request budget.
+
+    Coalesced work must not inherit the deadline of the request that happened
+    to start it, or a client sending a short timeout header would fail it for
+    every other request waiting on it.
+    """
+    budget = get_config().request_deadline_seconds
+    with request_deadline(budget if budget > 0 else None):
+        yield
+
+
+def remaining() -> float | None:
+    """
+    Get the seconds left before the current deadline.
+
+    Returns:
+        Remaining seconds (negative once passed), or None without a deadline.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def cap(seconds: float) -> float:
+    """Shorten a timeout to the time left before the deadline, if any."""
+    left = remaining()
+    if left is None:
+        return seconds
+    return max(0.0, min(seconds, left))
+
+
+def stage_timeout(stage: str, timeout: float) -> float:
+    """
+    Get the timeout for the next stage of a request.
+
+    Args:
+        stage: Name of the stage, for metrics.
+        timeout: The stage's own timeout in seconds.
+
+    Returns:
+        ``timeout`` shortened to the time left before the deadline.
+
+    Raises:
+        DeadlineExceeded: If no time is left.
+    """
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        record_deadline_exceeded(stage)
+        raise DeadlineExceeded(f"Request deadline exceeded before {stage}")
+    return min(timeout, left)
+
+
+def parse_timeout_header(value: str | None, default: float) -> float:
+    """
+    Get a request's time budget from a client timeout header.
+
+    Clients may only shorten the configured budget; missing, malformed or
+    non-positive values leave it unchanged.
+
+    Args:
+        value: Header value in seconds, e.g. ``"2.5"``.
+        default: Configured budget in seconds.
+
+    Returns:
+        The request's budget in seconds.
+    """
+    if not value:
+        return default
+    try:
+        seconds = float(value)
+    except ValueError:
+        return default
+    if not math.isfinite(seconds) or seconds <= 0:
+        return default
+    return min(seconds, default)
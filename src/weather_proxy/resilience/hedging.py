@@ -0,0 +1,265 @@
+"""Hedged upstream requests that duplicate calls slower than usual."""
+
+import asyncio
+import contextvars
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+from weather_proxy.config import get_config
+from weather_proxy.resilience.retry_budget import RetryBudget
+from weather_proxy.utils.metrics import record_hedge, record_hedge_delay
+
+# Successful call latencies kept per upstream, and how many before hedging
+_SAMPLE_SIZE = 512
+_MIN_SAMPLES = 20
+# The quantile is recomputed after this many new samples
+_RECOMPUTE_EVERY = 16
+
+
+class Hedger:
+    """
+    Send one duplicate of an upstream call that is slower than usual.
+
+    The hedge delay is the ``quantile`` (p95 by default) of recent
+    successful call latencies, and never less than ``min_delay``. If the
+    primary call has not returned by then, one duplicate is sent and the
+    first successful response wins. Hedges are drawn from a RetryBudget
+    of ``budget_ratio`` per primary call, so upstream load grows by at
+    most that fraction even when the whole upstream slows down.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        quantile: float | None = None,
+        min_delay: float | None = None,
+        budget_ratio: float | None = None,
+    ) -> None:
+        """
+        Initialize hedger.
+
+        Args:
+            name: Name of the upstream, for metrics.
+            quantile: Latency quantile used as hedge delay. Defaults to config.
+            min_delay: Lower bound of the hedge delay. Defaults to config.
+            budget_ratio: Hedges allowed per primary call. Defaults to config.
+        """
+        config = get_config()
+        self.name = name
+        self.quantile = quantile if quantile is not None else config.hedge_quantile
+        self.min_delay = (
+            min_delay if min_delay is not None else config.hedge_min_delay_seconds
+        )
+        self.budget = RetryBudget(
+            ratio=budget_ratio
+            if budget_ratio is not None
+            else config.hedge_budget_ratio,
+            min_retries=0,
+            shared=False,
+        )
+        self._samples: deque[float] = deque(maxlen=_SAMPLE_SIZE)
+        self._new_samples = 0
+        self._delay: float | None = None
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        """Record the latency of a successful call."""
+        with self._lock:
+            self._samples.append(seconds)
+            self._new_samples += 1
+            if len(self._samples) < _MIN_SAMPLES:
+                return
+            if self._delay is not None and self._new_samples < _RECOMPUTE_EVERY:
+                return
+            ordered = sorted(self._samples)
+            index = min(len(ordered) - 1, math.ceil(self.quantile * len(ordered)) - 1)
+            self._delay = max(self.min_delay, ordered[max(0, index)])
+            self._new_samples = 0
+            delay = self._delay
+        record_hedge_delay(self.name, delay)
+
+    def delay(self) -> float | None:
+        """Get the hedge delay, or None until enough latencies were seen."""
+        with self._lock:
+            return self._delay
+
+    def call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Call ``fn``, sending a duplicate if it is slower than the hedge delay.
+
+        Both calls run on a shared thread pool with the caller's context;
+        the losing call is left to finish and its result is dropped.
+
+        Returns:
+            The first successful result.
+
+        Raises:
+            Exception: The primary call's error if every call failed.
+        """
+        delay = self.delay()
+        self.budget.record_call()
+        if delay is None:
+            return self._timed(fn, *args, **kwargs)
+
+        try:
+            primary = self._submit(fn, *args, **kwargs)
+        except RuntimeError:
+            # Pool is shutting down
+            return self._timed(fn, *args, **kwargs)
+        if wait([primary], timeout=delay).done:
+            return primary.result()
+        if not self.budget.try_acquire():
+            record_hedge(self.name, "budget_exhausted")
+            return primary.result()
+
+        try:
+            hedge = self._submit(fn, *args, **kwargs)
+        except RuntimeError:
+            return primary.result()
+        record_hedge(self.name, "sent")
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            succeeded = [future for future in done if future.exception() is None]
+            if succeeded:
+                if hedge in succeeded and primary not in succeeded:
+                    record_hedge(self.name, "won")
+                return succeeded[0].result()
+        return primary.result()
+
+    async def acall(
+        self, fn: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        """
+        Await ``fn``, sending a duplicate if it is slower than the hedge delay.
+
+        The losing call is cancelled.
+
+        Returns:
+            The first successful result.
+
+        Raises:
+            Exception: The primary call's error if every call failed.
+        """
+        delay = self.delay()
+        self.budget.record_call()
+        if delay is None:
+            return await self._atimed(fn, *args, **kwargs)
+
+        primary = asyncio.ensure_future(self._atimed(fn, *args, **kwargs))
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return primary.result()
+            if not self.budget.try_acquire():
+                record_hedge(self.name, "budget_exhausted")
+                return await primary
+
+            hedge = asyncio.ensure_future(self._atimed(fn, *args, **kwargs))
+            tasks.append(hedge)
+            record_hedge(self.name, "sent")
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded:
+                    if hedge in succeeded and primary not in succeeded:
+                        record_hedge(self.name, "won")
+                    return succeeded[0].result()
+            return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def _submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future[Any]:
+        """Run a timed call on the hedging pool in a copy of the caller's context."""
+        context = contextvars.copy_context()
+        return _get_executor().submit(context.run, self._timed, fn, *args, **kwargs)
+
+    def _timed(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Call ``fn`` and record its latency if it succeeds."""
+        started = time.monotonic()
+        result = fn(*args, **kwargs)
+        self.observe(time.monotonic() - started)
+        return result
+
+    async def _atimed(
+        self, fn: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Await ``fn`` and record its latency if it succeeds."""
+        started = time.monotonic()
+        result = await fn(*args, **kwargs)
+        self.observe(time.monotonic() - started)
+        return result
+
+
+# Hedgers per upstream, and the pool running hedged sync calls
+_hedgers: dict[str, Hedger] = {}
+_executor: ThreadPoolExecutor | None = None
+_hedging_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get or create the thread pool of hedged sync calls."""
+    global _executor
+    if _executor is None:
+        with _hedging_lock:
+            if _executor is None:
+                # Sized like the HTTP pool, which bounds concurrent calls anyway
+                _executor = ThreadPoolExecutor(
+                    max_workers=get_config().http_max_connections,
+                    thread_name_prefix="upstream-hedge",
+                )
+    return _executor
+
+
+def get_hedger(name: str) -> Hedger:
+    """Get or create the hedger of an upstream."""
+    hedger = _hedgers.get(name)
+    if hedger is None:
+        with _hedging_lock:
+            hedger = _hedgers.get(name)
+            if hedger is None:
+                hedger = _hedgers[name] = Hedger(name)
+    return hedger
+
+
+def hedged_call(name: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Call ``fn`` through the upstream's hedger when hedging is enabled.
+
+    Run it inside ``breaker.calling()``, not ``breaker.call``, so the hedge
+    delay and both attempts do not hold the circuit breaker's lock.
+    """
+    if not get_config().hedging_enabled:
+        return fn(*args, **kwargs)
+    return get_hedger(name).call(fn, *args, **kwargs)
+
+
+async def hedged_acall(
+    name: str, fn: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+) -> Any:
+    """Await ``fn`` through the upstream's hedger when hedging is enabled."""
+    if not get_config().hedging_enabled:
+        return await fn(*args, **kwargs)
+    return await get_hedger(name).acall(fn, *args, **kwargs)
+
+
+def reset_hedgers() -> None:
+    """Reset hedgers and their thread pool (useful for testing)."""
+    global _executor
+    with _hedging_lock:
+        executor = _executor
+        _executor = None
+        _hedgers.clear()
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,218 @@
+"""Retry budget capping upstream retries at a fraction of primary calls."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import redis
+
+from weather_proxy.config import get_config
+
+if TYPE_CHECKING:
+    from redis import Redis
+
+
+class RetryBudget:
+    """
+    Allow retries only while they stay a small fraction of primary calls.
+
+    Every primary upstream call earns ``ratio`` of a retry and every retry
+    spends one, counted over a sliding window of ``window_seconds`` (the
+    previous fixed window is weighted by how much of it still overlaps).
+    ``min_retries`` per window are always allowed so a quiet process can
+    still retry a blip. During an outage, retries stop once the budget is
+    spent, so upstream load grows by at most ``ratio`` instead of
+    multiplying by the attempt count.
+
+    With ``shared``, counts from every worker are pooled in a Redis hash
+    per window. Local counts are pushed and the cluster totals read back
+    at most every ``sync_seconds``, so the budget costs no Redis round
+    trip on most calls and falls back to local counts on Redis errors.
+    """
+
+    def __init__(
+        self,
+        ratio: float | None = None,
+        min_retries: int | None = None,
+        window_seconds: int | None = None,
+        shared: bool | None = None,
+        sync_seconds: float | None = None,
+        redis_url: str | None = None,
+        key_prefix: str = "retry_budget",
+    ) -> None:
+        """
+        Initialize retry budget.
+
+        Args:
+            ratio: Retries allowed per primary call. Defaults to config.
+            min_retries: Retries always allowed per window. Defaults to config.
+            window_seconds: Length of the counting window. Defaults to config.
+            shared: Pool counts across workers in Redis. Defaults to config.
+            sync_seconds: Interval between Redis syncs. Defaults to config.
+            redis_url: Redis connection URL. Defaults to config.
+            key_prefix: Prefix of the per-window Redis keys.
+        """
+        config = get_config()
+        self.ratio = ratio if ratio is not None else config.retry_budget_ratio
+        self.min_retries = (
+            min_retries if min_retries is not None else config.retry_budget_min_retries
+        )
+        self.window_seconds = window_seconds or config.retry_budget_window_seconds
+        self.shared = shared if shared is not None else config.retry_budget_shared
+        self.sync_seconds = (
+            sync_seconds
+            if sync_seconds is not None
+            else config.retry_budget_sync_seconds
+        )
+        self.redis_url = redis_url or config.redis_url
+        self.key_prefix = key_prefix
+        # Local [calls, retries] per window number
+        self._counts: dict[int, list[int]] = {}
+        # Counts not yet pushed to Redis, and cluster totals from the last sync
+        self._unsynced: dict[int, list[int]] = {}
+        self._cluster: dict[int, list[int]] = {}
+        self._next_sync = 0.0
+        self._lock = threading.Lock()
+        self._client: Redis[str] | None = None
+
+    @property
+    def client(self) -> Redis[str]:
+        """Get or create Redis client."""
+        if self._client is None:
+            self._client = redis.from_url(
+                self.redis_url,
+                decode_responses=True,
+            )
+        return self._client
+
+    def _make_key(self, window: int) -> str:
+        """Generate the Redis key of a window's counts."""
+        return f"{self.key_prefix}:{window}"
+
+    def _add(self, index: int, now: float) -> None:
+        """Count a call (index 0) or retry (index 1). Caller holds the lock."""
+        window = int(now // self.window_seconds)
+        # Only a shared budget pushes counts to Redis
+        tables = (self._counts, self._unsynced) if self.shared else (self._counts,)
+        for counts in tables:
+            counts.setdefault(window, [0, 0])[index] += 1
+            # Only the current and previous windows are ever read
+            for stale in [w for w in counts if w < window - 1]:
+                del counts[stale]
+
+    def _totals(self, now: float) -> tuple[float, float]:
+        """Get sliding-window call and retry counts. Caller holds the lock."""
+        window = int(now // self.window_seconds)
+        overlap = 1 - (now % self.window_seconds) / self.window_seconds
+        if self.shared and self._cluster:
+            source = {
+                w: [
+                    self._cluster.get(w, [0, 0])[i] + self._unsynced.get(w, [0, 0])[i]
+                    for i in (0, 1)
+                ]
+                for w in (window - 1, window)
+            }
+        else:
+            source = self._counts
+        current = source.get(window, [0, 0])
+        previous = source.get(window - 1, [0, 0])
+        return (
+            current[0] + previous[0] * overlap,
+            current[1] + previous[1] * overlap,
+        )
+
+    def record_call(self) -> None:
+        """Count one primary upstream call, syncing with Redis when due."""
+        now = time.time()
+        with self._lock:
+            self._add(0, now)
+            sync_due = self.shared and time.monotonic() >= self._next_sync
+        if sync_due:
+            self.sync()
+
+    def try_acquire(self) -> bool:
+        """
+        Spend one retry if the budget allows it.
+
+        Returns:
+            True if the caller may retry, False if the budget is spent.
+        """
+        now = time.time()
+        with self._lock:
+            calls, retries = self._totals(now)
+            if retries >= self.min_retries + calls * self.ratio:
+                return False
+            self._add(1, now)
+            return True
+
+    def sync(self) -> bool:
+        """
+        Push local counts to Redis and read back the cluster totals.
+
+        Returns:
+            True if Redis was updated, False on Redis errors.
+        """
+        with self._lock:
+            self._next_sync = time.monotonic() + self.sync_seconds
+            pending, self._unsynced = self._unsynced, {}
+            window = int(time.time() // self.window_seconds)
+
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for w, (calls, retries) in pending.items():
+                key = self._make_key(w)
+                pipe.hincrby(key, "calls", calls)
+                pipe.hincrby(key, "retries", retries)
+                pipe.expire(key, self.window_seconds * 2)
+            pipe.hmget(self._make_key(window - 1), ["calls", "retries"])
+            pipe.hmget(self._make_key(window), ["calls", "retries"])
+            *_, previous, current = pipe.execute()
+        except redis.RedisError:
+            with self._lock:
+                # Keep the counts for the next attempt; local counts decide meanwhile
+                for w, counts in pending.items():
+                    merged = self._unsynced.setdefault(w, [0, 0])
+                    merged[0] += counts[0]
+                    merged[1] += counts[1]
+                self._cluster = {}
+            return False
+
+        with self._lock:
+            self._cluster = {
+                window - 1: [int(value or 0) for value in previous],
+                window: [int(value or 0) for value in current],
+            }
+        return True
+
+    def close(self) -> None:
+        """Close the Redis connection."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+
+# Process-wide retry budget shared by all upstream clients
+_retry_budget: RetryBudget | None = None
+_retry_budget_lock = threading.Lock()
+
+
+def get_retry_budget() -> RetryBudget:
+    """Get or create the process-wide retry budget."""
+    global _retry_budget
+    if _retry_budget is None:
+        with _retry_budget_lock:
+            if _retry_budget is None:
+                _retry_budget = RetryBudget()
+    return _retry_budget
+
+
+def reset_retry_budget() -> None:
+    """Reset the retry budget (useful for testing)."""
+    global _retry_budget
+    with _retry_budget_lock:
+        budget = _retry_budget
+        _retry_budget = None
+    if budget is not None:
+        budget.close()
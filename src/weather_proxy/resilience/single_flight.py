@@ -0,0 +1,124 @@
+"""In-process request coalescing for concurrent cache misses."""
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any, TypeVar, cast
+
+from weather_proxy.utils.metrics import record_single_flight
+
+R = TypeVar("R")
+
+
+class SingleFlightTimeout(Exception):
+    """Exception raised when a waiter gives up on an in-flight call."""
+
+    pass
+
+
+class _Call:
+    """State shared between the leader of a call and its waiters."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into a single execution.
+
+    The first caller for a key becomes the leader and runs the function.
+    Callers arriving while it is in flight wait for the leader's result,
+    or re-raise the leader's error, instead of doing the work again.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, _Call] = {}
+        self._futures: dict[str, Future[Any]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], R], timeout: float) -> R:
+        """
+        Run ``fn`` once per key across concurrent callers.
+
+        Args:
+            key: Key identifying the work being coalesced.
+            fn: Function producing the result, run by the leader only.
+            timeout: Maximum time in seconds a waiter blocks for the leader.
+
+        Returns:
+            The leader's result.
+
+        Raises:
+            SingleFlightTimeout: If a waiter's wait exceeds ``timeout``.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+
+        if not is_leader:
+            record_single_flight("waiter")
+            if not call.done.wait(timeout):
+                raise SingleFlightTimeout(
+                    f"Timed out after {timeout}s waiting for in-flight request"
+                )
+            if call.error is not None:
+                raise call.error
+            return cast(R, call.result)
+
+        record_single_flight("leader")
+        try:
+            call.result = fn()
+            return cast(R, call.result)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def submit(self, key: str, start: Callable[[], Future[R]]) -> Future[R]:
+        """
+        Share one background call per key across concurrent callers.
+
+        Unlike ``do``, no caller runs the call itself: each waits on the
+        returned future with its own timeout, so a caller giving up early
+        does not fail the call for the others.
+
+        Args:
+            key: Key identifying the work being coalesced.
+            start: Function starting the call, e.g. by submitting it to a pool.
+
+        Returns:
+            Future of the call in flight for ``key``.
+
+        Raises:
+            Exception: Whatever ``start`` raised; nothing is left in flight.
+        """
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None:
+                record_single_flight("waiter")
+                return cast(Future[R], future)
+            future = start()
+            self._futures[key] = future
+        record_single_flight("leader")
+        future.add_done_callback(lambda done: self._forget(key, done))
+        return future
+
+    def _forget(self, key: str, future: Future[Any]) -> None:
+        """Drop a finished background call unless a newer one replaced it."""
+        with self._lock:
+            if self._futures.get(key) is future:
+                del self._futures[key]
+
+    def in_flight(self) -> int:
+        """Return the number of keys currently being fetched."""
+        with self._lock:
+            return len(self._calls) + len(self._futures)
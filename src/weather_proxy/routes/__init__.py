@@ -1,6 +1,7 @@
 """API route blueprints."""
 
+from weather_proxy.routes.debug import debug_bp
 from weather_proxy.routes.health import health_bp
 from weather_proxy.routes.weather import weather_bp
 
-__all__ = ["health_bp", "weather_bp"]
+__all__ = ["debug_bp", "health_bp", "weather_bp"]
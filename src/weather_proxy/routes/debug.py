@@ -0,0 +1,31 @@
+"""Debug endpoints exposing internal service state."""
+
+from typing import Any
+
+from flask import Blueprint, jsonify
+
+from weather_proxy.routes.weather import get_heavy_hitters
+
+debug_bp = Blueprint("debug", __name__)
+
+
+@debug_bp.route("/debug/hot-cities", methods=["GET"])
+def hot_cities() -> tuple[Any, int]:
+    """
+    List the most requested cities.
+
+    Returns:
+        JSON response with this worker's top cities and the top cities
+        across all workers as of the last flush, and HTTP 200.
+    """
+    tracker = get_heavy_hitters()
+    return jsonify(
+        {
+            "local": [
+                {"city": city, "count": count} for city, count in tracker.local_top()
+            ],
+            "global": [
+                {"city": city, "count": count} for city, count in tracker.global_top()
+            ],
+        }
+    ), 200
@@ -5,7 +5,9 @@ from typing import Any
 from flask import Blueprint, current_app, jsonify
 
 from weather_proxy.app import get_uptime_seconds
+from weather_proxy.config import get_config
 from weather_proxy.services.cache_service import CacheService
+from weather_proxy.services.io_executor import IOExecutorSaturated, get_io_executor
 from weather_proxy.services.weather_service import WeatherService
 
 health_bp = Blueprint("health", __name__)
@@ -24,10 +26,7 @@ def health_check() -> tuple[Any, int]:
     version = current_app.config.get("APP_VERSION", "unknown")
 
     # Check dependencies
-    dependencies = {
-        "redis": _check_redis_health(),
-        "open_meteo": _check_open_meteo_health(),
-    }
+    dependencies = _check_dependencies()
 
     # Determine overall status
     all_healthy = all(
@@ -46,6 +45,39 @@ def health_check() -> tuple[Any, int]:
     return jsonify(response), 200
 
 
+def _check_dependencies() -> dict[str, str]:
+    """
+    Probe all dependencies, concurrently on the I/O executor when enabled.
+
+    Returns:
+        Mapping of dependency name to its status.
+    """
+    checks = {
+        "redis": (_check_redis_health, "disconnected"),
+        "open_meteo": (_check_open_meteo_health, "unavailable"),
+    }
+    config = get_config()
+    if not config.io_executor_enabled:
+        return {name: check() for name, (check, _) in checks.items()}
+
+    try:
+        futures = {
+            name: get_io_executor().submit(check) for name, (check, _) in checks.items()
+        }
+    except (IOExecutorSaturated, RuntimeError):
+        return {name: check() for name, (check, _) in checks.items()}
+
+    dependencies = {}
+    for name, future in futures.items():
+        try:
+            dependencies[name] = future.result(
+                timeout=config.io_executor_timeout_seconds
+            )
+        except Exception:
+            dependencies[name] = checks[name][1]
+    return dependencies
+
+
 def _check_redis_health() -> str:
     """
     Check Redis connection health.
@@ -1,36 +1,285 @@
 """Weather endpoint for retrieving weather data by city."""
 
 import contextlib
+import threading
+import time
 import uuid
-from typing import Any
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, cast
 
-from flask import Blueprint, g, jsonify, request
+from flask import Blueprint, Response, g, jsonify, request
 
-from weather_proxy.services.cache_service import CacheService
+from weather_proxy.config import get_config
+from weather_proxy.middleware.logging import get_logger
+from weather_proxy.resilience.deadline import (
+    DeadlineExceeded,
+    cap,
+    request_deadline,
+    shared_deadline,
+    stage_timeout,
+)
+from weather_proxy.resilience.single_flight import SingleFlight, SingleFlightTimeout
+from weather_proxy.services.cache_service import CacheEntry, CacheService
 from weather_proxy.services.geocoding_service import (
     CityNotFoundError,
+    Coordinates,
     GeocodingError,
     GeocodingService,
 )
+from weather_proxy.services.heavy_hitters import HeavyHitterTracker
+from weather_proxy.services.io_executor import (
+    IOExecutorSaturated,
+    IOExecutorTimeout,
+    get_io_executor,
+    shutdown_io_executor,
+)
+from weather_proxy.services.location_aliases import LocationAliases
+from weather_proxy.services.not_found_filter import NotFoundFilter
+from weather_proxy.services.refresh_ahead import RefreshAheadScheduler
+from weather_proxy.services.responses import (
+    aligned_ttl,
+    build_current_data,
+    build_response_data,
+    build_weather_response,
+    cached_body,
+    is_upstream_unavailable,
+)
+from weather_proxy.services.weather_batcher import WeatherBatcher
 from weather_proxy.services.weather_service import (
+    WeatherData,
     WeatherService,
     WeatherServiceError,
+    grid_cell_key,
+)
+from weather_proxy.utils.metrics import (
+    record_degraded_response,
+    record_early_refresh,
+    record_fetch_lease,
+    record_negative_cache_hit,
+    record_not_found_filter_rejection,
 )
+from weather_proxy.utils.normalize import query_key
 
 weather_bp = Blueprint("weather", __name__)
 
-# Module-level cache service instance
+# Module-level cache service instances
 _cache_service: CacheService | None = None
+_geocoding_cache: CacheService | None = None
+_last_known_good_cache: CacheService | None = None
+_grid_cache: CacheService | None = None
+_negative_cache: CacheService | None = None
+_not_found_filter: NotFoundFilter | None = None
+_location_aliases: LocationAliases | None = None
+
+# Optional cross-request batching of upstream forecast lookups
+_weather_batcher: WeatherBatcher | None = None
+_weather_batcher_lock = threading.Lock()
+
+# Coalesces concurrent cache misses for the same city within this worker
+_single_flight = SingleFlight()
+
+# Background refreshes of stale entries (at most one per key per worker)
+_refresh_executor: ThreadPoolExecutor | None = None
+_refreshing: set[str] = set()
+_refresh_lock = threading.Lock()
+
+# Refresh-ahead of hot cities, ranked by the heavy-hitter tracker
+_refresh_ahead_scheduler: RefreshAheadScheduler | None = None
+_heavy_hitters: HeavyHitterTracker | None = None
+_heavy_hitters_lock = threading.Lock()
 
 
 def get_cache_service() -> CacheService:
     """Get or create cache service instance."""
     global _cache_service
     if _cache_service is None:
-        _cache_service = CacheService()
+        admission = (
+            _admit_to_l1 if get_config().heavy_hitters_l1_min_count > 0 else None
+        )
+        _cache_service = CacheService(admission=admission)
     return _cache_service
 
 
+def get_heavy_hitters() -> HeavyHitterTracker:
+    """Get or create the tracker of most requested cities."""
+    global _heavy_hitters
+    if _heavy_hitters is None:
+        with _heavy_hitters_lock:
+            if _heavy_hitters is None:
+                _heavy_hitters = HeavyHitterTracker()
+    return _heavy_hitters
+
+
+def _admit_to_l1(key: str) -> bool:
+    """Admit only cities requested often enough in this worker to the L1."""
+    if key.startswith("loc:"):
+        # Canonical location keys are not tracked by query; always admit
+        return True
+    min_count = get_config().heavy_hitters_l1_min_count
+    return get_heavy_hitters().estimate(key) >= min_count
+
+
+def get_geocoding_cache() -> CacheService:
+    """Get or create the long-lived geocoding cache instance."""
+    global _geocoding_cache
+    if _geocoding_cache is None:
+        _geocoding_cache = CacheService(
+            ttl_seconds=get_config().geocoding_cache_ttl_seconds,
+            key_prefix="geocode",
+            stale_ttl_seconds=0,
+        )
+    return _geocoding_cache
+
+
+def get_last_known_good_cache() -> CacheService:
+    """Get or create the long-retention last-known-good cache instance."""
+    global _last_known_good_cache
+    if _last_known_good_cache is None:
+        _last_known_good_cache = CacheService(
+            ttl_seconds=get_config().last_known_good_ttl_seconds,
+            key_prefix="lkg",
+            stale_ttl_seconds=0,
+        )
+    return _last_known_good_cache
+
+
+def get_grid_cache() -> CacheService:
+    """Get or create the cache of current weather per forecast grid cell."""
+    global _grid_cache
+    if _grid_cache is None:
+        _grid_cache = CacheService(key_prefix="cell")
+    return _grid_cache
+
+
+def get_negative_cache() -> CacheService:
+    """Get or create the short-lived cache of queries with no matching city."""
+    global _negative_cache
+    if _negative_cache is None:
+        _negative_cache = CacheService(
+            ttl_seconds=get_config().negative_cache_ttl_seconds,
+            key_prefix="notfound",
+            stale_ttl_seconds=0,
+        )
+    return _negative_cache
+
+
+def get_not_found_filter() -> NotFoundFilter:
+    """Get or create the shared Bloom filter of unknown city queries."""
+    global _not_found_filter
+    if _not_found_filter is None:
+        _not_found_filter = NotFoundFilter()
+    return _not_found_filter
+
+
+def _known_not_found(cache_keys: list[str]) -> set[str]:
+    """Return the keys recently found to match no city."""
+    if get_config().negative_cache_ttl_seconds <= 0 or not cache_keys:
+        return set()
+
+    entries: dict[str, CacheEntry] = {}
+    with contextlib.suppress(Exception):
+        entries = get_negative_cache().get_many(cache_keys)
+    for _ in entries:
+        record_negative_cache_hit()
+    return set(entries)
+
+
+def _rejected_as_not_found(queries: dict[str, str]) -> set[str]:
+    """
+    Return the keys of queries recently found to match no city.
+
+    Only the exact negative cache decides. When the shared not-found filter
+    is enabled it is checked first, in memory, and the negative cache is
+    only read for the queries it may contain, so a false positive costs a
+    lookup rather than a wrong 404.
+
+    Args:
+        queries: Mapping of cache key to city name.
+    """
+    if not get_config().not_found_filter_enabled:
+        return _known_not_found(list(queries))
+
+    candidates = list(queries)
+    # The filter must never fail a request; without it every key is read
+    with contextlib.suppress(Exception):
+        not_found_filter = get_not_found_filter()
+        if not_found_filter.claim_sync():
+            _run_in_background(not_found_filter.sync)
+        candidates = [
+            key for key, city in queries.items() if not_found_filter.might_contain(city)
+        ]
+
+    rejected = _known_not_found(candidates)
+    for _ in rejected:
+        record_not_found_filter_rejection()
+    return rejected
+
+
+def _remember_not_found(queries: dict[str, str]) -> None:
+    """Record queries that matched no city, keyed by their cache key."""
+    if get_config().not_found_filter_enabled and queries:
+        with contextlib.suppress(Exception):
+            get_not_found_filter().add(list(queries.values()))
+
+    if get_config().negative_cache_ttl_seconds <= 0 or not queries:
+        return
+
+    with contextlib.suppress(Exception):
+        get_negative_cache().set_many(
+            {cache_key: {"query": city} for cache_key, city in queries.items()}
+        )
+
+
+def get_location_aliases() -> LocationAliases:
+    """Get or create the table mapping city queries to location IDs."""
+    global _location_aliases
+    if _location_aliases is None:
+        _location_aliases = LocationAliases()
+    return _location_aliases
+
+
+def _location_cache_key(location_id: int) -> str:
+    """Cache key for the weather of a canonical location."""
+    return f"loc:{location_id}"
+
+
+def _weather_cache_key(city: str) -> str:
+    """
+    Get the cache key for a city's weather.
+
+    With location aliases enabled, a query that was resolved before maps
+    straight to its canonical location's key without geocoding; other
+    queries are keyed by their normalized name until they are resolved.
+    """
+    if get_config().location_aliases_enabled:
+        location_id = get_location_aliases().get(city)
+        if location_id is not None:
+            return _location_cache_key(location_id)
+    return query_key(city)
+
+
+def get_weather_batcher() -> WeatherBatcher:
+    """Get or create the shared weather micro-batcher."""
+    global _weather_batcher
+    if _weather_batcher is None:
+        with _weather_batcher_lock:
+            if _weather_batcher is None:
+                config = get_config()
+                _weather_batcher = WeatherBatcher(
+                    window_seconds=config.weather_microbatch_window_ms / 1000,
+                    max_batch_size=config.weather_microbatch_max_size,
+                )
+    return _weather_batcher
+
+
+def _get_current_weather(coords: Coordinates) -> WeatherData:
+    """Fetch current weather, through the micro-batcher when enabled."""
+    if get_config().weather_microbatch_enabled:
+        return get_weather_batcher().get_weather(coords.latitude, coords.longitude)
+    return WeatherService().get_weather(coords.latitude, coords.longitude)
+
+
 def get_request_id() -> str:
     """Get or generate a request ID for correlation."""
     if hasattr(g, "request_id"):
@@ -39,35 +288,414 @@ def get_request_id() -> str:
     return g.request_id
 
 
-def _build_weather_response(
-    city: str,
-    country: str | None,
-    latitude: float,
-    longitude: float,
-    weather_data: dict[str, Any],
-    cached: bool,
-    cache_ttl: int | None,
-    request_id: str,
-) -> dict[str, Any]:
-    """Build standardized weather response."""
-    response = {
-        "city": city,
-        "country": country,
-        "coordinates": {
-            "latitude": latitude,
-            "longitude": longitude,
-        },
-        "current": weather_data,
-        "cached": cached,
-        "request_id": request_id,
-    }
-
-    if cache_ttl is not None:
-        response["cache_expires_in"] = cache_ttl
+def _fetch_and_cache(city: str, cache_key: str) -> dict[str, Any]:
+    """
+    Fetch weather for a city from upstream and store it in the cache.
+
+    Runs once per key at a time under single-flight; the cache is checked
+    again first because a previous leader may have just filled it. Across
+    pods, a Redis fetch lease lets only one process call upstream; others
+    wait for its value and fetch themselves only if the holder goes away.
+    Redis is read once more after taking the lease, since a holder may
+    have written the value and released the lease just before.
+
+    Args:
+        city: City name as requested by the client.
+        cache_key: Cache key for the city.
+
+    Returns:
+        Response data as stored in the cache.
+    """
+    cache_service = get_cache_service()
+    cached_data = None
+    with contextlib.suppress(Exception):
+        cached_data = cache_service.get(cache_key)
+    if cached_data is not None:
+        return cached_data
+
+    config = get_config()
+    lease_token = cache_service.acquire_lease(
+        cache_key, ttl=config.fetch_lease_ttl_seconds
+    )
+    if lease_token is None:
+        cached_data = cache_service.wait_for(
+            cache_key,
+            timeout=config.fetch_lease_wait_seconds,
+            poll_interval=config.fetch_lease_poll_seconds,
+        )
+        if cached_data is not None:
+            record_fetch_lease("waited")
+            return cached_data
+        record_fetch_lease("fallback")
+    else:
+        record_fetch_lease("acquired")
+
+    try:
+        if lease_token is not None:
+            entry = None
+            with contextlib.suppress(Exception):
+                entry = cache_service.get_entry(cache_key, bypass_local=True)
+            if entry is not None:
+                return entry.payload
+        return _fetch_from_upstream(city, cache_key)
+    finally:
+        if lease_token is not None:
+            cache_service.release_lease(cache_key, lease_token)
+
+
+def _fetch_coalesced(city: str, cache_key: str) -> dict[str, Any]:
+    """
+    Fetch a missed key once for all concurrent requests in this worker.
+
+    The shared fetch never runs under the deadline of the request that
+    started it, so a client sending a short timeout header cannot fail it
+    for the requests coalesced onto it; each request only waits for it up
+    to its own remaining budget. With the I/O executor enabled the fetch
+    runs on the pool and keeps going after its waiters give up, filling the
+    cache for later requests. Otherwise the first request runs it inline
+    under the configured request budget.
+
+    Raises:
+        SingleFlightTimeout: If the caller has no time left, or an inline
+            fetch outlasts its wait.
+        IOExecutorSaturated: If the executor has no room for the fetch.
+        IOExecutorTimeout: If a pool fetch does not finish in time.
+    """
+    config = get_config()
+    try:
+        # A request with no time left does not start shared upstream work
+        stage_timeout("fetch", config.single_flight_timeout_seconds)
+    except DeadlineExceeded as e:
+        raise SingleFlightTimeout("Request deadline exceeded before fetching") from e
+    if not config.io_executor_enabled:
+        return _single_flight.do(
+            cache_key,
+            lambda: _fetch_shared(city, cache_key),
+            timeout=cap(config.single_flight_timeout_seconds),
+        )
+    executor = get_io_executor()
+    future = _single_flight.submit(
+        cache_key, lambda: executor.submit(_fetch_detached, city, cache_key)
+    )
+    return cast(
+        dict[str, Any],
+        executor.wait(future, timeout=cap(config.io_executor_timeout_seconds)),
+    )
+
+
+def _fetch_shared(city: str, cache_key: str) -> dict[str, Any]:
+    """Fetch and cache a key under the configured budget, not the caller's."""
+    with shared_deadline():
+        return _fetch_and_cache(city, cache_key)
+
+
+def _fetch_detached(city: str, cache_key: str) -> dict[str, Any]:
+    """Fetch and cache a key without the deadline of the request that asked."""
+    with request_deadline(None):
+        return _fetch_and_cache(city, cache_key)
+
+
+def _set_last_known_good(cache_key: str, response_data: dict[str, Any]) -> None:
+    """Store the long-lived fallback copy, off the request path when possible."""
+    cache = get_last_known_good_cache()
+    if get_config().io_executor_enabled:
+        with contextlib.suppress(IOExecutorSaturated, RuntimeError):
+            get_io_executor().submit(cache.set, cache_key, response_data)
+            return
+    with contextlib.suppress(Exception):
+        cache.set(cache_key, response_data)
+
+
+def _get_cell_weather(coords: Coordinates) -> tuple[dict[str, Any], int | None]:
+    """
+    Get current weather for the grid cell containing the coordinates.
+
+    Every city in a cell shares one upstream fetch. Alongside the data, the
+    remaining fresh TTL of a reused cell entry is returned so the city entry
+    built from it goes stale together with the cell.
+
+    Args:
+        coords: Coordinates of the city.
+
+    Returns:
+        Tuple of the ``current`` data and the soft TTL for the city entry,
+        or None for the default TTL.
+    """
+    grid_cache = get_grid_cache()
+    cell_key = grid_cell_key(
+        coords.latitude, coords.longitude, get_config().grid_cache_resolution_deg
+    )
+    entry = None
+    with contextlib.suppress(Exception):
+        entry = grid_cache.get_entry(cell_key)
+    if entry is not None and not entry.is_stale:
+        return entry.payload, max(1, entry.fresh_ttl)
+
+    weather = _get_current_weather(coords)
+    current = build_current_data(weather)
+    ttl = aligned_ttl(weather)
+    with contextlib.suppress(Exception):
+        grid_cache.set(cell_key, current, ttl=ttl)
+    return current, ttl
+
+
+def _fetch_from_upstream(city: str, cache_key: str) -> dict[str, Any]:
+    """Geocode the city, fetch its weather and cache the response data."""
+    cache_service = get_cache_service()
+    started = time.monotonic()
+
+    # Step 1: Geocode city to coordinates
+    aliases_enabled = get_config().location_aliases_enabled
+    geocoding_service = GeocodingService(
+        cache=get_geocoding_cache(),
+        aliases=get_location_aliases() if aliases_enabled else None,
+    )
+    try:
+        coords = geocoding_service.city_to_coords(city)
+    except CityNotFoundError:
+        _remember_not_found({cache_key: city})
+        raise
+
+    # Store under the canonical location so every alias shares the entry
+    if aliases_enabled and coords.location_id is not None:
+        cache_key = _location_cache_key(coords.location_id)
+
+    # Step 2: Fetch weather data, shared per grid cell when enabled, and
+    # keep it until Open-Meteo publishes the next value
+    if get_config().grid_cache_enabled:
+        current, ttl = _get_cell_weather(coords)
+    else:
+        weather = _get_current_weather(coords)
+        current = build_current_data(weather)
+        ttl = aligned_ttl(weather)
+
+    response_data = build_response_data(coords, current)
+
+    # Try to cache the result (errors don't break the request), keeping a
+    # long-lived copy to fall back on during upstream outages
+    with contextlib.suppress(Exception):
+        cache_service.set(
+            cache_key,
+            response_data,
+            ttl=ttl,
+            fetch_duration=time.monotonic() - started,
+        )
+    _set_last_known_good(cache_key, response_data)
+
+    return response_data
+
+
+def _should_refresh_early(entry: CacheEntry) -> bool:
+    """Apply the XFetch rule to a fresh entry, counting early refreshes."""
+    if not entry.should_refresh_early(get_config().xfetch_beta):
+        return False
+    record_early_refresh()
+    return True
+
+
+def _needs_refresh(cache_key: str) -> bool:
+    """
+    Check under the fetch lease whether a key still needs a refresh.
+
+    Reads Redis rather than the L1 cache, which may still hold the copy
+    another process has just replaced.
+    """
+    entry = None
+    with contextlib.suppress(Exception):
+        entry = get_cache_service().get_entry(cache_key, bypass_local=True)
+    return (
+        entry is None
+        or entry.is_stale
+        or entry.should_refresh_early(get_config().xfetch_beta)
+    )
+
+
+def _schedule_refresh(city: str, cache_key: str) -> None:
+    """Start a background refresh for a stale key unless one is running."""
+    with _refresh_lock:
+        if cache_key in _refreshing:
+            return
+        _refreshing.add(cache_key)
+
+    if not _run_in_background(_refresh_in_background, city, cache_key):
+        # No room; the stale copy is served until a later hit retries
+        with _refresh_lock:
+            _refreshing.discard(cache_key)
+
+
+def _run_in_background(fn: Callable[..., Any], *args: Any) -> bool:
+    """
+    Run a call off the request path, on the I/O executor when enabled.
+
+    Returns:
+        False if no pool accepted the call.
+    """
+    global _refresh_executor
+    if get_config().io_executor_enabled:
+        try:
+            get_io_executor().submit(fn, *args)
+        except (IOExecutorSaturated, RuntimeError):
+            return False
+        return True
+
+    with _refresh_lock:
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="weather-refresh"
+            )
+        executor = _refresh_executor
+
+    try:
+        executor.submit(fn, *args)
+    except RuntimeError:
+        # Executor is shutting down
+        return False
+    return True
+
+
+def _refresh_in_background(city: str, cache_key: str) -> None:
+    """Re-fetch a stale key from upstream, unless another pod is already on it."""
+    cache_service = get_cache_service()
+    try:
+        # The I/O executor copies the request context; refreshes have no deadline
+        with request_deadline(None):
+            lease_token = cache_service.acquire_lease(
+                cache_key, ttl=get_config().fetch_lease_ttl_seconds
+            )
+            if lease_token is None:
+                return
+            try:
+                if _needs_refresh(cache_key):
+                    _fetch_from_upstream(city, cache_key)
+            finally:
+                cache_service.release_lease(cache_key, lease_token)
+    except Exception as e:
+        # The stale copy keeps being served; the next stale hit retries
+        get_logger("weather").warning(
+            "background_refresh_failed", city=city, error=str(e)
+        )
+    finally:
+        with _refresh_lock:
+            _refreshing.discard(cache_key)
+
+
+def _observe_city(city: str) -> None:
+    """Count a served city in the heavy-hitter tracker."""
+    config = get_config()
+    if not (
+        config.heavy_hitters_enabled
+        or config.refresh_ahead_enabled
+        or config.heavy_hitters_l1_min_count > 0
+    ):
+        return
+    # Tracking must never fail a request
+    with contextlib.suppress(Exception):
+        tracker = get_heavy_hitters()
+        if tracker.record(city):
+            _run_in_background(tracker.flush)
+
+
+def _hot_cities() -> list[str]:
+    """Get configured cities plus the most requested ones across workers."""
+    config = get_config()
+    tracker = get_heavy_hitters()
+    top = tracker.global_top(config.refresh_ahead_top_n) or tracker.local_top(
+        config.refresh_ahead_top_n
+    )
+    observed = [city for city, _ in top]
 
+    cities: dict[str, str] = {}
+    for city in [*config.refresh_ahead_cities, *observed]:
+        cities.setdefault(query_key(city), city)
+    return list(cities.values())
+
+
+def _is_refresh_ahead_leader() -> bool:
+    """Claim the current refresh-ahead round for this process across pods."""
+    ttl = max(1, int(get_config().refresh_ahead_interval_seconds))
+    return get_cache_service().acquire_lease("refresh-ahead", ttl=ttl) is not None
+
+
+def _refresh_ahead(city: str) -> bool:
+    """
+    Re-fetch a hot city if its entry is missing or about to go stale.
+
+    Args:
+        city: City name to keep warm.
+
+    Returns:
+        True if the city was fetched from upstream.
+    """
+    config = get_config()
+    cache_service = get_cache_service()
+    cache_key = _weather_cache_key(city)
+
+    entry = None
+    with contextlib.suppress(Exception):
+        entry = cache_service.get_entry(cache_key)
+    if entry is not None and entry.fresh_ttl > config.refresh_ahead_margin_seconds:
+        return False
+
+    lease_token = cache_service.acquire_lease(
+        cache_key, ttl=config.fetch_lease_ttl_seconds
+    )
+    if lease_token is None:
+        return False
+    try:
+        # Another worker may have refreshed it since; its L1 copy is older
+        with contextlib.suppress(Exception):
+            entry = cache_service.get_entry(cache_key, bypass_local=True)
+        if entry is not None and entry.fresh_ttl > config.refresh_ahead_margin_seconds:
+            return False
+        _fetch_from_upstream(city, cache_key)
+    finally:
+        cache_service.release_lease(cache_key, lease_token)
+    return True
+
+
+def start_refresh_ahead() -> RefreshAheadScheduler:
+    """Start the refresh-ahead scheduler for this process."""
+    global _refresh_ahead_scheduler
+    if _refresh_ahead_scheduler is None:
+        config = get_config()
+        _refresh_ahead_scheduler = RefreshAheadScheduler(
+            refresh=_refresh_ahead,
+            hot_cities=_hot_cities,
+            interval_seconds=config.refresh_ahead_interval_seconds,
+            max_concurrency=config.refresh_ahead_concurrency,
+            rate_per_second=config.refresh_ahead_rate_per_second,
+            is_leader=_is_refresh_ahead_leader,
+        )
+    _refresh_ahead_scheduler.start()
+    return _refresh_ahead_scheduler
+
+
+def _cached_response(
+    entry: CacheEntry,
+    request_id: str,
+    cache_ttl: int,
+    stale: bool,
+    degraded: bool = False,
+) -> Response:
+    """Build a response from a cached entry without re-serializing it."""
+    body = cached_body(entry, request_id, cache_ttl, stale, degraded)
+    response = Response(body, mimetype="application/json")
+    response.headers["Age"] = str(entry.age)
     return response
 
 
+def _last_known_good_response(cache_key: str, request_id: str) -> Response | None:
+    """Build a degraded response from the last-known-good copy, if any."""
+    entry = None
+    with contextlib.suppress(Exception):
+        entry = get_last_known_good_cache().get_entry(cache_key)
+    if entry is None:
+        return None
+
+    record_degraded_response()
+    return _cached_response(entry, request_id, cache_ttl=0, stale=True, degraded=True)
+
+
 @weather_bp.route("/weather", methods=["GET"])
 def get_weather() -> tuple[Any, int]:
     """
@@ -114,83 +742,90 @@ def get_weather() -> tuple[Any, int]:
             }
         ), 400
 
+    if not query_key(city):
+        return jsonify(
+            {
+                "error": {
+                    "code": "INVALID_PARAMETER",
+                    "message": "City name must contain letters or digits",
+                    "request_id": request_id,
+                }
+            }
+        ), 400
+
+    cache_key = _weather_cache_key(city)
+
     try:
         # Try to get from cache first
         cache_service = get_cache_service()
-        cache_key = city.lower()
 
-        cached_data = None
+        entry = None
         with contextlib.suppress(Exception):
-            cached_data = cache_service.get(cache_key)
+            entry = cache_service.get_entry(cache_key)
 
-        if cached_data is not None:
-            # Cache hit - return cached data
-            cache_ttl = cache_service.get_ttl(cache_key)
-            return jsonify(
-                _build_weather_response(
-                    city=cached_data.get("city", city),
-                    country=cached_data.get("country"),
-                    latitude=cached_data["coordinates"]["latitude"],
-                    longitude=cached_data["coordinates"]["longitude"],
-                    weather_data=cached_data["current"],
-                    cached=True,
-                    cache_ttl=cache_ttl,
-                    request_id=request_id,
-                )
+        if entry is not None:
+            # Cache hit - return cached data, refreshing it in the background
+            # once it is past its soft expiry or probabilistically just before
+            stale = entry.is_stale
+            if stale or _should_refresh_early(entry):
+                _schedule_refresh(city, cache_key)
+            _observe_city(city)
+            return _cached_response(
+                entry, request_id, cache_ttl=entry.fresh_ttl, stale=stale
             ), 200
 
-        # Cache miss - fetch fresh data
-        # Step 1: Geocode city to coordinates
-        geocoding_service = GeocodingService()
-        coords = geocoding_service.city_to_coords(city)
-
-        # Step 2: Fetch weather data
-        weather_service = WeatherService()
-        weather = weather_service.get_weather(coords.latitude, coords.longitude)
-
-        # Build weather data dict
-        weather_data = {
-            "temperature": weather.temperature,
-            "temperature_unit": weather.temperature_unit,
-            "apparent_temperature": weather.apparent_temperature,
-            "humidity": weather.humidity,
-            "weather_code": weather.weather_code,
-            "weather_description": weather.weather_description,
-            "wind_speed": weather.wind_speed,
-            "wind_speed_unit": weather.wind_speed_unit,
-            "precipitation": weather.precipitation,
-            "is_day": weather.is_day,
-        }
+        # Queries recently found to match no city skip all upstream work; this
+        # only runs on a miss so a filter false positive can never hide a
+        # cached city
+        if _rejected_as_not_found({cache_key: city}):
+            raise CityNotFoundError(f"Could not find city: {city}")
 
-        # Build response data (for caching)
-        response_data = {
-            "city": coords.city_name,
-            "country": coords.country,
-            "coordinates": {
-                "latitude": coords.latitude,
-                "longitude": coords.longitude,
-            },
-            "current": weather_data,
-        }
-
-        # Try to cache the result (errors don't break the request)
-        with contextlib.suppress(Exception):
-            cache_service.set(cache_key, response_data)
+        # Cache miss - fetch fresh data, coalescing concurrent misses
+        response_data = _fetch_coalesced(city, cache_key)
+        _observe_city(city)
 
         # Return response
         return jsonify(
-            _build_weather_response(
-                city=coords.city_name,
-                country=coords.country,
-                latitude=coords.latitude,
-                longitude=coords.longitude,
-                weather_data=weather_data,
+            build_weather_response(
+                city=response_data["city"],
+                country=response_data["country"],
+                latitude=response_data["coordinates"]["latitude"],
+                longitude=response_data["coordinates"]["longitude"],
+                weather_data=response_data["current"],
                 cached=False,
                 cache_ttl=None,
                 request_id=request_id,
             )
         ), 200
 
+    except (SingleFlightTimeout, IOExecutorTimeout):
+        fallback = _last_known_good_response(cache_key, request_id)
+        if fallback is not None:
+            return fallback, 200
+        return jsonify(
+            {
+                "error": {
+                    "code": "SERVICE_UNAVAILABLE",
+                    "message": "Timed out waiting for weather data, please retry",
+                    "request_id": request_id,
+                }
+            }
+        ), 503
+
+    except IOExecutorSaturated:
+        fallback = _last_known_good_response(cache_key, request_id)
+        if fallback is not None:
+            return fallback, 200
+        return jsonify(
+            {
+                "error": {
+                    "code": "SERVICE_UNAVAILABLE",
+                    "message": "Too many upstream fetches in flight, please retry",
+                    "request_id": request_id,
+                }
+            }
+        ), 503
+
     except CityNotFoundError as e:
         return jsonify(
             {
@@ -203,6 +838,10 @@ def get_weather() -> tuple[Any, int]:
         ), 404
 
     except GeocodingError as e:
+        if is_upstream_unavailable(e):
+            fallback = _last_known_good_response(cache_key, request_id)
+            if fallback is not None:
+                return fallback, 200
         return jsonify(
             {
                 "error": {
@@ -214,6 +853,10 @@ def get_weather() -> tuple[Any, int]:
         ), 502
 
     except WeatherServiceError as e:
+        if is_upstream_unavailable(e):
+            fallback = _last_known_good_response(cache_key, request_id)
+            if fallback is not None:
+                return fallback, 200
         return jsonify(
             {
                 "error": {
@@ -236,7 +879,241 @@ def get_weather() -> tuple[Any, int]:
         ), 500
 
 
+@weather_bp.route("/weather/batch", methods=["POST"])
+def get_weather_batch() -> tuple[Any, int]:
+    """
+    Get weather data for several cities in one request.
+
+    Request Body:
+        JSON object with a ``cities`` list of city names.
+
+    Returns:
+        JSON response with one result per input city, in input order, each
+        carrying its own status (ok, not_found, invalid or error).
+
+    Response Codes:
+        200: Success - per-city results returned
+        400: Bad Request - missing, malformed or oversized cities list
+    """
+    request_id = get_request_id()
+
+    body = request.get_json(silent=True)
+    cities = body.get("cities") if isinstance(body, dict) else None
+
+    if not isinstance(cities, list) or not cities:
+        return jsonify(
+            {
+                "error": {
+                    "code": "MISSING_PARAMETER",
+                    "message": "Request body must contain a non-empty 'cities' list",
+                    "request_id": request_id,
+                }
+            }
+        ), 400
+
+    max_size = get_config().weather_batch_max_size
+    if len(cities) > max_size:
+        return jsonify(
+            {
+                "error": {
+                    "code": "INVALID_PARAMETER",
+                    "message": f"Too many cities (max {max_size})",
+                    "request_id": request_id,
+                }
+            }
+        ), 400
+
+    # Deduplicate valid names by cache key, remembering the first spelling
+    names: dict[str, str] = {}
+    for city in cities:
+        if _is_valid_batch_city(city):
+            names.setdefault(query_key(city), city.strip())
+
+    outcomes: dict[str, dict[str, Any]] = {}
+    for cache_key, entry in get_cache_service().get_many(list(names)).items():
+        stale = entry.is_stale
+        if stale or _should_refresh_early(entry):
+            _schedule_refresh(names[cache_key], cache_key)
+        outcomes[cache_key] = {
+            "status": "ok",
+            "cached": True,
+            "stale": stale,
+            "data": entry.payload,
+        }
+
+    misses = {key: city for key, city in names.items() if key not in outcomes}
+    for cache_key in _rejected_as_not_found(misses):
+        outcomes[cache_key] = {
+            "status": "not_found",
+            "error": {
+                "code": "CITY_NOT_FOUND",
+                "message": f"Could not find city: {misses.pop(cache_key)}",
+            },
+        }
+    if misses:
+        outcomes.update(_fetch_batch_from_upstream(misses))
+
+    results = []
+    for city in cities:
+        if not _is_valid_batch_city(city):
+            results.append(
+                {
+                    "query": city,
+                    "status": "invalid",
+                    "error": {
+                        "code": "INVALID_PARAMETER",
+                        "message": "City must be a non-empty string (max 100 characters)",
+                    },
+                }
+            )
+        else:
+            results.append({"query": city, **outcomes[query_key(city)]})
+
+    return jsonify({"results": results, "request_id": request_id}), 200
+
+
+def _is_valid_batch_city(city: Any) -> bool:
+    """Check whether a batch entry is a usable city name."""
+    return isinstance(city, str) and len(city) <= 100 and bool(query_key(city))
+
+
+def _fetch_batch_from_upstream(misses: dict[str, str]) -> dict[str, dict[str, Any]]:
+    """
+    Resolve cache misses of a batch with a single forecast request.
+
+    Only names without cached coordinates are geocoded; all located cities
+    are then fetched from Open-Meteo together.
+
+    Args:
+        misses: Mapping of cache key to city name.
+
+    Returns:
+        Mapping of cache key to its per-city batch result.
+    """
+    outcomes: dict[str, dict[str, Any]] = {}
+    unavailable: dict[str, dict[str, Any]] = {}
+    located: dict[str, Coordinates] = {}
+    not_found: dict[str, str] = {}
+
+    started = time.monotonic()
+    geocoding_service = GeocodingService(cache=get_geocoding_cache())
+    geocoded = geocoding_service.cities_to_coords(list(misses.values()))
+
+    for cache_key, city in misses.items():
+        result = geocoded[city]
+        if isinstance(result, CityNotFoundError):
+            not_found[cache_key] = city
+            outcomes[cache_key] = {
+                "status": "not_found",
+                "error": {"code": "CITY_NOT_FOUND", "message": str(result)},
+            }
+        elif isinstance(result, GeocodingError):
+            outcomes[cache_key] = {
+                "status": "error",
+                "error": {
+                    "code": "GEOCODING_ERROR",
+                    "message": f"Failed to geocode city: {result}",
+                },
+            }
+            if is_upstream_unavailable(result):
+                unavailable[cache_key] = outcomes[cache_key]
+        else:
+            located[cache_key] = result
+
+    _remember_not_found(not_found)
+
+    if located:
+        try:
+            weather = WeatherService().get_weather_many(
+                [(coords.latitude, coords.longitude) for coords in located.values()]
+            )
+        except WeatherServiceError as e:
+            for cache_key in located:
+                outcomes[cache_key] = {
+                    "status": "error",
+                    "error": {
+                        "code": "WEATHER_SERVICE_ERROR",
+                        "message": f"Failed to fetch weather data: {e}",
+                    },
+                }
+                if is_upstream_unavailable(e):
+                    unavailable[cache_key] = outcomes[cache_key]
+        else:
+            fresh = {
+                cache_key: build_response_data(coords, build_current_data(current))
+                for (cache_key, coords), current in zip(
+                    located.items(), weather, strict=True
+                )
+            }
+            # One request, one upstream update time; keep the earliest anyway
+            ttls = [ttl for ttl in map(aligned_ttl, weather) if ttl is not None]
+            with contextlib.suppress(Exception):
+                get_cache_service().set_many(
+                    fresh,
+                    ttl=min(ttls, default=None),
+                    fetch_duration=time.monotonic() - started,
+                )
+            with contextlib.suppress(Exception):
+                get_last_known_good_cache().set_many(fresh)
+            for cache_key, data in fresh.items():
+                outcomes[cache_key] = {
+                    "status": "ok",
+                    "cached": False,
+                    "stale": False,
+                    "data": data,
+                }
+
+    # Fall back to last-known-good copies for cities hit by an outage
+    if unavailable:
+        last_known_good = {}
+        with contextlib.suppress(Exception):
+            last_known_good = get_last_known_good_cache().get_many(list(unavailable))
+        for cache_key, entry in last_known_good.items():
+            record_degraded_response()
+            outcomes[cache_key] = {
+                "status": "ok",
+                "cached": True,
+                "stale": True,
+                "degraded": True,
+                "data": entry.payload,
+            }
+
+    return outcomes
+
+
 def reset_cache_service() -> None:
-    """Reset cache service (useful for testing)."""
-    global _cache_service
+    """Reset cache services and background refreshes (useful for testing)."""
+    global _cache_service, _geocoding_cache, _last_known_good_cache, _grid_cache
+    global _negative_cache, _not_found_filter, _location_aliases
+    global _refresh_executor, _weather_batcher, _refresh_ahead_scheduler
+    global _heavy_hitters
+    if _refresh_ahead_scheduler is not None:
+        _refresh_ahead_scheduler.stop()
+        _refresh_ahead_scheduler = None
+    with _refresh_lock:
+        executor = _refresh_executor
+        _refresh_executor = None
+    if executor is not None:
+        executor.shutdown(wait=True)
+    shutdown_io_executor()
+    for service in (
+        _cache_service,
+        _geocoding_cache,
+        _last_known_good_cache,
+        _grid_cache,
+        _negative_cache,
+        _not_found_filter,
+        _location_aliases,
+        _heavy_hitters,
+    ):
+        if service is not None:
+            service.close()
     _cache_service = None
+    _geocoding_cache = None
+    _last_known_good_cache = None
+    _grid_cache = None
+    _negative_cache = None
+    _not_found_filter = None
+    _location_aliases = None
+    _heavy_hitters = None
+    _weather_batcher = None
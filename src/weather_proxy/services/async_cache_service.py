@@ -0,0 +1,210 @@
+"""Asyncio cache service using redis.asyncio for the ASGI app."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+import uuid
+from typing import TYPE_CHECKING, Any, cast
+
+import redis
+import redis.asyncio
+
+from weather_proxy.resilience import deadline
+from weather_proxy.services.cache_service import (
+    _RELEASE_LEASE_SCRIPT,
+    CacheEntry,
+    CacheServiceBase,
+)
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+
+class AsyncCacheService(CacheServiceBase):
+    """
+    Asyncio counterpart of CacheService.
+
+    Uses the same key layout and entry envelope, so the sync and async
+    apps share entries in Redis. Redis calls are awaited instead of
+    blocking a thread.
+    """
+
+    _client: Redis[str] | None = None
+
+    @property
+    def client(self) -> Redis[str]:
+        """Get or create the asyncio Redis client."""
+        if self._client is None:
+            self._client = redis.asyncio.from_url(
+                self.redis_url,
+                decode_responses=True,
+            )
+        return self._client
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Get a value from the cache.
+
+        Args:
+            key: Cache key to retrieve (typically city name).
+
+        Returns:
+            Cached value as dict or None if not found or expired.
+        """
+        entry = await self.get_entry(key)
+        return entry.payload if entry is not None else None
+
+    async def get_entry(
+        self, key: str, bypass_local: bool = False
+    ) -> CacheEntry | None:
+        """
+        Get a cached payload together with its envelope metadata.
+
+        Args:
+            key: Cache key to retrieve (typically city name).
+            bypass_local: Read Redis even if the L1 cache holds the key.
+
+        Returns:
+            Cache entry or None if not found, expired or unreadable.
+        """
+        cache_key = self._make_key(key)
+        local = None if bypass_local else self.local_cache.get(cache_key)
+        if local is not None:
+            return cast(CacheEntry, local)
+
+        try:
+            data = await self.client.get(cache_key)
+            if data is None:
+                return None
+            entry = CacheEntry.decode(data)
+            self._store_local(cache_key, entry)
+            return entry
+        except redis.RedisError:
+            return None
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            return None
+
+    async def set(
+        self,
+        key: str,
+        value: dict[str, Any],
+        ttl: int | None = None,
+        fetch_duration: float = 0.0,
+    ) -> bool:
+        """
+        Set a value in the cache.
+
+        Args:
+            key: Cache key (typically city name).
+            value: Value to cache (must be JSON-serializable).
+            ttl: Optional soft TTL override in seconds.
+            fetch_duration: Seconds it took to fetch the value.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        try:
+            cache_key = self._make_key(key)
+            entry = self._build_entry(value, ttl, fetch_duration)
+            await self.client.set(cache_key, entry.encode(), ex=self._hard_ttl(entry))
+            self._store_local(cache_key, entry)
+            return True
+        except redis.RedisError:
+            return False
+        except (TypeError, ValueError):
+            return False
+
+    async def acquire_lease(self, key: str, ttl: int) -> str | None:
+        """
+        Try to become the single process allowed to refresh a key.
+
+        Args:
+            key: Cache key the lease protects.
+            ttl: Lease lifetime in seconds.
+
+        Returns:
+            Lease token if acquired, None if another process holds it.
+            On Redis errors a token is returned so the caller fetches itself.
+        """
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self.client.set(
+                self._make_lease_key(key), token, nx=True, ex=ttl
+            )
+        except redis.RedisError:
+            return token
+        return token if acquired else None
+
+    async def release_lease(self, key: str, token: str) -> bool:
+        """
+        Release a fetch lease if it is still held by this token.
+
+        Args:
+            key: Cache key the lease protects.
+            token: Token returned by acquire_lease.
+
+        Returns:
+            True if the lease was released, False otherwise.
+        """
+        try:
+            released = await self.client.eval(  # type: ignore[no-untyped-call]
+                _RELEASE_LEASE_SCRIPT, 1, self._make_lease_key(key), token
+            )
+            return bool(released)
+        except redis.RedisError:
+            return False
+
+    async def wait_for(
+        self, key: str, timeout: float, poll_interval: float
+    ) -> dict[str, Any] | None:
+        """
+        Wait for another process holding the lease to fill a key.
+
+        The wait also ends at the request deadline, if one is set.
+
+        Args:
+            key: Cache key to wait for.
+            timeout: Maximum time to wait in seconds.
+            poll_interval: Delay between polls in seconds.
+
+        Returns:
+            Cached value once available, or None if the lease holder went
+            away without writing it or the timeout elapsed.
+        """
+        wait_until = time.monotonic() + deadline.cap(timeout)
+        lease_key = self._make_lease_key(key)
+        while True:
+            try:
+                held = bool(await self.client.exists(lease_key))
+            except redis.RedisError:
+                return None
+            # Holders write the value before releasing, so read after checking
+            value = await self.get(key)
+            if value is not None or not held:
+                return value
+            if time.monotonic() + poll_interval > wait_until:
+                return None
+            await asyncio.sleep(poll_interval)
+
+    async def is_connected(self) -> bool:
+        """
+        Check if Redis connection is healthy.
+
+        Returns:
+            True if connected, False otherwise.
+        """
+        try:
+            await self.client.ping()
+            return True
+        except redis.RedisError:
+            return False
+
+    async def close(self) -> None:
+        """Close the Redis connection and drop L1 entries."""
+        self.local_cache.clear()
+        if self._client is not None:
+            # aclose() is new in redis 5.0.1; types-redis predates it
+            await self._client.aclose()  # type: ignore[attr-defined]
+            self._client = None
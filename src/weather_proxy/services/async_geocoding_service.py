@@ -0,0 +1,147 @@
+"""Asyncio geocoding service for the ASGI app."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any, cast
+
+import httpx
+import pybreaker
+
+from weather_proxy.resilience.circuit_breaker import (
+    CircuitBreakerOpen,
+    call_with_breaker,
+    get_geocoding_breaker,
+    with_retry,
+)
+from weather_proxy.resilience.deadline import DeadlineExceeded, stage_timeout
+from weather_proxy.resilience.hedging import hedged_acall
+from weather_proxy.services.async_http_client import get_async_http_client
+from weather_proxy.services.geocoding_service import (
+    CityNotFoundError,
+    Coordinates,
+    GeocodingError,
+    GeocodingServiceBase,
+)
+from weather_proxy.utils.normalize import normalize_query
+
+if TYPE_CHECKING:
+    from weather_proxy.services.async_cache_service import AsyncCacheService
+
+
+class AsyncGeocodingService(GeocodingServiceBase):
+    """
+    Asyncio counterpart of GeocodingService.
+
+    Shares the geocoding cache entries of the sync service; retries and
+    the geocoding circuit breaker behave the same way.
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        timeout: int | None = None,
+        cache: AsyncCacheService | None = None,
+    ) -> None:
+        """
+        Initialize geocoding service.
+
+        Args:
+            base_url: Open-Meteo geocoding API base URL. Defaults to config.
+            timeout: Request timeout in seconds. Defaults to config.
+            cache: Optional long-lived cache for resolved coordinates.
+        """
+        super().__init__(base_url, timeout)
+        self.cache = cache
+
+    async def city_to_coords(self, city_name: str) -> Coordinates:
+        """
+        Convert a city name to geographic coordinates.
+
+        Args:
+            city_name: Name of the city to look up.
+
+        Returns:
+            Coordinates object with latitude, longitude, and city info.
+
+        Raises:
+            CityNotFoundError: If the city cannot be found.
+            GeocodingError: If the API request fails.
+        """
+        query = normalize_query(city_name or "")
+        if not query.name:
+            raise CityNotFoundError("City name cannot be empty")
+
+        if self.cache is not None:
+            cached = await self.cache.get(query.key)
+            coords = self._from_cached(cached) if cached is not None else None
+            if coords is not None:
+                return coords
+
+        search_name = self._search_name(city_name.strip())
+        try:
+            data = await self._fetch_geocoding_data(search_name, query.country_code)
+        except CircuitBreakerOpen as e:
+            raise GeocodingError(
+                "Geocoding service temporarily unavailable (circuit breaker open)"
+            ) from e
+        except DeadlineExceeded as e:
+            raise GeocodingError("Geocoding skipped, request deadline exceeded") from e
+
+        coords = self._parse_result(data, search_name)
+        if self.cache is not None:
+            await self.cache.set(query.key, asdict(coords))
+        return coords
+
+    @with_retry()
+    async def _fetch_geocoding_data(
+        self, city_name: str, country_code: str | None = None
+    ) -> dict[str, Any]:
+        """
+        Fetch geocoding data from API with retry logic.
+
+        Raises:
+            GeocodingError: If the API request fails after retries.
+            DeadlineExceeded: If the request deadline has passed.
+        """
+        breaker = get_geocoding_breaker()
+        timeout = stage_timeout("geocoding", self.timeout)
+
+        try:
+            return cast(
+                dict[str, Any],
+                await call_with_breaker(
+                    breaker,
+                    hedged_acall,
+                    "geocoding",
+                    self._make_request,
+                    city_name,
+                    country_code,
+                    timeout,
+                ),
+            )
+        except pybreaker.CircuitBreakerError as e:
+            raise CircuitBreakerOpen("Geocoding service circuit breaker is open") from e
+        except httpx.TimeoutException as e:
+            raise GeocodingError(f"Geocoding request timed out: {e}") from e
+        except httpx.HTTPStatusError as e:
+            raise GeocodingError(
+                f"Geocoding API error: {e.response.status_code}"
+            ) from e
+        except httpx.RequestError as e:
+            raise GeocodingError(f"Geocoding request failed: {e}") from e
+
+    async def _make_request(
+        self,
+        city_name: str,
+        country_code: str | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """Make the actual HTTP request."""
+        response = await get_async_http_client().get(
+            f"{self.base_url}/v1/search",
+            params=self._request_params(city_name, country_code),
+            timeout=timeout if timeout is not None else self.timeout,
+        )
+        response.raise_for_status()
+        return cast(dict[str, Any], response.json())
@@ -0,0 +1,44 @@
+"""Pooled asyncio HTTP client for upstream API calls from the ASGI app."""
+
+import httpx
+
+from weather_proxy.config import get_config
+from weather_proxy.services.http_client import _http2_available
+
+# Shared client, created lazily inside the serving event loop
+_async_http_client: httpx.AsyncClient | None = None
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Get or create the shared asyncio HTTP client.
+
+    One client multiplexes every in-flight upstream call of the process,
+    so thousands of concurrent requests share one bounded connection pool
+    instead of each holding a thread. It must only be used from the event
+    loop that created it.
+
+    Returns:
+        Pooled httpx async client.
+    """
+    global _async_http_client
+    if _async_http_client is None:
+        config = get_config()
+        _async_http_client = httpx.AsyncClient(
+            http2=config.http2_enabled and _http2_available(),
+            limits=httpx.Limits(
+                max_connections=config.http_max_connections,
+                max_keepalive_connections=config.http_max_keepalive_connections,
+                keepalive_expiry=config.http_keepalive_expiry_seconds,
+            ),
+        )
+    return _async_http_client
+
+
+async def close_async_http_client() -> None:
+    """Close the shared asyncio HTTP client and its pooled connections."""
+    global _async_http_client
+    client = _async_http_client
+    _async_http_client = None
+    if client is not None:
+        await client.aclose()
@@ -0,0 +1,164 @@
+"""Asyncio weather service for the ASGI app."""
+
+from typing import Any
+
+import httpx
+import pybreaker
+
+from weather_proxy.resilience.circuit_breaker import (
+    CircuitBreakerOpen,
+    call_with_breaker,
+    get_weather_breaker,
+    with_retry,
+)
+from weather_proxy.resilience.deadline import DeadlineExceeded, stage_timeout
+from weather_proxy.resilience.hedging import hedged_acall
+from weather_proxy.services.async_http_client import get_async_http_client
+from weather_proxy.services.weather_service import (
+    WeatherData,
+    WeatherServiceBase,
+    WeatherServiceError,
+)
+
+
+class AsyncWeatherService(WeatherServiceBase):
+    """
+    Asyncio counterpart of WeatherService.
+
+    Requests go through the shared httpx.AsyncClient, so a slow Open-Meteo
+    response holds a coroutine rather than a worker thread. Retries and
+    the weather circuit breaker behave as in the sync service.
+    """
+
+    async def get_weather(self, latitude: float, longitude: float) -> WeatherData:
+        """
+        Get current weather for coordinates.
+
+        Args:
+            latitude: Latitude of the location.
+            longitude: Longitude of the location.
+
+        Returns:
+            Current weather data, with ``expires_at`` set to when Open-Meteo
+            publishes the next value.
+
+        Raises:
+            WeatherServiceError: If the API request fails.
+        """
+        try:
+            data = await self._fetch_weather_data(latitude, longitude)
+        except CircuitBreakerOpen as e:
+            raise WeatherServiceError(
+                "Weather service temporarily unavailable (circuit breaker open)"
+            ) from e
+        except DeadlineExceeded as e:
+            raise WeatherServiceError(
+                "Weather request skipped, request deadline exceeded"
+            ) from e
+
+        return self._parse_weather(data)
+
+    async def get_weather_many(
+        self, locations: list[tuple[float, float]]
+    ) -> list[WeatherData]:
+        """
+        Get current weather for several coordinates in one upstream request.
+
+        Args:
+            locations: (latitude, longitude) pairs.
+
+        Returns:
+            Current weather data for each location, in input order.
+
+        Raises:
+            WeatherServiceError: If the API request fails.
+        """
+        if not locations:
+            return []
+
+        latitudes = ",".join(str(latitude) for latitude, _ in locations)
+        longitudes = ",".join(str(longitude) for _, longitude in locations)
+
+        try:
+            data = await self._fetch_weather_data(latitudes, longitudes)
+        except CircuitBreakerOpen as e:
+            raise WeatherServiceError(
+                "Weather service temporarily unavailable (circuit breaker open)"
+            ) from e
+        except DeadlineExceeded as e:
+            raise WeatherServiceError(
+                "Weather request skipped, request deadline exceeded"
+            ) from e
+
+        return self._parse_many(data, len(locations))
+
+    @with_retry()
+    async def _fetch_weather_data(
+        self, latitude: float | str, longitude: float | str
+    ) -> Any:
+        """
+        Fetch weather data from API with retry logic.
+
+        Raises:
+            WeatherServiceError: If the API request fails after retries.
+            DeadlineExceeded: If the request deadline has passed.
+        """
+        breaker = get_weather_breaker()
+        timeout = stage_timeout("weather", self.timeout)
+
+        try:
+            return await call_with_breaker(
+                breaker,
+                hedged_acall,
+                "weather",
+                self._make_request,
+                latitude,
+                longitude,
+                timeout,
+            )
+        except pybreaker.CircuitBreakerError as e:
+            raise CircuitBreakerOpen("Weather service circuit breaker is open") from e
+        except httpx.TimeoutException as e:
+            raise WeatherServiceError(f"Weather request timed out: {e}") from e
+        except httpx.HTTPStatusError as e:
+            raise WeatherServiceError(
+                f"Weather API error: {e.response.status_code}"
+            ) from e
+        except httpx.RequestError as e:
+            raise WeatherServiceError(f"Weather request failed: {e}") from e
+
+    async def _make_request(
+        self,
+        latitude: float | str,
+        longitude: float | str,
+        timeout: float | None = None,
+    ) -> Any:
+        """Make the actual HTTP request."""
+        response = await get_async_http_client().get(
+            f"{self.base_url}/v1/forecast",
+            params=self._request_params(latitude, longitude),
+            timeout=timeout if timeout is not None else self.timeout,
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def is_available(self) -> bool:
+        """
+        Check if Open-Meteo API is available.
+
+        Returns:
+            True if API is reachable, False otherwise.
+        """
+        try:
+            response = await get_async_http_client().get(
+                f"{self.base_url}/v1/forecast",
+                params={
+                    "latitude": 0,
+                    "longitude": 0,
+                    "current": "temperature_2m",
+                },
+                timeout=5,
+            )
+            return response.status_code == 200
+        except httpx.RequestError:
+            return False
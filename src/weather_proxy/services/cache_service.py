@@ -3,11 +3,20 @@
 from __future__ import annotations
 
 import json
+import math
+import random
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, cast
 
 import redis
 
 from weather_proxy.config import get_config
+from weather_proxy.resilience import deadline
+from weather_proxy.services.local_cache import LocalCache
 
 if TYPE_CHECKING:
     from redis import Redis
@@ -19,17 +28,158 @@ class CacheServiceError(Exception):
     pass
 
 
-class CacheService:
+# Deletes a lease only if it is still held by the caller's token
+_RELEASE_LEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+# Bump when the stored envelope layout changes; older entries read as misses
+CACHE_SCHEMA_VERSION = 2
+
+
+@dataclass(frozen=True)
+class CacheEntry:
     """
-    Cache service for storing and retrieving weather data using Redis.
+    A cached payload wrapped in a metadata envelope.
+
+    The payload is kept as its serialized JSON ``body`` so hot paths can
+    hand it out without a decode/re-encode cycle; ``payload`` decodes it
+    lazily. Timestamps are Unix epoch seconds so every pod reads the same
+    expiry from a single GET, without a separate TTL round trip.
+    ``fetch_duration`` records how long the payload took to compute, which
+    drives probabilistic early refresh.
+    """
+
+    body: str
+    fetched_at: float
+    soft_expires_at: float
+    expires_at: float
+    fetch_duration: float = 0.0
+
+    @classmethod
+    def from_payload(
+        cls,
+        payload: dict[str, Any],
+        fetched_at: float,
+        soft_expires_at: float,
+        expires_at: float,
+        fetch_duration: float = 0.0,
+    ) -> CacheEntry:
+        """Create an entry by serializing a payload dict."""
+        return cls(
+            body=json.dumps(payload, separators=(",", ":")),
+            fetched_at=fetched_at,
+            soft_expires_at=soft_expires_at,
+            expires_at=expires_at,
+            fetch_duration=fetch_duration,
+        )
+
+    @cached_property
+    def payload(self) -> dict[str, Any]:
+        """The cached payload, decoded on first access."""
+        return cast(dict[str, Any], json.loads(self.body))
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the entry is past its soft expiry but not yet evicted."""
+        return time.time() >= self.soft_expires_at
+
+    @property
+    def fresh_ttl(self) -> int:
+        """Seconds until the entry becomes stale (0 if already stale)."""
+        return max(0, int(self.soft_expires_at - time.time()))
+
+    @property
+    def ttl(self) -> int:
+        """Seconds until the entry is evicted from Redis."""
+        return max(0, int(self.expires_at - time.time()))
+
+    @property
+    def age(self) -> int:
+        """Seconds since the payload was fetched from upstream."""
+        return max(0, int(time.time() - self.fetched_at))
+
+    def should_refresh_early(self, beta: float) -> bool:
+        """
+        Decide whether a reader should refresh a still-fresh entry (XFetch).
+
+        The chance grows as the soft expiry approaches and with how long
+        the payload took to fetch, so entries written in the same burst are
+        refreshed at spread-out moments instead of all going stale at once.
+
+        Args:
+            beta: Eagerness factor; above 1 refreshes earlier, 0 disables.
+
+        Returns:
+            True if this reader should start a refresh now.
+        """
+        if beta <= 0 or self.fetch_duration <= 0:
+            return False
+        # 1 - random() is in (0, 1], so the log is finite and non-positive
+        gap = -self.fetch_duration * beta * math.log(1.0 - random.random())
+        return time.time() + gap >= self.soft_expires_at
+
+    def encode(self) -> str:
+        """Serialize the entry as a JSON header line followed by the body."""
+        header = json.dumps(
+            {
+                "v": CACHE_SCHEMA_VERSION,
+                "fetched_at": self.fetched_at,
+                "soft_expires_at": self.soft_expires_at,
+                "expires_at": self.expires_at,
+                "fetch_duration": self.fetch_duration,
+            }
+        )
+        return f"{header}\n{self.body}"
+
+    @classmethod
+    def decode(cls, data: str) -> CacheEntry:
+        """
+        Deserialize an entry, parsing only the small header.
+
+        Raises:
+            ValueError: If the data is not a current-version envelope.
+        """
+        header_line, sep, body = data.partition("\n")
+        header = json.loads(header_line)
+        if (
+            not sep
+            or not isinstance(header, dict)
+            or header.get("v") != CACHE_SCHEMA_VERSION
+        ):
+            raise ValueError("Unsupported cache entry schema")
+        return cls(
+            body=body,
+            fetched_at=float(header["fetched_at"]),
+            soft_expires_at=float(header["soft_expires_at"]),
+            expires_at=float(header["expires_at"]),
+            fetch_duration=float(header.get("fetch_duration", 0.0)),
+        )
+
+
+class CacheServiceBase:
+    """
+    Settings, key layout and entry building shared by the cache services.
 
-    Provides a simple key-value cache with TTL support.
+    Each entry carries a soft expiry. Redis keeps it for an extra stale
+    window past that point so callers can serve it while refreshing.
+    Entries read from Redis are copied into an in-process L1 tier; L1
+    entries never outlive the Redis entry they were copied from.
     """
 
     def __init__(
         self,
         redis_url: str | None = None,
         ttl_seconds: int | None = None,
+        local_cache: LocalCache | None = None,
+        key_prefix: str = "weather",
+        stale_ttl_seconds: int | None = None,
+        ttl_jitter: float | None = None,
+        admission: Callable[[str], bool] | None = None,
     ) -> None:
         """
         Initialize cache service.
@@ -37,11 +187,82 @@ class CacheService:
         Args:
             redis_url: Redis connection URL. Defaults to config.
             ttl_seconds: Default TTL for cached items in seconds. Defaults to config.
+            local_cache: Optional L1 cache instance. Defaults to one built from config.
+            key_prefix: Namespace prepended to every key.
+            stale_ttl_seconds: How long entries are kept past their soft
+                expiry for stale serving. Defaults to config.
+            ttl_jitter: Fraction by which each entry's soft TTL is randomly
+                shortened, so entries written together do not expire
+                together. Defaults to config.
+            admission: Optional predicate on a key (without prefix) deciding
+                whether its entries may be copied into the L1 tier.
         """
         config = get_config()
         self.redis_url = redis_url or config.redis_url
         self.ttl_seconds = ttl_seconds or config.cache_ttl_seconds
-        self._client: Redis[str] | None = None
+        self.stale_ttl_seconds = (
+            stale_ttl_seconds
+            if stale_ttl_seconds is not None
+            else config.cache_stale_ttl_seconds
+        )
+        self.ttl_jitter = (
+            ttl_jitter if ttl_jitter is not None else config.cache_ttl_jitter
+        )
+        self.key_prefix = key_prefix
+        if local_cache is None:
+            local_cache = LocalCache(
+                max_size=config.local_cache_max_size,
+                ttl_seconds=config.local_cache_ttl_seconds,
+                name=key_prefix,
+            )
+        self.local_cache = local_cache
+        self.admission = admission
+
+    def _make_key(self, key: str) -> str:
+        """Generate a namespaced cache key."""
+        return f"{self.key_prefix}:{key.lower().strip()}"
+
+    def _build_entry(
+        self, value: dict[str, Any], ttl: int | None, fetch_duration: float = 0.0
+    ) -> CacheEntry:
+        """Wrap a value in an envelope with jittered expiries from now."""
+        ttl_to_use: float = ttl if ttl is not None else self.ttl_seconds
+        ttl_to_use *= 1 - random.uniform(0, self.ttl_jitter)
+        now = time.time()
+        return CacheEntry.from_payload(
+            payload=value,
+            fetched_at=now,
+            soft_expires_at=now + ttl_to_use,
+            expires_at=now + ttl_to_use + self.stale_ttl_seconds,
+            fetch_duration=fetch_duration,
+        )
+
+    def _hard_ttl(self, entry: CacheEntry) -> int:
+        """Redis TTL in whole seconds for a freshly built entry."""
+        return max(1, round(entry.expires_at - entry.fetched_at))
+
+    def _store_local(self, cache_key: str, entry: CacheEntry) -> None:
+        """Copy an admitted entry into the L1 tier, bounded by its Redis expiry."""
+        if self.admission is not None and not self.admission(
+            cache_key.removeprefix(f"{self.key_prefix}:")
+        ):
+            return
+        self.local_cache.set(cache_key, entry, ttl=entry.expires_at - time.time())
+
+    def _make_lease_key(self, key: str) -> str:
+        """Generate the key holding the fetch lease for a cache key."""
+        return f"lease:{self._make_key(key)}"
+
+
+class CacheService(CacheServiceBase):
+    """
+    Cache service for storing and retrieving weather data using Redis.
+
+    Provides a simple key-value cache with TTL support. Reads are served
+    from an in-process L1 tier when possible.
+    """
+
+    _client: Redis[str] | None = None
 
     @property
     def client(self) -> Redis[str]:
@@ -53,10 +274,6 @@ class CacheService:
             )
         return self._client
 
-    def _make_key(self, key: str) -> str:
-        """Generate a namespaced cache key."""
-        return f"weather:{key.lower().strip()}"
-
     def get(self, key: str) -> dict[str, Any] | None:
         """
         Get a value from the cache.
@@ -65,19 +282,43 @@ class CacheService:
             key: Cache key to retrieve (typically city name).
 
         Returns:
-            Cached value as dict or None if not found or expired.
+            Cached value as dict or None if not found or expired. Stale
+            values are returned as well; use get_entry to tell them apart.
         """
+        entry = self.get_entry(key)
+        return entry.payload if entry is not None else None
+
+    def get_entry(self, key: str, bypass_local: bool = False) -> CacheEntry | None:
+        """
+        Get a cached payload together with its envelope metadata.
+
+        Costs at most one Redis GET; expiry and age come from the envelope.
+
+        Args:
+            key: Cache key to retrieve (typically city name).
+            bypass_local: Read Redis even if the L1 cache holds the key, to
+                see writes made by other processes since.
+
+        Returns:
+            Cache entry or None if not found, expired or unreadable.
+        """
+        cache_key = self._make_key(key)
+        local = None if bypass_local else self.local_cache.get(cache_key)
+        if local is not None:
+            return cast(CacheEntry, local)
+
         try:
-            cache_key = self._make_key(key)
             data = self.client.get(cache_key)
             if data is None:
                 return None
-            return cast(dict[str, Any], json.loads(data))
+            entry = CacheEntry.decode(data)
+            self._store_local(cache_key, entry)
+            return entry
         except redis.RedisError:
             # On Redis errors, return None to allow fresh fetch
             return None
-        except json.JSONDecodeError:
-            # On corrupted data, return None
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            # On corrupted or foreign data, return None
             return None
 
     def set(
@@ -85,30 +326,115 @@ class CacheService:
         key: str,
         value: dict[str, Any],
         ttl: int | None = None,
+        fetch_duration: float = 0.0,
     ) -> bool:
         """
         Set a value in the cache.
 
+        The value becomes stale after ``ttl`` seconds, less a random jitter,
+        and is evicted from Redis after that plus the stale window.
+
         Args:
             key: Cache key (typically city name).
             value: Value to cache (must be JSON-serializable).
-            ttl: Optional TTL override in seconds.
+            ttl: Optional soft TTL override in seconds.
+            fetch_duration: Seconds it took to fetch the value, used for
+                probabilistic early refresh.
 
         Returns:
             True if successful, False otherwise.
         """
         try:
             cache_key = self._make_key(key)
-            ttl_to_use = ttl if ttl is not None else self.ttl_seconds
-            data = json.dumps(value)
-            self.client.setex(cache_key, ttl_to_use, data)
+            entry = self._build_entry(value, ttl, fetch_duration)
+            self.client.setex(cache_key, self._hard_ttl(entry), entry.encode())
+            self._store_local(cache_key, entry)
+            return True
+        except redis.RedisError:
+            return False
+        except (TypeError, ValueError):
+            # JSON serialization error
+            return False
+
+    def get_many(self, keys: list[str]) -> dict[str, CacheEntry]:
+        """
+        Get several entries, reading all L1 misses with a single MGET.
+
+        Args:
+            keys: Cache keys to retrieve.
+
+        Returns:
+            Mapping of each found key to its entry. Missing, expired and
+            unreadable keys are left out.
+        """
+        found: dict[str, CacheEntry] = {}
+        missing: list[tuple[str, str]] = []
+        for key in keys:
+            cache_key = self._make_key(key)
+            local = self.local_cache.get(cache_key)
+            if local is not None:
+                found[key] = cast(CacheEntry, local)
+            else:
+                missing.append((key, cache_key))
+
+        if not missing:
+            return found
+
+        try:
+            values = self.client.mget([cache_key for _, cache_key in missing])
+        except redis.RedisError:
+            return found
+
+        for (key, cache_key), data in zip(missing, values, strict=True):
+            if data is None:
+                continue
+            try:
+                entry = CacheEntry.decode(data)
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                continue
+            self._store_local(cache_key, entry)
+            found[key] = entry
+        return found
+
+    def set_many(
+        self,
+        values: dict[str, dict[str, Any]],
+        ttl: int | None = None,
+        fetch_duration: float = 0.0,
+    ) -> bool:
+        """
+        Set several values in one pipelined round trip.
+
+        Args:
+            values: Mapping of cache key to value.
+            ttl: Optional soft TTL override in seconds.
+            fetch_duration: Seconds it took to fetch the values.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        if not values:
             return True
+
+        try:
+            entries = {
+                self._make_key(key): self._build_entry(value, ttl, fetch_duration)
+                for key, value in values.items()
+            }
+            pipe = self.client.pipeline(transaction=False)
+            for cache_key, entry in entries.items():
+                pipe.setex(cache_key, self._hard_ttl(entry), entry.encode())
+            pipe.execute()
         except redis.RedisError:
             return False
         except (TypeError, ValueError):
             # JSON serialization error
             return False
 
+        for cache_key, entry in entries.items():
+            self._store_local(cache_key, entry)
+        return True
+
     def delete(self, key: str) -> bool:
         """
         Delete a value from the cache.
@@ -121,6 +447,7 @@ class CacheService:
         """
         try:
             cache_key = self._make_key(key)
+            self.local_cache.delete(cache_key)
             self.client.delete(cache_key)
             return True
         except redis.RedisError:
@@ -136,16 +463,99 @@ class CacheService:
         Returns:
             Remaining TTL in seconds, or None if key doesn't exist.
         """
+        cache_key = self._make_key(key)
+        local = self.local_cache.peek(cache_key)
+        if local is not None:
+            return cast(CacheEntry, local).ttl
+
         try:
-            cache_key = self._make_key(key)
-            ttl = self.client.ttl(cache_key)
-            # Redis returns -2 if key doesn't exist, -1 if no TTL
-            if ttl < 0:
-                return None
-            return ttl
+            return self._redis_ttl(cache_key)
         except redis.RedisError:
             return None
 
+    def _redis_ttl(self, cache_key: str) -> int | None:
+        """Read the remaining Redis TTL for an already-namespaced key."""
+        ttl = self.client.ttl(cache_key)
+        # Redis returns -2 if key doesn't exist, -1 if no TTL
+        if ttl < 0:
+            return None
+        return ttl
+
+    def acquire_lease(self, key: str, ttl: int) -> str | None:
+        """
+        Try to become the single process allowed to refresh a key.
+
+        Uses an atomic SET NX EX so exactly one caller across all pods holds
+        the lease; it expires on its own if the holder dies.
+
+        Args:
+            key: Cache key the lease protects.
+            ttl: Lease lifetime in seconds.
+
+        Returns:
+            Lease token if acquired, None if another process holds it.
+            On Redis errors a token is returned so the caller fetches itself.
+        """
+        token = uuid.uuid4().hex
+        try:
+            acquired = self.client.set(
+                self._make_lease_key(key), token, nx=True, ex=ttl
+            )
+        except redis.RedisError:
+            return token
+        return token if acquired else None
+
+    def release_lease(self, key: str, token: str) -> bool:
+        """
+        Release a fetch lease if it is still held by this token.
+
+        Args:
+            key: Cache key the lease protects.
+            token: Token returned by acquire_lease.
+
+        Returns:
+            True if the lease was released, False otherwise.
+        """
+        try:
+            released = self.client.eval(  # type: ignore[no-untyped-call]
+                _RELEASE_LEASE_SCRIPT, 1, self._make_lease_key(key), token
+            )
+            return bool(released)
+        except redis.RedisError:
+            return False
+
+    def wait_for(
+        self, key: str, timeout: float, poll_interval: float
+    ) -> dict[str, Any] | None:
+        """
+        Wait for another process holding the lease to fill a key.
+
+        The wait also ends at the request deadline, if one is set.
+
+        Args:
+            key: Cache key to wait for.
+            timeout: Maximum time to wait in seconds.
+            poll_interval: Delay between polls in seconds.
+
+        Returns:
+            Cached value once available, or None if the lease holder went
+            away without writing it or the timeout elapsed.
+        """
+        wait_until = time.monotonic() + deadline.cap(timeout)
+        lease_key = self._make_lease_key(key)
+        while True:
+            try:
+                held = bool(self.client.exists(lease_key))
+            except redis.RedisError:
+                return None
+            # Holders write the value before releasing, so read after checking
+            value = self.get(key)
+            if value is not None or not held:
+                return value
+            if time.monotonic() + poll_interval > wait_until:
+                return None
+            time.sleep(poll_interval)
+
     def is_connected(self) -> bool:
         """
         Check if Redis connection is healthy.
@@ -160,7 +570,8 @@ class CacheService:
             return False
 
     def close(self) -> None:
-        """Close the Redis connection."""
+        """Close the Redis connection and drop L1 entries."""
+        self.local_cache.clear()
         if self._client is not None:
             self._client.close()
             self._client = None
@@ -1,6 +1,11 @@
 """Geocoding service for converting city names to coordinates."""
 
-from dataclasses import dataclass
+from __future__ import annotations
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, cast
 
 import httpx
 import pybreaker
@@ -11,6 +16,14 @@ from weather_proxy.resilience.circuit_breaker import (
     get_geocoding_breaker,
     with_retry,
 )
+from weather_proxy.resilience.deadline import DeadlineExceeded, stage_timeout
+from weather_proxy.resilience.hedging import hedged_call
+from weather_proxy.services.http_client import get_http_client
+from weather_proxy.utils.normalize import normalize_query
+
+if TYPE_CHECKING:
+    from weather_proxy.services.cache_service import CacheService
+    from weather_proxy.services.location_aliases import LocationAliases
 
 
 @dataclass
@@ -22,6 +35,7 @@ class Coordinates:
     city_name: str
     country: str | None = None
     country_code: str | None = None
+    location_id: int | None = None
 
 
 class GeocodingError(Exception):
@@ -36,18 +50,95 @@ class CityNotFoundError(GeocodingError):
     pass
 
 
-class GeocodingService:
+class GeocodingServiceBase:
+    """Request building and response parsing shared by the geocoding services."""
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        timeout: int | None = None,
+    ) -> None:
+        """
+        Initialize geocoding service.
+
+        Args:
+            base_url: Open-Meteo geocoding API base URL. Defaults to config.
+            timeout: Request timeout in seconds. Defaults to config.
+        """
+        config = get_config()
+        self.base_url = base_url or config.open_meteo_geocoding_url
+        self.timeout = timeout or config.request_timeout_seconds
+
+    def _request_params(
+        self, city_name: str, country_code: str | None = None
+    ) -> dict[str, str | int]:
+        """Build the search query parameters for a city."""
+        params: dict[str, str | int] = {
+            "name": city_name,
+            "count": 1,
+            "language": "en",
+            "format": "json",
+        }
+        if country_code is not None:
+            params["countryCode"] = country_code
+        return params
+
+    def _search_name(self, city_name: str) -> str:
+        """Get the name to search for, without a trailing country hint."""
+        # Search with the client's spelling; upstream folds case and accents
+        if normalize_query(city_name).country_code is not None:
+            return city_name.rpartition(",")[0].strip()
+        return city_name
+
+    def _parse_result(self, data: dict[str, Any], city_name: str) -> Coordinates:
+        """
+        Convert a search response into the coordinates of its best match.
+
+        Raises:
+            CityNotFoundError: If the search found nothing.
+        """
+        if "results" not in data or len(data["results"]) == 0:
+            raise CityNotFoundError(f"Could not find city: {city_name}")
+
+        result = data["results"][0]
+        return Coordinates(
+            latitude=result["latitude"],
+            longitude=result["longitude"],
+            city_name=result.get("name", city_name),
+            country=result.get("country"),
+            country_code=result.get("country_code"),
+            location_id=result.get("id"),
+        )
+
+    def _from_cached(self, cached: dict[str, Any]) -> Coordinates | None:
+        """Rebuild coordinates from a geocoding cache payload."""
+        try:
+            return Coordinates(**cached)
+        except TypeError:
+            # Entry written with a different schema, treat as a miss
+            return None
+
+
+class GeocodingService(GeocodingServiceBase):
     """
     Service for converting city names to geographic coordinates.
 
     Uses Open-Meteo Geocoding API to resolve city names.
     Includes resilience patterns: retry with backoff and circuit breaker.
+    Queries are normalized first, so equivalent spellings share one lookup
+    and a trailing country restricts the search to that country.
+    Resolved coordinates are cached for days when a cache is provided,
+    since a city's location effectively never changes. With an alias
+    table, every resolved query is also mapped to the canonical upstream
+    location ID so differently spelled queries can share one weather entry.
     """
 
     def __init__(
         self,
         base_url: str | None = None,
         timeout: int | None = None,
+        cache: CacheService | None = None,
+        aliases: LocationAliases | None = None,
     ) -> None:
         """
         Initialize geocoding service.
@@ -55,10 +146,12 @@ class GeocodingService:
         Args:
             base_url: Open-Meteo geocoding API base URL. Defaults to config.
             timeout: Request timeout in seconds. Defaults to config.
+            cache: Optional long-lived cache for resolved coordinates.
+            aliases: Optional table mapping queries to location IDs.
         """
-        config = get_config()
-        self.base_url = base_url or config.open_meteo_geocoding_url
-        self.timeout = timeout or config.request_timeout_seconds
+        super().__init__(base_url, timeout)
+        self.cache = cache
+        self.aliases = aliases
 
     def city_to_coords(self, city_name: str) -> Coordinates:
         """
@@ -76,49 +169,156 @@ class GeocodingService:
             CityNotFoundError: If the city cannot be found.
             GeocodingError: If the API request fails.
         """
-        if not city_name or not city_name.strip():
+        if not city_name or not normalize_query(city_name).name:
             raise CityNotFoundError("City name cannot be empty")
 
         city_name = city_name.strip()
 
+        coords = self._get_cached(city_name)
+        if coords is None:
+            coords = self._lookup(city_name)
+
+        if self.aliases is not None and coords.location_id is not None:
+            self.aliases.set(city_name, coords.location_id)
+
+        return coords
+
+    def cities_to_coords(
+        self, city_names: list[str]
+    ) -> dict[str, Coordinates | GeocodingError]:
+        """
+        Convert several city names to coordinates.
+
+        Cached coordinates are read in one batch; only the remaining names
+        are looked up upstream, ``weather_batch_geocoding_concurrency`` at
+        a time. Failures are reported per city instead of aborting the
+        whole batch.
+
+        Args:
+            city_names: Names of the cities to look up.
+
+        Returns:
+            Mapping of each input name to its coordinates or the error
+            raised while resolving it.
+        """
+        results: dict[str, Coordinates | GeocodingError] = {}
+        to_resolve = []
+        for city_name in city_names:
+            if not city_name or not normalize_query(city_name).name:
+                results[city_name] = CityNotFoundError("City name cannot be empty")
+            else:
+                to_resolve.append(city_name)
+
+        keys = {city_name: normalize_query(city_name).key for city_name in to_resolve}
+        cached = (
+            self.cache.get_many(list(set(keys.values())))
+            if self.cache is not None
+            else {}
+        )
+        misses = []
+        for city_name in to_resolve:
+            entry = cached.get(keys[city_name])
+            coords = self._from_cached(entry.payload) if entry is not None else None
+            if coords is not None:
+                results[city_name] = coords
+            else:
+                misses.append(city_name)
+
+        results.update(self._lookup_many(misses))
+        return results
+
+    def _lookup_many(
+        self, city_names: list[str]
+    ) -> dict[str, Coordinates | GeocodingError]:
+        """Resolve several names upstream concurrently, with a bounded fan-out."""
+        if not city_names:
+            return {}
+
+        def lookup(city_name: str) -> Coordinates | GeocodingError:
+            try:
+                return self._lookup(city_name.strip())
+            except GeocodingError as e:
+                return e
+
+        workers = min(len(city_names), get_config().weather_batch_geocoding_concurrency)
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="geocoding-batch"
+        ) as pool:
+            # Each lookup gets its own copy of the request context and deadline
+            futures = {
+                city_name: pool.submit(
+                    contextvars.copy_context().run, lookup, city_name
+                )
+                for city_name in city_names
+            }
+        return {city_name: future.result() for city_name, future in futures.items()}
+
+    def _lookup(self, city_name: str) -> Coordinates:
+        """Resolve a city name upstream and store the result in the cache."""
+        query = normalize_query(city_name)
+        search_name = self._search_name(city_name)
         try:
-            data = self._fetch_geocoding_data(city_name)
+            data = self._fetch_geocoding_data(search_name, query.country_code)
         except CircuitBreakerOpen as e:
             raise GeocodingError(
                 "Geocoding service temporarily unavailable (circuit breaker open)"
             ) from e
+        except DeadlineExceeded as e:
+            raise GeocodingError("Geocoding skipped, request deadline exceeded") from e
 
-        if "results" not in data or len(data["results"]) == 0:
-            raise CityNotFoundError(f"Could not find city: {city_name}")
+        coords = self._parse_result(data, search_name)
 
-        result = data["results"][0]
+        if self.cache is not None:
+            self.cache.set(query.key, asdict(coords))
 
-        return Coordinates(
-            latitude=result["latitude"],
-            longitude=result["longitude"],
-            city_name=result.get("name", city_name),
-            country=result.get("country"),
-            country_code=result.get("country_code"),
-        )
+        return coords
+
+    def _get_cached(self, city_name: str) -> Coordinates | None:
+        """Look up previously resolved coordinates in the geocoding cache."""
+        if self.cache is None:
+            return None
+
+        cached = self.cache.get(normalize_query(city_name).key)
+        if cached is None:
+            return None
+
+        return self._from_cached(cached)
 
     @with_retry()
-    def _fetch_geocoding_data(self, city_name: str) -> dict:
+    def _fetch_geocoding_data(
+        self, city_name: str, country_code: str | None = None
+    ) -> dict[str, Any]:
         """
         Fetch geocoding data from API with retry logic.
 
         Args:
             city_name: Name of the city to look up.
+            country_code: Optional ISO 3166-1 alpha-2 code to search within.
 
         Returns:
             API response data.
 
         Raises:
             GeocodingError: If the API request fails after retries.
+            DeadlineExceeded: If the request deadline has passed.
         """
         breaker = get_geocoding_breaker()
+        timeout = stage_timeout("geocoding", self.timeout)
 
         try:
-            return breaker.call(self._make_request, city_name)
+            # calling() releases the breaker's lock before the request is made,
+            # unlike call(), so concurrent requests are not serialized
+            with breaker.calling():
+                return cast(
+                    dict[str, Any],
+                    hedged_call(
+                        "geocoding",
+                        self._make_request,
+                        city_name,
+                        country_code,
+                        timeout,
+                    ),
+                )
         except pybreaker.CircuitBreakerError as e:
             raise CircuitBreakerOpen("Geocoding service circuit breaker is open") from e
         except httpx.TimeoutException as e:
@@ -130,20 +330,20 @@ class GeocodingService:
         except httpx.RequestError as e:
             raise GeocodingError(f"Geocoding request failed: {e}") from e
 
-    def _make_request(self, city_name: str) -> dict:
+    def _make_request(
+        self,
+        city_name: str,
+        country_code: str | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
         """Make the actual HTTP request."""
-        response = httpx.get(
+        response = get_http_client().get(
             f"{self.base_url}/v1/search",
-            params={
-                "name": city_name,
-                "count": 1,
-                "language": "en",
-                "format": "json",
-            },
-            timeout=self.timeout,
+            params=self._request_params(city_name, country_code),
+            timeout=timeout if timeout is not None else self.timeout,
         )
         response.raise_for_status()
-        return response.json()
+        return cast(dict[str, Any], response.json())
 
     def validate_city(self, city_name: str) -> bool:
         """
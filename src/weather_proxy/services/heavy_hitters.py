@@ -0,0 +1,194 @@
+"""Heavy-hitter tracking of requested cities, aggregated across workers."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import redis
+
+from weather_proxy.config import get_config
+from weather_proxy.utils.metrics import record_hot_cities
+from weather_proxy.utils.normalize import query_key
+from weather_proxy.utils.sketch import CountMinSketch, TopK
+
+if TYPE_CHECKING:
+    from redis import Redis
+
+
+class HeavyHitterTracker:
+    """
+    Streaming top-K of requested cities in near-constant memory.
+
+    Each worker counts queries in a count-min sketch and keeps its top-K
+    candidates. Every ``flush_seconds`` the growth of those candidates is
+    added to a per-window Redis sorted set shared by all workers, and the
+    merged top-K of the current and previous windows is read back in the
+    same round trip. Local counts restart with each window so rankings
+    follow recent traffic. ``record`` only reports when a flush is due, so
+    callers can run the Redis round trip off the request path.
+    """
+
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        k: int | None = None,
+        width: int | None = None,
+        depth: int | None = None,
+        flush_seconds: float | None = None,
+        window_seconds: int | None = None,
+        key_prefix: str = "hot",
+    ) -> None:
+        """
+        Initialize heavy-hitter tracker.
+
+        Args:
+            redis_url: Redis connection URL. Defaults to config.
+            k: Number of top cities to track. Defaults to config.
+            width: Count-min sketch width. Defaults to config.
+            depth: Count-min sketch depth. Defaults to config.
+            flush_seconds: Interval between pushes to Redis. Defaults to config.
+            window_seconds: Length of a counting window. Defaults to config.
+            key_prefix: Prefix of the per-window Redis keys.
+        """
+        config = get_config()
+        self.redis_url = redis_url or config.redis_url
+        self.k = k or config.heavy_hitters_k
+        self.width = width or config.heavy_hitters_sketch_width
+        self.depth = depth or config.heavy_hitters_sketch_depth
+        self.flush_seconds = (
+            flush_seconds
+            if flush_seconds is not None
+            else config.heavy_hitters_flush_seconds
+        )
+        self.window_seconds = window_seconds or config.heavy_hitters_window_seconds
+        self.key_prefix = key_prefix
+        self._window = self._current_window()
+        self._sketch = CountMinSketch(self.width, self.depth)
+        self._top = TopK(self.k)
+        self._flushed: dict[str, int] = {}
+        self._global_top: list[tuple[str, int]] = []
+        self._next_flush = time.monotonic() + self.flush_seconds
+        self._lock = threading.Lock()
+        # Serializes flushes so two never push the same growth
+        self._flush_lock = threading.Lock()
+        self._client: Redis[str] | None = None
+
+    @property
+    def client(self) -> Redis[str]:
+        """Get or create Redis client."""
+        if self._client is None:
+            self._client = redis.from_url(
+                self.redis_url,
+                decode_responses=True,
+            )
+        return self._client
+
+    def _current_window(self) -> int:
+        """Get the number of the current counting window."""
+        return int(time.time() // self.window_seconds)
+
+    def _make_key(self, window: int) -> str:
+        """Generate the Redis key of a window's sorted set."""
+        return f"{self.key_prefix}:{window}"
+
+    def record(self, query: str) -> bool:
+        """
+        Count one request for a city.
+
+        Args:
+            query: City name as requested by the client.
+
+        Returns:
+            True if a flush to Redis is due. Only one caller per interval
+            is told, and should run ``flush`` in the background.
+        """
+        item = query_key(query)
+        with self._lock:
+            self._rotate_if_due()
+            self._top.update(item, self._sketch.add(item))
+            now = time.monotonic()
+            if now < self._next_flush:
+                return False
+            self._next_flush = now + self.flush_seconds
+            return True
+
+    def _rotate_if_due(self) -> None:
+        """Restart local counts when a new window begins. Caller holds the lock."""
+        window = self._current_window()
+        if window != self._window:
+            self._window = window
+            self._sketch = CountMinSketch(self.width, self.depth)
+            self._top = TopK(self.k)
+            self._flushed = {}
+
+    def estimate(self, query: str) -> int:
+        """Get this worker's estimated request count for a city in this window."""
+        with self._lock:
+            return self._sketch.estimate(query_key(query))
+
+    def local_top(self, n: int | None = None) -> list[tuple[str, int]]:
+        """Get this worker's top cities with estimated counts."""
+        with self._lock:
+            return self._top.items()[: n or self.k]
+
+    def global_top(self, n: int | None = None) -> list[tuple[str, int]]:
+        """Get the top cities across all workers as of the last flush."""
+        return self._global_top[: n or self.k]
+
+    def flush(self) -> bool:
+        """
+        Push local count growth to Redis and read back the merged top-K.
+
+        Growth is measured against what was flushed for each city during
+        the window, including cities that have since left the top-K, and
+        only counts as flushed once Redis accepted it.
+
+        Returns:
+            True if Redis was updated, False on Redis errors.
+        """
+        with self._flush_lock:
+            with self._lock:
+                self._next_flush = time.monotonic() + self.flush_seconds
+                window = self._window
+                counts = dict(self._top.items())
+                deltas = {
+                    item: count - self._flushed.get(item, 0)
+                    for item, count in counts.items()
+                    if count > self._flushed.get(item, 0)
+                }
+
+            key = self._make_key(window)
+            try:
+                pipe = self.client.pipeline(transaction=False)
+                for item, delta in deltas.items():
+                    pipe.zincrby(key, delta, item)
+                pipe.expire(key, self.window_seconds * 2)
+                pipe.zrevrange(key, 0, self.k - 1, withscores=True)
+                pipe.zrevrange(
+                    self._make_key(window - 1), 0, self.k - 1, withscores=True
+                )
+                *_, current, previous = pipe.execute()
+            except redis.RedisError:
+                return False
+
+            with self._lock:
+                # A new window restarted the counts; nothing to carry over
+                if self._window == window:
+                    for item in deltas:
+                        self._flushed[item] = counts[item]
+
+        merged: dict[str, int] = {}
+        for item, score in [*current, *previous]:
+            merged[item] = merged.get(item, 0) + int(score)
+        top = sorted(merged.items(), key=lambda pair: (-pair[1], pair[0]))[: self.k]
+        self._global_top = top
+        record_hot_cities(top)
+        return True
+
+    def close(self) -> None:
+        """Close the Redis connection."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
@@ -0,0 +1,67 @@
+"""Process-wide pooled HTTP client for upstream API calls."""
+
+import importlib.util
+import os
+import threading
+
+import httpx
+
+from weather_proxy.config import get_config
+
+# Shared client, created lazily and reused by all request threads
+_http_client: httpx.Client | None = None
+_http_client_lock = threading.Lock()
+
+
+def _http2_available() -> bool:
+    """Check whether the optional h2 package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Get or create the shared HTTP client.
+
+    The client keeps connections to Open-Meteo alive across requests so
+    TCP and TLS handshakes are not repeated on every call. httpx.Client is
+    safe to share between threads.
+
+    Returns:
+        Pooled httpx client.
+    """
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                config = get_config()
+                _http_client = httpx.Client(
+                    http2=config.http2_enabled and _http2_available(),
+                    limits=httpx.Limits(
+                        max_connections=config.http_max_connections,
+                        max_keepalive_connections=config.http_max_keepalive_connections,
+                        keepalive_expiry=config.http_keepalive_expiry_seconds,
+                    ),
+                )
+    return _http_client
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP client and its pooled connections."""
+    global _http_client
+    with _http_client_lock:
+        client = _http_client
+        _http_client = None
+    if client is not None:
+        client.close()
+
+
+def _reset_after_fork() -> None:
+    """Drop the inherited client in a forked worker without closing its sockets."""
+    global _http_client, _http_client_lock
+    _http_client = None
+    _http_client_lock = threading.Lock()
+
+
+# Gunicorn forks workers from the master; pooled sockets must not be shared
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
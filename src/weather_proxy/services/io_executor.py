@@ -0,0 +1,174 @@
+"""Bounded background executor for blocking upstream and Redis work."""
+
+import contextvars
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any
+
+from weather_proxy.config import get_config
+from weather_proxy.utils.metrics import (
+    record_io_executor_pending,
+    record_io_executor_task,
+)
+
+
+class IOExecutorSaturated(Exception):
+    """Exception raised when the executor already holds its max pending tasks."""
+
+    pass
+
+
+class IOExecutorTimeout(Exception):
+    """Exception raised when a task does not finish within the caller's deadline."""
+
+    pass
+
+
+class IOExecutor:
+    """
+    Run blocking I/O on a bounded pool instead of on request threads.
+
+    Request threads submit work and wait for it with a deadline. When the
+    deadline passes they return (to serve a fallback) while the task keeps
+    running and fills the cache for the next request, so a slow upstream
+    holds pool threads rather than every request thread. Submissions beyond
+    ``max_pending`` queued or running tasks are rejected instead of queued,
+    which keeps waiting times bounded. Tasks run in a copy of the caller's
+    context, so request IDs and log context carry over.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int) -> None:
+        """
+        Initialize I/O executor.
+
+        Args:
+            max_workers: Number of pool threads.
+            max_pending: Max tasks queued or running at once.
+        """
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="weather-io"
+        )
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Number of tasks queued or running."""
+        return self._pending
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future[Any]:
+        """
+        Submit a call to the pool.
+
+        Args:
+            fn: Callable to run.
+            *args: Positional arguments for ``fn``.
+            **kwargs: Keyword arguments for ``fn``.
+
+        Returns:
+            Future of the call's result.
+
+        Raises:
+            IOExecutorSaturated: If ``max_pending`` tasks are already pending.
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                record_io_executor_task("rejected")
+                raise IOExecutorSaturated(
+                    f"I/O executor has {self._pending} pending tasks"
+                )
+            self._pending += 1
+            record_io_executor_pending(self._pending)
+
+        context = contextvars.copy_context()
+        try:
+            future = self._executor.submit(context.run, fn, *args, **kwargs)
+        except RuntimeError:
+            # Executor is shutting down
+            self._task_done(None)
+            raise
+        future.add_done_callback(self._task_done)
+        return future
+
+    def run(
+        self, fn: Callable[..., Any], *args: Any, timeout: float, **kwargs: Any
+    ) -> Any:
+        """
+        Run a call on the pool and wait for its result.
+
+        Args:
+            fn: Callable to run.
+            *args: Positional arguments for ``fn``.
+            timeout: Max seconds to wait for the result.
+            **kwargs: Keyword arguments for ``fn``.
+
+        Returns:
+            The call's result.
+
+        Raises:
+            IOExecutorSaturated: If ``max_pending`` tasks are already pending.
+            IOExecutorTimeout: If the call does not finish within ``timeout``.
+                The call itself keeps running.
+            Exception: Whatever the call raised.
+        """
+        return self.wait(self.submit(fn, *args, **kwargs), timeout=timeout)
+
+    def wait(self, future: Future[Any], timeout: float) -> Any:
+        """
+        Wait for the result of a submitted call.
+
+        Raises:
+            IOExecutorTimeout: If the call does not finish within ``timeout``.
+                The call itself keeps running.
+            Exception: Whatever the call raised.
+        """
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError as e:
+            record_io_executor_task("timeout")
+            raise IOExecutorTimeout(f"I/O task did not finish in {timeout}s") from e
+
+    def _task_done(self, future: Future[Any] | None) -> None:
+        """Count a finished task and update the pending gauge."""
+        with self._lock:
+            self._pending -= 1
+            record_io_executor_pending(self._pending)
+        if future is not None:
+            failed = future.cancelled() or future.exception() is not None
+            record_io_executor_task("failed" if failed else "completed")
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting tasks, optionally waiting for running ones."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+# Shared executor, created on first use
+_io_executor: IOExecutor | None = None
+_io_executor_lock = threading.Lock()
+
+
+def get_io_executor() -> IOExecutor:
+    """Get or create the shared I/O executor."""
+    global _io_executor
+    if _io_executor is None:
+        with _io_executor_lock:
+            if _io_executor is None:
+                config = get_config()
+                _io_executor = IOExecutor(
+                    max_workers=config.io_executor_max_workers,
+                    max_pending=config.io_executor_max_pending,
+                )
+    return _io_executor
+
+
+def shutdown_io_executor() -> None:
+    """Shut down the shared I/O executor, waiting for running tasks."""
+    global _io_executor
+    with _io_executor_lock:
+        executor = _io_executor
+        _io_executor = None
+    if executor is not None:
+        executor.shutdown(wait=True)
@@ -0,0 +1,121 @@
+"""In-process TTL cache used as an L1 tier in front of Redis."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from weather_proxy.utils.metrics import record_local_cache_hit, record_local_cache_miss
+
+
+class LocalCache:
+    """
+    Bounded, thread-safe in-memory cache with per-entry TTL.
+
+    Entries are evicted in least-recently-used order once ``max_size`` is
+    reached. Each gunicorn worker holds its own instance, so hot keys are
+    served without a network round trip.
+    """
+
+    def __init__(
+        self, max_size: int, ttl_seconds: float, name: str = "weather"
+    ) -> None:
+        """
+        Initialize local cache.
+
+        Args:
+            max_size: Maximum number of entries kept in memory.
+            ttl_seconds: Upper bound on how long an entry may live.
+            name: Cache name used as the metrics label.
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        """
+        Get a value from the cache.
+
+        Args:
+            key: Cache key to retrieve.
+
+        Returns:
+            Cached value or None if not found or expired.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                record_local_cache_hit(self.name)
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+        record_local_cache_miss(self.name)
+        return None
+
+    def peek(self, key: str) -> Any | None:
+        """
+        Get a value without touching recency order or hit/miss counters.
+
+        Args:
+            key: Cache key to inspect.
+
+        Returns:
+            Cached value or None if not found or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Cache key.
+            value: Value to store. Callers must treat it as read-only.
+            ttl: Optional TTL in seconds, capped at the cache's own TTL.
+        """
+        ttl_to_use = self.ttl_seconds if ttl is None else min(ttl, self.ttl_seconds)
+        if ttl_to_use <= 0 or self.max_size <= 0:
+            return
+
+        expires_at = time.monotonic() + ttl_to_use
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove a key from the cache if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return current size and hit/miss counters."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
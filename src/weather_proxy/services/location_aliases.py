@@ -0,0 +1,126 @@
+"""Alias table mapping raw city queries to canonical location IDs."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import redis
+
+from weather_proxy.config import get_config
+from weather_proxy.services.local_cache import LocalCache
+from weather_proxy.utils.normalize import query_key
+
+if TYPE_CHECKING:
+    from redis import Redis
+
+
+class LocationAliases:
+    """
+    Map raw city queries to Open-Meteo location IDs.
+
+    Each alias is a plain Redis key holding the bare ID, with no cache
+    envelope, and expires ``ttl_seconds`` after it was last stored, so
+    the table only holds queries resolved recently. Aliases
+    practically never change, so they are also kept in a per-worker L1
+    for the same lifetime.
+    """
+
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        ttl_seconds: int | None = None,
+        local_cache: LocalCache | None = None,
+        key_prefix: str = "alias",
+    ) -> None:
+        """
+        Initialize location aliases.
+
+        Args:
+            redis_url: Redis connection URL. Defaults to config.
+            ttl_seconds: Lifetime of each alias. Defaults to the geocoding
+                cache TTL.
+            local_cache: Optional L1 cache instance. Defaults to one built from config.
+            key_prefix: Prefix of the per-alias Redis keys.
+        """
+        config = get_config()
+        self.redis_url = redis_url or config.redis_url
+        self.ttl_seconds = ttl_seconds or config.geocoding_cache_ttl_seconds
+        self.key_prefix = key_prefix
+        if local_cache is None:
+            local_cache = LocalCache(
+                max_size=config.local_cache_max_size,
+                ttl_seconds=self.ttl_seconds,
+                name=key_prefix,
+            )
+        self.local_cache = local_cache
+        self._client: Redis[str] | None = None
+
+    @property
+    def client(self) -> Redis[str]:
+        """Get or create Redis client."""
+        if self._client is None:
+            self._client = redis.from_url(
+                self.redis_url,
+                decode_responses=True,
+            )
+        return self._client
+
+    def _make_key(self, query: str) -> str:
+        """Generate the Redis key of a normalized query."""
+        return f"{self.key_prefix}:{query_key(query)}"
+
+    def get(self, query: str) -> int | None:
+        """
+        Get the canonical location ID for a query.
+
+        Args:
+            query: City name as requested by the client.
+
+        Returns:
+            Location ID, or None if the query has not been resolved yet.
+        """
+        key = self._make_key(query)
+        local = self.local_cache.get(key)
+        if local is not None:
+            return int(local)
+
+        try:
+            value = self.client.get(key)
+            if value is None:
+                return None
+            location_id = int(value)
+        except redis.RedisError:
+            return None
+        except (TypeError, ValueError):
+            # Foreign data under the alias key, treat as unknown
+            return None
+
+        self.local_cache.set(key, location_id)
+        return location_id
+
+    def set(self, query: str, location_id: int) -> bool:
+        """
+        Record the canonical location ID for a query.
+
+        Args:
+            query: City name as requested by the client.
+            location_id: Open-Meteo location ID the query resolved to.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        key = self._make_key(query)
+        try:
+            self.client.set(key, location_id, ex=self.ttl_seconds)
+        except redis.RedisError:
+            return False
+
+        self.local_cache.set(key, location_id)
+        return True
+
+    def close(self) -> None:
+        """Close the Redis connection and drop L1 entries."""
+        self.local_cache.clear()
+        if self._client is not None:
+            self._client.close()
+            self._client = None
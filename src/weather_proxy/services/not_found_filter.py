@@ -0,0 +1,247 @@
+"""Shared Bloom filter of city queries known to match no location."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import redis
+
+from weather_proxy.config import get_config
+from weather_proxy.utils.bloom import BloomFilter, optimal_size
+from weather_proxy.utils.normalize import query_key
+
+if TYPE_CHECKING:
+    from redis import Redis
+
+
+class NotFoundFilter:
+    """
+    Bloom filter of unknown city queries, shared across workers via Redis.
+
+    Each generation of the filter is a Redis bitmap that workers update
+    with SETBIT. ``sync`` copies the bitmaps into memory and is meant to
+    run off the request path whenever ``claim_sync`` reports it due, so
+    checks never wait on Redis. A new generation starts every
+    ``rotate_seconds`` and only the current and previous ones are kept,
+    which rebuilds the filter from recent misses and bounds how long a
+    false positive can last. Generations hash with different seeds, so a
+    valid city that collides in one generation is unlikely to in the next.
+
+    Insertions are counted per generation in Redis, and a generation stops
+    taking new queries once it holds ``capacity`` of them, so a flood of
+    junk queries cannot fill the bitmap past its target error rate.
+
+    A hit only means the query may be unknown; callers confirm it against
+    the exact negative cache. Until the current generation is loaded, and
+    once it is full, every query is reported as a possible hit so those
+    lookups still happen.
+    """
+
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        capacity: int | None = None,
+        error_rate: float | None = None,
+        rotate_seconds: int | None = None,
+        sync_seconds: float | None = None,
+        key_prefix: str = "notfound:bloom",
+    ) -> None:
+        """
+        Initialize not-found filter.
+
+        Args:
+            redis_url: Redis connection URL. Defaults to config.
+            capacity: Expected unknown queries per generation. Defaults to config.
+            error_rate: Target false-positive rate at capacity. Defaults to config.
+            rotate_seconds: Lifetime of a generation. Defaults to config.
+            sync_seconds: Interval between copies from Redis. Defaults to config.
+            key_prefix: Prefix of the per-generation Redis keys.
+        """
+        config = get_config()
+        self.redis_url = redis_url or config.redis_url
+        self.rotate_seconds = rotate_seconds or config.not_found_filter_rotate_seconds
+        self.sync_seconds = (
+            sync_seconds
+            if sync_seconds is not None
+            else config.not_found_filter_sync_seconds
+        )
+        self.key_prefix = key_prefix
+        self.capacity = capacity or config.not_found_filter_capacity
+        self.size_bits, self.hash_count = optimal_size(
+            self.capacity,
+            error_rate or config.not_found_filter_error_rate,
+        )
+        self._filters: dict[int, BloomFilter] = {}
+        # Insertions into each generation across workers, as last seen
+        self._added: dict[int, int] = {}
+        self._next_sync = 0.0
+        self._lock = threading.Lock()
+        # Serializes syncs so an older copy never replaces a newer one
+        self._sync_lock = threading.Lock()
+        self._client: Redis[bytes] | None = None
+
+    @property
+    def client(self) -> Redis[bytes]:
+        """Get or create Redis client; bitmaps are read as raw bytes."""
+        if self._client is None:
+            self._client = redis.from_url(self.redis_url)
+        return self._client
+
+    def _make_key(self, generation: int) -> str:
+        """Generate the Redis key of a filter generation."""
+        return f"{self.key_prefix}:{generation}"
+
+    def _make_count_key(self, generation: int) -> str:
+        """Generate the Redis key counting a generation's insertions."""
+        return f"{self._make_key(generation)}:count"
+
+    def _new_filter(self, generation: int, data: bytes | None = None) -> BloomFilter:
+        """Build an empty or loaded filter for a generation."""
+        return BloomFilter(
+            self.size_bits,
+            self.hash_count,
+            seed=str(generation).encode(),
+            data=data,
+        )
+
+    def _generation(self) -> int:
+        """Get the generation new queries go into."""
+        return int(time.time() // self.rotate_seconds)
+
+    def claim_sync(self) -> bool:
+        """
+        Check whether a copy from Redis is due, claiming it if so.
+
+        Returns:
+            True if the caller should run ``sync``, off the request path.
+        """
+        now = time.time()
+        with self._lock:
+            if now < self._next_sync:
+                return False
+            # A new generation is loaded as soon as it starts
+            generation_end = (int(now // self.rotate_seconds) + 1) * self.rotate_seconds
+            self._next_sync = min(now + self.sync_seconds, generation_end)
+            return True
+
+    def sync(self) -> bool:
+        """
+        Copy the current and previous generations from Redis.
+
+        The bitmaps are read without holding the lock checks take, then
+        swapped in at once. Bits set locally since the last copy are kept.
+
+        Returns:
+            False if Redis could not be read; the local copy is kept,
+            minus generations that rotated out.
+        """
+        with self._sync_lock:
+            generation = self._generation()
+            generations = [generation, generation - 1]
+            try:
+                bitmaps = self.client.mget([self._make_key(g) for g in generations])
+            except redis.RedisError:
+                with self._lock:
+                    self._filters = {
+                        g: bloom
+                        for g, bloom in self._filters.items()
+                        if g in generations
+                    }
+                return False
+
+            filters = {
+                g: self._new_filter(g, data)
+                for g, data in zip(generations, bitmaps, strict=True)
+            }
+            with self._lock:
+                for g, bloom in filters.items():
+                    if g in self._filters:
+                        bloom.merge(self._filters[g])
+                self._filters = filters
+            return True
+
+    def _normalize(self, query: str) -> str:
+        """Normalize a query the same way cache keys are."""
+        return query_key(query)
+
+    def might_contain(self, query: str) -> bool:
+        """
+        Check whether a query was recently found to match no city.
+
+        Args:
+            query: City name as requested by the client.
+
+        Returns:
+            True if the query may be unknown, False if it definitely was
+            not recorded in the current or previous generation.
+        """
+        item = self._normalize(query)
+        generation = self._generation()
+        with self._lock:
+            filters = self._filters
+            full = self._added.get(generation, 0) >= self.capacity
+        if generation not in filters or full:
+            return True
+        return any(
+            item in filters[g] for g in (generation, generation - 1) if g in filters
+        )
+
+    def add(self, queries: list[str]) -> bool:
+        """
+        Record queries that matched no city in the current generation.
+
+        Queries already in the filter are skipped, and none are added once
+        the generation holds ``capacity`` queries.
+
+        Args:
+            queries: City names as requested by clients.
+
+        Returns:
+            True if the shared bitmap was updated, False on Redis errors or
+            when the generation is full.
+        """
+        generation = self._generation()
+        with self._lock:
+            # Until the generation is loaded, its next copy brings these bits
+            bloom = self._filters.get(generation) or self._new_filter(generation)
+            room = self.capacity - self._added.get(generation, 0)
+
+        items = [
+            item
+            for item in dict.fromkeys(self._normalize(query) for query in queries)
+            if item not in bloom
+        ]
+        items = items[: max(0, room)]
+        if not items:
+            return False
+
+        key = self._make_key(generation)
+        count_key = self._make_count_key(generation)
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.incrby(count_key, len(items))
+            pipe.expire(count_key, self.rotate_seconds * 2)
+            for item in items:
+                bloom.add(item)
+                for position in bloom.positions(item):
+                    pipe.setbit(key, position, 1)
+            pipe.expire(key, self.rotate_seconds * 2)
+            added = int(pipe.execute()[0])
+        except redis.RedisError:
+            return False
+
+        with self._lock:
+            self._added = {generation: added}
+        return True
+
+    def close(self) -> None:
+        """Close the Redis connection and drop the local copy."""
+        with self._lock:
+            self._filters = {}
+            self._added = {}
+            self._next_sync = 0.0
+        if self._client is not None:
+            self._client.close()
+            self._client = None
@@ -0,0 +1,115 @@
+"""Background refresh-ahead of hot cities before their cache entries expire."""
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from weather_proxy.middleware.logging import get_logger
+from weather_proxy.utils.metrics import record_refresh_ahead
+
+
+class RefreshAheadScheduler:
+    """
+    Periodically re-fetch hot cities so their entries never expire.
+
+    Every ``interval_seconds`` the scheduler takes the cities from
+    ``hot_cities``, asks ``is_leader`` whether this process should do the
+    round, then passes each city to ``refresh``, which decides whether the
+    entry is close enough to expiry and re-fetches it. At most
+    ``max_concurrency`` refreshes run at once and new ones start no faster
+    than ``rate_per_second``.
+    """
+
+    def __init__(
+        self,
+        refresh: Callable[[str], bool],
+        hot_cities: Callable[[], list[str]],
+        interval_seconds: float,
+        max_concurrency: int,
+        rate_per_second: float,
+        is_leader: Callable[[], bool] | None = None,
+    ) -> None:
+        """
+        Initialize refresh-ahead scheduler.
+
+        Args:
+            refresh: Refreshes a city if needed; returns True if it fetched.
+            hot_cities: Returns the cities to keep warm this round.
+            interval_seconds: Time between rounds.
+            max_concurrency: Maximum refreshes running at once.
+            rate_per_second: Maximum refreshes started per second.
+            is_leader: Returns whether this process runs the round.
+                Defaults to always running.
+        """
+        self.refresh = refresh
+        self.hot_cities = hot_cities
+        self.interval_seconds = interval_seconds
+        self.max_concurrency = max_concurrency
+        self.rate_per_second = rate_per_second
+        self.is_leader = is_leader or (lambda: True)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the scheduler thread if it is not already running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="refresh-ahead", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the scheduler, waiting for the current round to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        """Run rounds until stopped."""
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.run_once()
+            except Exception as e:
+                get_logger("refresh_ahead").warning(
+                    "refresh_ahead_round_failed", error=str(e)
+                )
+
+    def run_once(self) -> int:
+        """
+        Run a single refresh round.
+
+        Returns:
+            Number of cities that were re-fetched.
+        """
+        # Collect first so every process refreshes its view of the hot set
+        cities = self.hot_cities()
+        if not cities or not self.is_leader():
+            return 0
+
+        spacing = 1 / self.rate_per_second if self.rate_per_second > 0 else 0
+        with ThreadPoolExecutor(
+            max_workers=max(1, self.max_concurrency),
+            thread_name_prefix="refresh-ahead",
+        ) as pool:
+            futures: list[Future[bool]] = []
+            for city in cities:
+                if futures and self._stop.wait(spacing):
+                    break
+                futures.append(pool.submit(self._refresh_city, city))
+            return sum(future.result() for future in futures)
+
+    def _refresh_city(self, city: str) -> bool:
+        """Refresh one city, recording the outcome."""
+        try:
+            refreshed = self.refresh(city)
+        except Exception as e:
+            record_refresh_ahead("error")
+            get_logger("refresh_ahead").warning(
+                "refresh_ahead_failed", city=city, error=str(e)
+            )
+            return False
+        record_refresh_ahead("refreshed" if refreshed else "skipped")
+        return refreshed
@@ -0,0 +1,134 @@
+"""Response building shared by the Flask and ASGI apps."""
+
+import json
+import math
+import time
+from typing import Any
+
+import httpx
+
+from weather_proxy.config import get_config
+from weather_proxy.resilience.circuit_breaker import CircuitBreakerOpen
+from weather_proxy.resilience.deadline import DeadlineExceeded
+from weather_proxy.resilience.single_flight import SingleFlightTimeout
+from weather_proxy.services.cache_service import CacheEntry
+from weather_proxy.services.geocoding_service import Coordinates
+from weather_proxy.services.weather_service import WeatherData
+
+
+def build_weather_response(
+    city: str,
+    country: str | None,
+    latitude: float,
+    longitude: float,
+    weather_data: dict[str, Any],
+    cached: bool,
+    cache_ttl: int | None,
+    request_id: str,
+    stale: bool = False,
+    degraded: bool = False,
+) -> dict[str, Any]:
+    """Build standardized weather response."""
+    response: dict[str, Any] = {
+        "city": city,
+        "country": country,
+        "coordinates": {
+            "latitude": latitude,
+            "longitude": longitude,
+        },
+        "current": weather_data,
+        "cached": cached,
+        "stale": stale,
+        "degraded": degraded,
+        "request_id": request_id,
+    }
+
+    if cache_ttl is not None:
+        response["cache_expires_in"] = cache_ttl
+
+    return response
+
+
+def build_current_data(weather: WeatherData) -> dict[str, Any]:
+    """Build the ``current`` section of a response from weather data."""
+    return {
+        "temperature": weather.temperature,
+        "temperature_unit": weather.temperature_unit,
+        "apparent_temperature": weather.apparent_temperature,
+        "humidity": weather.humidity,
+        "weather_code": weather.weather_code,
+        "weather_description": weather.weather_description,
+        "wind_speed": weather.wind_speed,
+        "wind_speed_unit": weather.wind_speed_unit,
+        "precipitation": weather.precipitation,
+        "is_day": weather.is_day,
+    }
+
+
+def aligned_ttl(weather: WeatherData) -> int | None:
+    """
+    Get the soft TTL that ends when Open-Meteo publishes the next value.
+
+    Returns:
+        TTL in seconds, or None for the default TTL when the update time
+        is unknown.
+    """
+    if weather.expires_at is None:
+        return None
+    config = get_config()
+    remaining = weather.expires_at - time.time()
+    # Scale up so TTL jitter spreads expiries after the update, not before it
+    remaining /= 1 - min(config.cache_ttl_jitter, 0.5)
+    return max(config.upstream_min_ttl_seconds, math.ceil(remaining))
+
+
+def build_response_data(coords: Coordinates, current: dict[str, Any]) -> dict[str, Any]:
+    """Build the cacheable response data for a city's current weather."""
+    return {
+        "city": coords.city_name,
+        "country": coords.country,
+        "coordinates": {
+            "latitude": coords.latitude,
+            "longitude": coords.longitude,
+        },
+        "current": current,
+    }
+
+
+def is_upstream_unavailable(error: BaseException) -> bool:
+    """Check whether an error was caused by an open breaker or a timeout."""
+    cause: BaseException | None = error
+    while cause is not None:
+        if isinstance(
+            cause,
+            CircuitBreakerOpen
+            | httpx.TimeoutException
+            | SingleFlightTimeout
+            | DeadlineExceeded,
+        ):
+            return True
+        cause = cause.__cause__
+    return False
+
+
+def cached_body(
+    entry: CacheEntry,
+    request_id: str,
+    cache_ttl: int,
+    stale: bool,
+    degraded: bool = False,
+) -> str:
+    """
+    Render the JSON body of a cached response.
+
+    The entry body is the pre-rendered JSON of the response data; only the
+    per-request fields are spliced in before its closing brace.
+    """
+    fields = {
+        "cached": True,
+        "stale": stale,
+        "degraded": degraded,
+        "request_id": request_id,
+        "cache_expires_in": cache_ttl,
+    }
+    return f"{entry.body[:-1]},{json.dumps(fields, separators=(',', ':'))[1:]}"
@@ -0,0 +1,132 @@
+"""Cross-request micro-batching of upstream forecast lookups."""
+
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from weather_proxy.config import get_config
+from weather_proxy.resilience.deadline import DeadlineExceeded, cap, shared_deadline
+from weather_proxy.services.weather_service import (
+    WeatherData,
+    WeatherService,
+    WeatherServiceError,
+)
+from weather_proxy.utils.metrics import record_deadline_exceeded, record_microbatch
+
+
+class _Batch:
+    """Lookups collected during one batching window."""
+
+    def __init__(self) -> None:
+        self.lookups: list[tuple[float, float, Future[WeatherData]]] = []
+        self.closed = threading.Event()
+
+
+class WeatherBatcher:
+    """
+    Collect concurrent weather lookups into multi-location requests.
+
+    The first caller of a window waits up to ``window_seconds`` for others
+    to join, then sends one Open-Meteo request for every queued coordinate
+    and hands each caller its own result. A batch that reaches
+    ``max_batch_size`` is sent right away by the caller that filled it.
+    No background thread is involved; request threads do the flushing.
+    The upstream request runs under the configured request budget rather
+    than the flushing caller's, and every caller waits for its result at
+    most ``wait_seconds`` or its own remaining budget.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float,
+        max_batch_size: int,
+        weather_service: WeatherService | None = None,
+        wait_seconds: float | None = None,
+    ) -> None:
+        """
+        Initialize weather batcher.
+
+        Args:
+            window_seconds: How long the first caller waits for others.
+            max_batch_size: Number of queued lookups that triggers a flush.
+            weather_service: Service used for upstream calls. Defaults to a new one.
+            wait_seconds: Max wait for a batch's result. Defaults to config.
+        """
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+        self.weather_service = weather_service or WeatherService()
+        self.wait_seconds = (
+            wait_seconds
+            if wait_seconds is not None
+            else get_config().single_flight_timeout_seconds
+        )
+        self._batch = _Batch()
+        self._lock = threading.Lock()
+
+    def get_weather(self, latitude: float, longitude: float) -> WeatherData:
+        """
+        Get current weather for coordinates, batched with concurrent callers.
+
+        Args:
+            latitude: Latitude of the location.
+            longitude: Longitude of the location.
+
+        Returns:
+            Current weather data.
+
+        Raises:
+            WeatherServiceError: If the batched API request fails, or its
+                result does not arrive within the caller's wait.
+        """
+        future: Future[WeatherData] = Future()
+        with self._lock:
+            batch = self._batch
+            batch.lookups.append((latitude, longitude, future))
+            is_leader = len(batch.lookups) == 1
+            is_full = len(batch.lookups) >= self.max_batch_size
+            if is_full:
+                self._close(batch)
+
+        if is_full:
+            self._execute(batch)
+        elif is_leader:
+            batch.closed.wait(self.window_seconds)
+            with self._lock:
+                # Still open means nobody filled it; flush it ourselves
+                is_open = self._batch is batch
+                if is_open:
+                    self._close(batch)
+            if is_open:
+                self._execute(batch)
+
+        try:
+            return future.result(timeout=cap(self.wait_seconds))
+        except FutureTimeoutError:
+            # Chained like the service's own deadline errors, so callers
+            # fall back to the last-known-good copy
+            record_deadline_exceeded("microbatch")
+            raise WeatherServiceError(
+                "Batched weather request did not finish in time"
+            ) from DeadlineExceeded("Timed out waiting for a batched weather request")
+
+    def _close(self, batch: _Batch) -> None:
+        """Stop a batch from accepting lookups. Caller must hold the lock."""
+        self._batch = _Batch()
+        batch.closed.set()
+
+    def _execute(self, batch: _Batch) -> None:
+        """Send one upstream request for a batch and resolve its futures."""
+        locations = list(dict.fromkeys((lat, lon) for lat, lon, _ in batch.lookups))
+        record_microbatch(len(locations))
+
+        try:
+            with shared_deadline():
+                results = self.weather_service.get_weather_many(locations)
+        except Exception as e:
+            for _, _, future in batch.lookups:
+                future.set_exception(e)
+            return
+
+        by_location = dict(zip(locations, results, strict=True))
+        for latitude, longitude, future in batch.lookups:
+            future.set_result(by_location[(latitude, longitude)])
@@ -1,6 +1,10 @@
 """Weather service for fetching weather data from Open-Meteo API."""
 
+import math
+import time
 from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
 
 import httpx
 import pybreaker
@@ -11,6 +15,9 @@ from weather_proxy.resilience.circuit_breaker import (
     get_weather_breaker,
     with_retry,
 )
+from weather_proxy.resilience.deadline import DeadlineExceeded, stage_timeout
+from weather_proxy.resilience.hedging import hedged_call
+from weather_proxy.services.http_client import get_http_client
 
 # WMO Weather interpretation codes
 WMO_CODES = {
@@ -59,6 +66,77 @@ class WeatherData:
     apparent_temperature: float | None = None
     precipitation: float | None = None
     is_day: bool | None = None
+    expires_at: float | None = None
+
+
+def grid_cell_key(latitude: float, longitude: float, resolution: float) -> str:
+    """
+    Build a cache key for the forecast grid cell containing a point.
+
+    Coordinates are snapped down to a ``resolution``-degree grid, so a city
+    and the suburbs that share its model cell map to the same key.
+
+    Args:
+        latitude: Latitude of the location.
+        longitude: Longitude of the location.
+        resolution: Cell size in degrees.
+
+    Returns:
+        Key of the form ``"<resolution>:<row>:<column>"``.
+    """
+    row = math.floor(latitude / resolution)
+    column = math.floor(longitude / resolution)
+    return f"{resolution:g}:{row}:{column}"
+
+
+def next_update_at(
+    section: dict[str, Any],
+    interval: int,
+    utc_offset_seconds: int = 0,
+    now: float | None = None,
+) -> float | None:
+    """
+    Compute when Open-Meteo publishes the value following a section's data.
+
+    The ``current`` section carries a single ``time`` and its ``interval``;
+    ``hourly`` and ``daily`` sections carry a list of times, of which the
+    step covering ``now`` is used.
+
+    Args:
+        section: A ``current``, ``hourly`` or ``daily`` response section.
+        interval: Update interval in seconds when the section has none.
+        utc_offset_seconds: Offset of ISO8601 times from UTC.
+        now: Current Unix time. Defaults to the system clock.
+
+    Returns:
+        Unix time of the next update, or None if it cannot be determined.
+    """
+    interval = section.get("interval") or interval
+    times = section.get("time")
+    if not interval or interval <= 0 or times is None:
+        return None
+
+    now = time.time() if now is None else now
+    try:
+        timestamps = [
+            _to_unix_time(value, utc_offset_seconds)
+            for value in (times if isinstance(times, list) else [times])
+        ]
+    except (TypeError, ValueError):
+        return None
+
+    started = [timestamp for timestamp in timestamps if timestamp <= now]
+    if not started:
+        return None
+    return max(started) + interval
+
+
+def _to_unix_time(value: int | float | str, utc_offset_seconds: int) -> float:
+    """Convert an Open-Meteo time (Unix or local ISO8601) to Unix time."""
+    if isinstance(value, int | float):
+        return float(value)
+    local = datetime.fromisoformat(value).replace(tzinfo=UTC)
+    return local.timestamp() - utc_offset_seconds
 
 
 class WeatherServiceError(Exception):
@@ -67,13 +145,20 @@ class WeatherServiceError(Exception):
     pass
 
 
-class WeatherService:
-    """
-    Service for fetching weather data from Open-Meteo API.
+# Current conditions requested from Open-Meteo
+CURRENT_VARIABLES = [
+    "temperature_2m",
+    "relative_humidity_2m",
+    "apparent_temperature",
+    "weather_code",
+    "wind_speed_10m",
+    "precipitation",
+    "is_day",
+]
 
-    Provides current weather conditions for given coordinates.
-    Includes resilience patterns: retry with backoff and circuit breaker.
-    """
+
+class WeatherServiceBase:
+    """Request building and response parsing shared by the weather services."""
 
     def __init__(
         self,
@@ -90,30 +175,46 @@ class WeatherService:
         config = get_config()
         self.base_url = base_url or config.open_meteo_base_url
         self.timeout = timeout or config.request_timeout_seconds
-
-    def get_weather(self, latitude: float, longitude: float) -> WeatherData:
+        self.update_intervals = {
+            "current": config.upstream_interval_current_seconds,
+            "hourly": config.upstream_interval_hourly_seconds,
+            "daily": config.upstream_interval_daily_seconds,
+        }
+
+    def _request_params(
+        self, latitude: float | str, longitude: float | str
+    ) -> dict[str, Any]:
+        """Build the forecast query parameters for one or more locations."""
+        return {
+            "latitude": latitude,
+            "longitude": longitude,
+            "current": CURRENT_VARIABLES,
+            "temperature_unit": "celsius",
+            "wind_speed_unit": "kmh",
+            "precipitation_unit": "mm",
+            "timeformat": "unixtime",
+        }
+
+    def _parse_many(self, data: Any, count: int) -> list[WeatherData]:
         """
-        Get current weather for coordinates.
-
-        Uses retry logic and circuit breaker for resilience.
+        Convert a multi-location forecast response into WeatherData.
 
-        Args:
-            latitude: Latitude of the location.
-            longitude: Longitude of the location.
+        Raises:
+            WeatherServiceError: If the response does not match the request.
+        """
+        # A single location comes back as an object rather than a list
+        results = data if isinstance(data, list) else [data]
+        if len(results) != count:
+            raise WeatherServiceError("Invalid response from weather API")
+        return [self._parse_weather(result) for result in results]
 
-        Returns:
-            Current weather data.
+    def _parse_weather(self, data: dict[str, Any]) -> WeatherData:
+        """
+        Convert one Open-Meteo forecast result into WeatherData.
 
         Raises:
-            WeatherServiceError: If the API request fails.
+            WeatherServiceError: If the result has no current weather.
         """
-        try:
-            data = self._fetch_weather_data(latitude, longitude)
-        except CircuitBreakerOpen as e:
-            raise WeatherServiceError(
-                "Weather service temporarily unavailable (circuit breaker open)"
-            ) from e
-
         if "current" not in data:
             raise WeatherServiceError("Invalid response from weather API")
 
@@ -137,27 +238,120 @@ class WeatherService:
             apparent_temperature=current.get("apparent_temperature"),
             precipitation=current.get("precipitation"),
             is_day=is_day,
+            expires_at=self._next_update_at(data, "current"),
         )
 
-    @with_retry()
-    def _fetch_weather_data(self, latitude: float, longitude: float) -> dict:
+    def _next_update_at(self, data: dict[str, Any], section: str) -> float | None:
+        """Get when a section of a forecast result is next updated upstream."""
+        interval = self.update_intervals.get(section, 0)
+        if interval <= 0 or section not in data:
+            return None
+        return next_update_at(
+            data[section], interval, data.get("utc_offset_seconds", 0)
+        )
+
+
+class WeatherService(WeatherServiceBase):
+    """
+    Service for fetching weather data from Open-Meteo API.
+
+    Provides current weather conditions for given coordinates.
+    Includes resilience patterns: retry with backoff and circuit breaker.
+    """
+
+    def get_weather(self, latitude: float, longitude: float) -> WeatherData:
         """
-        Fetch weather data from API with retry logic.
+        Get current weather for coordinates.
+
+        Uses retry logic and circuit breaker for resilience.
 
         Args:
             latitude: Latitude of the location.
             longitude: Longitude of the location.
 
+        Returns:
+            Current weather data, with ``expires_at`` set to when Open-Meteo
+            publishes the next value.
+
+        Raises:
+            WeatherServiceError: If the API request fails.
+        """
+        try:
+            data = self._fetch_weather_data(latitude, longitude)
+        except CircuitBreakerOpen as e:
+            raise WeatherServiceError(
+                "Weather service temporarily unavailable (circuit breaker open)"
+            ) from e
+        except DeadlineExceeded as e:
+            raise WeatherServiceError(
+                "Weather request skipped, request deadline exceeded"
+            ) from e
+
+        return self._parse_weather(data)
+
+    def get_weather_many(
+        self, locations: list[tuple[float, float]]
+    ) -> list[WeatherData]:
+        """
+        Get current weather for several coordinates in one upstream request.
+
+        Open-Meteo accepts comma-separated latitude and longitude lists and
+        returns one result per location, in the same order.
+
+        Args:
+            locations: (latitude, longitude) pairs.
+
+        Returns:
+            Current weather data for each location, in input order.
+
+        Raises:
+            WeatherServiceError: If the API request fails.
+        """
+        if not locations:
+            return []
+
+        latitudes = ",".join(str(latitude) for latitude, _ in locations)
+        longitudes = ",".join(str(longitude) for _, longitude in locations)
+
+        try:
+            data = self._fetch_weather_data(latitudes, longitudes)
+        except CircuitBreakerOpen as e:
+            raise WeatherServiceError(
+                "Weather service temporarily unavailable (circuit breaker open)"
+            ) from e
+        except DeadlineExceeded as e:
+            raise WeatherServiceError(
+                "Weather request skipped, request deadline exceeded"
+            ) from e
+
+        return self._parse_many(data, len(locations))
+
+    @with_retry()
+    def _fetch_weather_data(self, latitude: float | str, longitude: float | str) -> Any:
+        """
+        Fetch weather data from API with retry logic.
+
+        Args:
+            latitude: Latitude, or comma-separated latitudes for a batch.
+            longitude: Longitude, or comma-separated longitudes for a batch.
+
         Returns:
             API response data.
 
         Raises:
             WeatherServiceError: If the API request fails after retries.
+            DeadlineExceeded: If the request deadline has passed.
         """
         breaker = get_weather_breaker()
+        timeout = stage_timeout("weather", self.timeout)
 
         try:
-            return breaker.call(self._make_request, latitude, longitude)
+            # calling() releases the breaker's lock before the request is made,
+            # unlike call(), so concurrent requests are not serialized
+            with breaker.calling():
+                return hedged_call(
+                    "weather", self._make_request, latitude, longitude, timeout
+                )
         except pybreaker.CircuitBreakerError as e:
             raise CircuitBreakerOpen("Weather service circuit breaker is open") from e
         except httpx.TimeoutException as e:
@@ -169,27 +363,17 @@ class WeatherService:
         except httpx.RequestError as e:
             raise WeatherServiceError(f"Weather request failed: {e}") from e
 
-    def _make_request(self, latitude: float, longitude: float) -> dict:
+    def _make_request(
+        self,
+        latitude: float | str,
+        longitude: float | str,
+        timeout: float | None = None,
+    ) -> Any:
         """Make the actual HTTP request."""
-        response = httpx.get(
+        response = get_http_client().get(
             f"{self.base_url}/v1/forecast",
-            params={
-                "latitude": latitude,
-                "longitude": longitude,
-                "current": [
-                    "temperature_2m",
-                    "relative_humidity_2m",
-                    "apparent_temperature",
-                    "weather_code",
-                    "wind_speed_10m",
-                    "precipitation",
-                    "is_day",
-                ],
-                "temperature_unit": "celsius",
-                "wind_speed_unit": "kmh",
-                "precipitation_unit": "mm",
-            },
-            timeout=self.timeout,
+            params=self._request_params(latitude, longitude),
+            timeout=timeout if timeout is not None else self.timeout,
         )
         response.raise_for_status()
         return response.json()
@@ -202,7 +386,7 @@ class WeatherService:
             True if API is reachable, False otherwise.
         """
         try:
-            response = httpx.get(
+            response = get_http_client().get(
                 f"{self.base_url}/v1/forecast",
                 params={
                     "latitude": 0,
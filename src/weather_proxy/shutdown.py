@@ -66,6 +66,7 @@ def setup_signal_handlers() -> None:
 def cleanup_resources() -> None:
     """Clean up application resources during shutdown."""
     from weather_proxy.routes.weather import reset_cache_service
+    from weather_proxy.services.http_client import close_http_client
 
     print("Cleaning up resources...")
 
@@ -76,4 +77,11 @@ def cleanup_resources() -> None:
     except Exception as e:
         print(f"  - Error closing cache service: {e}")
 
+    # Close pooled upstream HTTP connections
+    try:
+        close_http_client()
+        print("  - HTTP client closed")
+    except Exception as e:
+        print(f"  - Error closing HTTP client: {e}")
+
     print("Resource cleanup complete.")
@@ -0,0 +1,93 @@
+"""Compact Bloom filter over strings."""
+
+from __future__ import annotations
+
+import hashlib
+import math
+
+
+def optimal_size(capacity: int, error_rate: float) -> tuple[int, int]:
+    """
+    Compute the bit count and hash count for a Bloom filter.
+
+    Args:
+        capacity: Expected number of items.
+        error_rate: Target false-positive probability once full.
+
+    Returns:
+        Tuple of (size in bits, number of hash functions).
+    """
+    size_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+    hash_count = max(1, round(size_bits / capacity * math.log(2)))
+    return size_bits, hash_count
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter with no false negatives.
+
+    Bits are numbered from the most significant bit of the first byte,
+    the same order Redis uses for SETBIT/GETBIT, so a Redis bitmap can be
+    loaded with ``data`` and updated bit by bit through ``positions``.
+    """
+
+    def __init__(
+        self,
+        size_bits: int,
+        hash_count: int,
+        seed: bytes = b"",
+        data: bytes | None = None,
+    ) -> None:
+        """
+        Initialize Bloom filter.
+
+        Args:
+            size_bits: Number of bits in the filter.
+            hash_count: Number of bit positions set per item.
+            seed: Hash key; filters with different seeds map items differently.
+            data: Optional existing bitmap, padded or truncated to size.
+        """
+        self.size_bits = size_bits
+        self.hash_count = hash_count
+        self.seed = seed
+        size_bytes = (size_bits + 7) // 8
+        self._bits = bytearray(size_bytes)
+        if data:
+            self._bits[: min(len(data), size_bytes)] = data[:size_bytes]
+
+    def positions(self, item: str) -> list[int]:
+        """
+        Get the bit positions an item maps to.
+
+        Args:
+            item: Item to hash.
+
+        Returns:
+            ``hash_count`` bit offsets within the filter.
+        """
+        digest = hashlib.blake2b(
+            item.encode(), digest_size=16, key=self.seed[:64]
+        ).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [(h1 + i * h2) % self.size_bits for i in range(self.hash_count)]
+
+    def add(self, item: str) -> None:
+        """Add an item to the filter."""
+        for position in self.positions(item):
+            self._bits[position >> 3] |= 0x80 >> (position & 7)
+
+    def merge(self, other: BloomFilter) -> None:
+        """Set every bit that is set in another filter of the same shape."""
+        for index, byte in enumerate(other._bits):
+            self._bits[index] |= byte
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (0x80 >> (position & 7))
+            for position in self.positions(item)
+        )
+
+    def to_bytes(self) -> bytes:
+        """Return the filter's bitmap."""
+        return bytes(self._bits)
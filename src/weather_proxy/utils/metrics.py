@@ -4,6 +4,7 @@ from flask import Blueprint, Response
 from prometheus_client import (
     CONTENT_TYPE_LATEST,
     Counter,
+    Gauge,
     Histogram,
     Info,
     generate_latest,
@@ -27,6 +28,12 @@ CACHE_HITS = Counter("weather_cache_hits_total", "Total number of cache hits")
 
 CACHE_MISSES = Counter("weather_cache_misses_total", "Total number of cache misses")
 
+LOCAL_CACHE_REQUESTS = Counter(
+    "weather_local_cache_requests_total",
+    "In-process L1 cache lookups",
+    ["cache", "result"],
+)
+
 EXTERNAL_API_CALLS = Counter(
     "weather_external_api_calls_total",
     "Total number of external API calls",
@@ -39,6 +46,91 @@ CIRCUIT_BREAKER_STATE = Counter(
     ["service", "state"],
 )
 
+SINGLE_FLIGHT_CALLS = Counter(
+    "weather_single_flight_calls_total",
+    "Cache-miss fetches by single-flight role",
+    ["role"],
+)
+
+FETCH_LEASES = Counter(
+    "weather_fetch_lease_total",
+    "Distributed fetch lease outcomes on cache misses",
+    ["outcome"],
+)
+
+REFRESH_AHEAD = Counter(
+    "weather_refresh_ahead_total",
+    "Refresh-ahead outcomes for hot cities",
+    ["outcome"],
+)
+
+HOT_CITY_REQUESTS = Gauge(
+    "weather_hot_city_requests",
+    "Requests in the current and previous window for the top cities across workers",
+    ["city"],
+)
+
+DEGRADED_RESPONSES = Counter(
+    "weather_degraded_responses_total",
+    "Responses served from last-known-good data during upstream outages",
+)
+
+EARLY_REFRESHES = Counter(
+    "weather_early_refreshes_total",
+    "Background refreshes started before soft expiry by the XFetch rule",
+)
+
+NEGATIVE_CACHE_HITS = Counter(
+    "weather_negative_cache_hits_total",
+    "City lookups answered as not found from the negative cache",
+)
+
+NOT_FOUND_FILTER_REJECTIONS = Counter(
+    "weather_not_found_filter_rejections_total",
+    "City queries rejected by the not-found Bloom filter and negative cache",
+)
+
+MICROBATCH_SIZE = Histogram(
+    "weather_microbatch_size",
+    "Distinct locations per micro-batched upstream forecast request",
+    buckets=(1, 2, 5, 10, 20, 50, 100),
+)
+
+RETRIES = Counter(
+    "weather_upstream_retries_total",
+    "Upstream retry decisions after a retryable failure",
+    ["outcome"],
+)
+
+HEDGES = Counter(
+    "weather_upstream_hedges_total",
+    "Upstream hedging decisions for calls slower than the hedge delay",
+    ["upstream", "outcome"],
+)
+
+HEDGE_DELAY = Gauge(
+    "weather_upstream_hedge_delay_seconds",
+    "Current delay before a duplicate upstream request is sent",
+    ["upstream"],
+)
+
+DEADLINES_EXCEEDED = Counter(
+    "weather_deadlines_exceeded_total",
+    "Request stages skipped because the request deadline had passed",
+    ["stage"],
+)
+
+IO_EXECUTOR_PENDING = Gauge(
+    "weather_io_executor_pending",
+    "Tasks queued or running on the background I/O executor",
+)
+
+IO_EXECUTOR_TASKS = Counter(
+    "weather_io_executor_tasks_total",
+    "Background I/O executor task outcomes",
+    ["outcome"],
+)
+
 APP_INFO = Info("weather_proxy", "Weather Proxy Service information")
 
 
@@ -63,6 +155,93 @@ def record_cache_miss() -> None:
     CACHE_MISSES.inc()
 
 
+def record_local_cache_hit(cache: str) -> None:
+    """Record an in-process L1 cache hit."""
+    LOCAL_CACHE_REQUESTS.labels(cache=cache, result="hit").inc()
+
+
+def record_local_cache_miss(cache: str) -> None:
+    """Record an in-process L1 cache miss."""
+    LOCAL_CACHE_REQUESTS.labels(cache=cache, result="miss").inc()
+
+
+def record_single_flight(role: str) -> None:
+    """Record a coalesced fetch as either the leader or a waiter."""
+    SINGLE_FLIGHT_CALLS.labels(role=role).inc()
+
+
+def record_fetch_lease(outcome: str) -> None:
+    """Record a fetch lease outcome (acquired, waited, fallback)."""
+    FETCH_LEASES.labels(outcome=outcome).inc()
+
+
+def record_refresh_ahead(outcome: str) -> None:
+    """Record a refresh-ahead outcome (refreshed, skipped, error)."""
+    REFRESH_AHEAD.labels(outcome=outcome).inc()
+
+
+def record_hot_cities(top: list[tuple[str, int]]) -> None:
+    """Replace the hot-city gauges with the latest top-K snapshot."""
+    HOT_CITY_REQUESTS.clear()
+    for city, count in top:
+        HOT_CITY_REQUESTS.labels(city=city).set(count)
+
+
+def record_degraded_response() -> None:
+    """Record a response served from last-known-good data."""
+    DEGRADED_RESPONSES.inc()
+
+
+def record_early_refresh() -> None:
+    """Record a refresh started early by the XFetch rule."""
+    EARLY_REFRESHES.inc()
+
+
+def record_negative_cache_hit() -> None:
+    """Record a not-found answer served from the negative cache."""
+    NEGATIVE_CACHE_HITS.inc()
+
+
+def record_not_found_filter_rejection() -> None:
+    """Record a filter hit confirmed by the negative cache."""
+    NOT_FOUND_FILTER_REJECTIONS.inc()
+
+
+def record_microbatch(size: int) -> None:
+    """Record the number of locations in a micro-batched request."""
+    MICROBATCH_SIZE.observe(size)
+
+
+def record_retry(outcome: str) -> None:
+    """Record a retry decision (retried, budget_exhausted, deadline)."""
+    RETRIES.labels(outcome=outcome).inc()
+
+
+def record_hedge(upstream: str, outcome: str) -> None:
+    """Record a hedging decision (sent, won, budget_exhausted)."""
+    HEDGES.labels(upstream=upstream, outcome=outcome).inc()
+
+
+def record_hedge_delay(upstream: str, seconds: float) -> None:
+    """Record the current hedge delay of an upstream."""
+    HEDGE_DELAY.labels(upstream=upstream).set(seconds)
+
+
+def record_deadline_exceeded(stage: str) -> None:
+    """Record a request stage skipped for lack of time."""
+    DEADLINES_EXCEEDED.labels(stage=stage).inc()
+
+
+def record_io_executor_pending(count: int) -> None:
+    """Record the number of tasks queued or running on the I/O executor."""
+    IO_EXECUTOR_PENDING.set(count)
+
+
+def record_io_executor_task(outcome: str) -> None:
+    """Record an I/O executor task outcome (completed, failed, timeout, rejected)."""
+    IO_EXECUTOR_TASKS.labels(outcome=outcome).inc()
+
+
 def record_external_call(service: str, status: str) -> None:
     """Record an external API call."""
     EXTERNAL_API_CALLS.labels(service=service, status=status).inc()
@@ -0,0 +1,162 @@
+"""Normalization of city queries into stable cache keys."""
+
+import re
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+
+# ISO 3166-1 alpha-2 codes accepted as a trailing ", XX" country hint
+COUNTRY_CODES = frozenset(
+    (  # noqa: SIM905 - one line per code is much longer
+        "AD AE AF AG AI AL AM AO AQ AR AS AT AU AW AX AZ BA BB BD BE BF BG "
+        "BH BI BJ BL BM BN BO BQ BR BS BT BV BW BY BZ CA CC CD CF CG CH CI "
+        "CK CL CM CN CO CR CU CV CW CX CY CZ DE DJ DK DM DO DZ EC EE EG EH "
+        "ER ES ET FI FJ FK FM FO FR GA GB GD GE GF GG GH GI GL GM GN GP GQ "
+        "GR GS GT GU GW GY HK HM HN HR HT HU ID IE IL IM IN IO IQ IR IS IT "
+        "JE JM JO JP KE KG KH KI KM KN KP KR KW KY KZ LA LB LC LI LK LR LS "
+        "LT LU LV LY MA MC MD ME MF MG MH MK ML MM MN MO MP MQ MR MS MT MU "
+        "MV MW MX MY MZ NA NC NE NF NG NI NL NO NP NR NU NZ OM PA PE PF PG "
+        "PH PK PL PM PN PR PS PT PW PY QA RE RO RS RU RW SA SB SC SD SE SG "
+        "SH SI SJ SK SL SM SN SO SR SS ST SV SX SY SZ TC TD TF TG TH TJ TK "
+        "TL TM TN TO TR TT TV TW TZ UA UG UM US UY UZ VA VC VE VG VI VN VU "
+        "WF WS YE YT ZA ZM ZW"
+    ).split()
+)
+
+# Common country names and aliases accepted as a trailing hint, normalized
+COUNTRY_NAMES = {
+    "argentina": "AR",
+    "australia": "AU",
+    "austria": "AT",
+    "belgium": "BE",
+    "brazil": "BR",
+    "canada": "CA",
+    "chile": "CL",
+    "china": "CN",
+    "colombia": "CO",
+    "czech republic": "CZ",
+    "czechia": "CZ",
+    "denmark": "DK",
+    "egypt": "EG",
+    "england": "GB",
+    "finland": "FI",
+    "france": "FR",
+    "germany": "DE",
+    "greece": "GR",
+    "hungary": "HU",
+    "india": "IN",
+    "indonesia": "ID",
+    "ireland": "IE",
+    "israel": "IL",
+    "italy": "IT",
+    "japan": "JP",
+    "kenya": "KE",
+    "mexico": "MX",
+    "morocco": "MA",
+    "netherlands": "NL",
+    "new zealand": "NZ",
+    "nigeria": "NG",
+    "norway": "NO",
+    "peru": "PE",
+    "philippines": "PH",
+    "poland": "PL",
+    "portugal": "PT",
+    "romania": "RO",
+    "russia": "RU",
+    "saudi arabia": "SA",
+    "scotland": "GB",
+    "south africa": "ZA",
+    "south korea": "KR",
+    "spain": "ES",
+    "sweden": "SE",
+    "switzerland": "CH",
+    "thailand": "TH",
+    "the netherlands": "NL",
+    "turkey": "TR",
+    "turkiye": "TR",
+    "uk": "GB",
+    "ukraine": "UA",
+    "united arab emirates": "AE",
+    "united kingdom": "GB",
+    "united states": "US",
+    "united states of america": "US",
+    "usa": "US",
+    "vietnam": "VN",
+    "wales": "GB",
+}
+
+# Letters that do not decompose into a base letter plus combining accents
+_FOLDED_LETTERS = str.maketrans(
+    {"ß": "ss", "æ": "ae", "ø": "o", "œ": "oe", "đ": "d", "ł": "l", "ı": "i"}
+)
+_SEPARATORS = re.compile(r"[\W_]+")
+
+
+@dataclass(frozen=True)
+class NormalizedQuery:
+    """A city query reduced to its canonical name and optional country."""
+
+    name: str
+    country_code: str | None = None
+
+    @property
+    def key(self) -> str:
+        """Cache key of the query; equivalent spellings share it."""
+        if self.country_code is None:
+            return self.name
+        return f"{self.name},{self.country_code.lower()}"
+
+
+def normalize_text(text: str) -> str:
+    """
+    Fold text into a canonical form for comparison.
+
+    Applies Unicode NFKC, case folding and accent folding, then collapses
+    runs of whitespace and punctuation into single spaces.
+
+    Args:
+        text: Text to normalize.
+
+    Returns:
+        Normalized text, e.g. ``"Saint-Étienne "`` becomes ``"saint etienne"``.
+    """
+    text = unicodedata.normalize("NFKC", text).casefold().translate(_FOLDED_LETTERS)
+    text = "".join(
+        char
+        for char in unicodedata.normalize("NFKD", text)
+        if not unicodedata.combining(char)
+    )
+    return _SEPARATORS.sub(" ", text).strip()
+
+
+@lru_cache(maxsize=4096)
+def normalize_query(query: str) -> NormalizedQuery:
+    """
+    Normalize a city query, splitting off a trailing country as a hint.
+
+    A suffix after the last comma is taken as the country when it is an
+    ISO 3166-1 alpha-2 code or a known country name, so ``"Paris, France"``
+    and ``"paris,FR"`` normalize alike. Other suffixes stay part of the name.
+    Results are memoized since this runs on every request.
+
+    Args:
+        query: City name as requested by the client.
+
+    Returns:
+        The normalized query.
+    """
+    head, comma, tail = query.rpartition(",")
+    if comma:
+        name = normalize_text(head)
+        suffix = normalize_text(tail)
+        country_code = COUNTRY_NAMES.get(suffix)
+        if country_code is None and suffix.upper() in COUNTRY_CODES:
+            country_code = suffix.upper()
+        if name and country_code is not None:
+            return NormalizedQuery(name, country_code)
+    return NormalizedQuery(normalize_text(query))
+
+
+def query_key(query: str) -> str:
+    """Get the cache key of a city query."""
+    return normalize_query(query).key
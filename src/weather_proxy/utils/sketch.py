@@ -0,0 +1,117 @@
+"""Streaming frequency estimation: count-min sketch with a top-K heap."""
+
+import hashlib
+import heapq
+
+
+class CountMinSketch:
+    """
+    Approximate item counts in fixed memory.
+
+    Estimates never undercount; with ``width`` w and ``depth`` d they
+    overcount by at most about 2N/w with probability 1 - 2^-d, where N
+    is the total of all counts.
+    """
+
+    def __init__(self, width: int, depth: int) -> None:
+        """
+        Initialize count-min sketch.
+
+        Args:
+            width: Counters per row.
+            depth: Number of rows, each with its own hash.
+        """
+        self.width = width
+        self.depth = depth
+        self._rows = [[0] * width for _ in range(depth)]
+
+    def _columns(self, item: str) -> list[int]:
+        """Get the counter index of an item in each row."""
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [(h1 + row * h2) % self.width for row in range(self.depth)]
+
+    def add(self, item: str, count: int = 1) -> int:
+        """
+        Add to an item's count.
+
+        Args:
+            item: Item to count.
+            count: Amount to add.
+
+        Returns:
+            The item's new estimated count.
+        """
+        estimate = None
+        for row, column in zip(self._rows, self._columns(item), strict=True):
+            row[column] += count
+            estimate = row[column] if estimate is None else min(estimate, row[column])
+        return estimate or 0
+
+    def estimate(self, item: str) -> int:
+        """Get an item's estimated count."""
+        return min(
+            row[column]
+            for row, column in zip(self._rows, self._columns(item), strict=True)
+        )
+
+
+class TopK:
+    """
+    Track the ``k`` items with the highest counts seen so far.
+
+    Counts come from an external estimator such as a count-min sketch.
+    A min-heap orders the tracked items; entries whose count has since
+    grown are skipped lazily when they surface.
+    """
+
+    def __init__(self, k: int) -> None:
+        """
+        Initialize top-K tracker.
+
+        Args:
+            k: Number of items to keep.
+        """
+        self.k = k
+        self._counts: dict[str, int] = {}
+        self._heap: list[tuple[int, str]] = []
+
+    def update(self, item: str, count: int) -> None:
+        """
+        Offer an item with its current estimated count.
+
+        Args:
+            item: Item that was counted.
+            count: Its current estimated count.
+        """
+        if self.k <= 0:
+            return
+        if item in self._counts or len(self._counts) < self.k:
+            self._counts[item] = count
+            heapq.heappush(self._heap, (count, item))
+        elif count > self._min_count():
+            _, evicted = heapq.heappop(self._heap)
+            del self._counts[evicted]
+            self._counts[item] = count
+            heapq.heappush(self._heap, (count, item))
+        self._compact()
+
+    def _min_count(self) -> int:
+        """Get the smallest tracked count, dropping outdated heap entries."""
+        while self._heap[0][0] != self._counts.get(self._heap[0][1]):
+            heapq.heappop(self._heap)
+        return self._heap[0][0]
+
+    def _compact(self) -> None:
+        """Rebuild the heap once outdated entries dominate it."""
+        if len(self._heap) > 4 * max(self.k, 16):
+            self._heap = [(count, item) for item, count in self._counts.items()]
+            heapq.heapify(self._heap)
+
+    def items(self) -> list[tuple[str, int]]:
+        """Get the tracked items, highest count first."""
+        return sorted(self._counts.items(), key=lambda pair: (-pair[1], pair[0]))
+
+    def __len__(self) -> int:
+        return len(self._counts)
@@ -1,12 +1,31 @@
 """Pytest configuration and fixtures."""
 
-from unittest.mock import MagicMock, patch
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from flask import Flask
 from flask.testing import FlaskClient
 
 from weather_proxy.app import create_app
+from weather_proxy.services.cache_service import CacheEntry
+
+
+def stored_entry(
+    value: dict[str, Any],
+    soft_ttl: float = 300,
+    stale_ttl: float = 300,
+    age: float = 60,
+) -> str:
+    """Serialize a value the way the cache services store it in Redis."""
+    now = time.time()
+    return CacheEntry.from_payload(
+        payload=value,
+        fetched_at=now - age,
+        soft_expires_at=now + soft_ttl,
+        expires_at=now + soft_ttl + stale_ttl,
+    ).encode()
 
 
 @pytest.fixture
@@ -36,24 +55,66 @@ def runner(app: Flask):
 @pytest.fixture
 def mock_redis():
     """Mock Redis client for tests that don't need real Redis."""
-    with patch("weather_proxy.services.cache_service.redis.from_url") as mock:
+    from weather_proxy.routes.weather import reset_cache_service
+
+    with (
+        patch("weather_proxy.services.cache_service.redis.from_url") as mock,
+        patch("weather_proxy.services.location_aliases.redis.from_url", new=mock),
+    ):
+        # Drop clients created before the patch so routes pick up the mock
+        reset_cache_service()
         mock_client = MagicMock()
         mock.return_value = mock_client
         # Default to cache miss
         mock_client.get.return_value = None
+        mock_client.hget.return_value = None
         mock_client.ping.return_value = True
         yield mock_client
 
 
+@pytest.fixture
+def anyio_backend() -> str:
+    """Run async tests on asyncio only."""
+    return "asyncio"
+
+
+@pytest.fixture
+def async_redis():
+    """Mock asyncio Redis client for the async services."""
+    with patch(
+        "weather_proxy.services.async_cache_service.redis.asyncio.from_url"
+    ) as mock:
+        mock_client = AsyncMock()
+        mock.return_value = mock_client
+        # Default to cache miss with leases available
+        mock_client.get.return_value = None
+        mock_client.set.return_value = True
+        mock_client.ping.return_value = True
+        yield mock_client
+
+
+@pytest.fixture
+async def async_http_client():
+    """Close the shared async HTTP client, which is bound to the test's loop."""
+    from weather_proxy.services.async_http_client import close_async_http_client
+
+    yield
+    await close_async_http_client()
+
+
 @pytest.fixture(autouse=True)
 def reset_cache():
     """Reset cache service, circuit breakers, and clear cache data before each test."""
     from weather_proxy.resilience.circuit_breaker import reset_circuit_breakers
+    from weather_proxy.resilience.hedging import reset_hedgers
+    from weather_proxy.resilience.retry_budget import reset_retry_budget
     from weather_proxy.routes.weather import get_cache_service, reset_cache_service
 
     # Reset all module-level state
     reset_cache_service()
     reset_circuit_breakers()
+    reset_retry_budget()
+    reset_hedgers()
 
     # Clear all cached data from Redis test database
     try:
@@ -67,3 +128,5 @@ def reset_cache():
     # Cleanup after test
     reset_cache_service()
     reset_circuit_breakers()
+    reset_retry_budget()
+    reset_hedgers()
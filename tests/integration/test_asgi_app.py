@@ -0,0 +1,243 @@
+"""Integration tests for the ASGI app."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+import respx
+from prometheus_client import REGISTRY
+
+from tests.conftest import stored_entry
+from weather_proxy.asgi import AsyncWeatherApp, create_async_app
+from weather_proxy.resilience.deadline import stage_timeout
+
+CACHED_BERLIN = {
+    "city": "Berlin",
+    "country": "Germany",
+    "coordinates": {"latitude": 52.52, "longitude": 13.41},
+    "current": {"temperature": 15.5, "weather_code": 3},
+}
+
+BERLIN_RESULTS = {
+    "results": [
+        {
+            "name": "Berlin",
+            "latitude": 52.52,
+            "longitude": 13.41,
+            "country": "Germany",
+            "country_code": "DE",
+        }
+    ]
+}
+
+CURRENT_WEATHER = {
+    "current": {
+        "time": 1_700_000_000,
+        "temperature_2m": 15.5,
+        "relative_humidity_2m": 65,
+        "apparent_temperature": 14.2,
+        "weather_code": 3,
+        "wind_speed_10m": 12.5,
+        "precipitation": 0,
+        "is_day": 1,
+    },
+    "current_units": {"temperature_2m": "°C", "wind_speed_10m": "km/h"},
+}
+
+
+def _single_flight_calls(role: str) -> float:
+    """Read the single-flight counter of a role."""
+    value = REGISTRY.get_sample_value(
+        "weather_single_flight_calls_total", {"role": role}
+    )
+    return value or 0.0
+
+
+@pytest.fixture
+async def asgi_app() -> AsyncIterator[AsyncWeatherApp]:
+    """Create the ASGI app on mocked Redis."""
+    app = create_async_app()
+    yield app
+    await app.close()
+
+
+@pytest.fixture
+async def asgi_client(
+    asgi_app: AsyncWeatherApp,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Create an HTTP client that calls the ASGI app in-process."""
+    transport = httpx.ASGITransport(app=asgi_app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://testserver"
+    ) as client:
+        yield client
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+@pytest.mark.usefixtures("async_redis", "async_http_client")
+class TestAsgiApp:
+    """Tests for the ASGI app."""
+
+    async def test_api_root(self, asgi_client: httpx.AsyncClient) -> None:
+        """The root endpoint should describe the API."""
+        response = await asgi_client.get("/")
+
+        assert response.status_code == 200
+        assert response.json()["name"] == "Weather Proxy API"
+
+    async def test_unknown_path(self, asgi_client: httpx.AsyncClient) -> None:
+        """Unknown paths should return a JSON 404."""
+        response = await asgi_client.get("/nope")
+
+        assert response.status_code == 404
+        assert response.json()["error"]["code"] == "NOT_FOUND"
+
+    async def test_missing_city(self, asgi_client: httpx.AsyncClient) -> None:
+        """A missing city should be rejected like in the Flask app."""
+        response = await asgi_client.get("/weather")
+
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == "MISSING_PARAMETER"
+
+    async def test_request_id_is_echoed(self, asgi_client: httpx.AsyncClient) -> None:
+        """A client X-Request-ID should be used in the response."""
+        response = await asgi_client.get(
+            "/weather", headers={"X-Request-ID": "req-123"}
+        )
+
+        assert response.headers["X-Request-ID"] == "req-123"
+        assert response.json()["error"]["request_id"] == "req-123"
+
+    @respx.mock
+    async def test_weather_miss_fetches_and_caches(
+        self, asgi_client: httpx.AsyncClient, async_redis: AsyncMock
+    ) -> None:
+        """A miss should fetch from upstream and write the shared cache."""
+        respx.get("https://geocoding-api.open-meteo.com/v1/search").mock(
+            return_value=httpx.Response(200, json=BERLIN_RESULTS)
+        )
+        respx.get("https://api.open-meteo.com/v1/forecast").mock(
+            return_value=httpx.Response(200, json=CURRENT_WEATHER)
+        )
+
+        response = await asgi_client.get("/weather", params={"city": "Berlin"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["city"] == "Berlin"
+        assert data["current"]["temperature"] == 15.5
+        assert data["cached"] is False
+        written = [call.args[0] for call in async_redis.set.await_args_list]
+        assert "weather:berlin" in written
+        assert "lkg:berlin" in written
+
+    async def test_weather_cache_hit(
+        self, asgi_client: httpx.AsyncClient, async_redis: AsyncMock
+    ) -> None:
+        """A fresh entry should be served without calling upstream."""
+        async_redis.get.return_value = stored_entry(CACHED_BERLIN, soft_ttl=600)
+
+        response = await asgi_client.get("/weather", params={"city": "Berlin"})
+
+        assert response.status_code == 200
+        assert response.json()["cached"] is True
+        assert response.json()["stale"] is False
+        assert response.headers["Age"] == "60"
+
+    @respx.mock
+    async def test_weather_city_not_found(self, asgi_client: httpx.AsyncClient) -> None:
+        """An unknown city should return 404."""
+        respx.get("https://geocoding-api.open-meteo.com/v1/search").mock(
+            return_value=httpx.Response(200, json={"results": []})
+        )
+
+        response = await asgi_client.get("/weather", params={"city": "Nowhere"})
+
+        assert response.status_code == 404
+        assert response.json()["error"]["code"] == "CITY_NOT_FOUND"
+
+    async def test_concurrent_misses_fetch_once(
+        self, asgi_app: AsyncWeatherApp, asgi_client: httpx.AsyncClient
+    ) -> None:
+        """Concurrent misses for one key should share a single upstream fetch."""
+        calls = 0
+
+        async def fetch(_city: str, _cache_key: str) -> dict:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return CACHED_BERLIN
+
+        asgi_app._fetch_and_cache = fetch  # type: ignore[method-assign]
+        waiters_before = _single_flight_calls("waiter")
+
+        responses = await asyncio.gather(
+            *(asgi_client.get("/weather", params={"city": "Berlin"}) for _ in range(20))
+        )
+
+        assert all(r.status_code == 200 for r in responses)
+        assert calls == 1
+        # Same role labels as the Flask app's SingleFlight
+        assert _single_flight_calls("waiter") - waiters_before == 19
+
+    async def test_client_timeout_header_shortens_wait(
+        self, asgi_app: AsyncWeatherApp, asgi_client: httpx.AsyncClient
+    ) -> None:
+        """A miss slower than the client's budget should fail fast with 503."""
+
+        async def fetch(_city: str, _cache_key: str) -> dict:
+            await asyncio.sleep(1)
+            return CACHED_BERLIN
+
+        asgi_app._fetch_and_cache = fetch  # type: ignore[method-assign]
+
+        started = time.monotonic()
+        response = await asgi_client.get(
+            "/weather", params={"city": "Berlin"}, headers={"X-Request-Timeout": "0.05"}
+        )
+
+        assert response.status_code == 503
+        assert time.monotonic() - started < 0.5
+
+    async def test_short_leader_deadline_does_not_fail_followers(
+        self, asgi_app: AsyncWeatherApp, asgi_client: httpx.AsyncClient
+    ) -> None:
+        """A coalesced fetch should not inherit the first caller's deadline."""
+        started = asyncio.Event()
+
+        async def fetch(_city: str, _cache_key: str) -> dict:
+            started.set()
+            await asyncio.sleep(0.2)
+            stage_timeout("weather", 5)
+            return CACHED_BERLIN
+
+        asgi_app._fetch_and_cache = fetch  # type: ignore[method-assign]
+
+        leader = asyncio.ensure_future(
+            asgi_client.get(
+                "/weather",
+                params={"city": "Berlin"},
+                headers={"X-Request-Timeout": "0.05"},
+            )
+        )
+        await asyncio.wait_for(started.wait(), 1)
+        response = await asgi_client.get("/weather", params={"city": "Berlin"})
+
+        assert (await leader).status_code == 503
+        assert response.status_code == 200
+        assert response.json()["current"] == CACHED_BERLIN["current"]
+
+    async def test_health(self, asgi_client: httpx.AsyncClient) -> None:
+        """Health should report dependency states."""
+        with respx.mock:
+            respx.get("https://api.open-meteo.com/v1/forecast").mock(
+                return_value=httpx.Response(200, json=CURRENT_WEATHER)
+            )
+            response = await asgi_client.get("/health")
+
+        assert response.status_code == 200
+        assert response.json()["dependencies"]["redis"] == "connected"
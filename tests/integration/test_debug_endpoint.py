@@ -0,0 +1,103 @@
+"""Integration tests for /debug endpoints."""
+
+import threading
+import time
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask.testing import FlaskClient
+
+from tests.conftest import stored_entry
+from weather_proxy.app import create_app
+from weather_proxy.config import get_config
+from weather_proxy.routes import weather
+from weather_proxy.services.cache_service import CacheEntry
+
+
+@pytest.fixture
+def tracking_client() -> Iterator[FlaskClient]:
+    """Create a test client of an app with heavy-hitter tracking enabled."""
+    with patch.object(get_config(), "heavy_hitters_enabled", True):
+        yield create_app(config_override={"TESTING": True}).test_client()
+
+
+@pytest.mark.integration
+class TestHotCitiesEndpoint:
+    """Tests for the hot cities debug endpoint."""
+
+    def test_hot_cities_lists_requested_cities(
+        self, tracking_client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """Served cities should appear in the local top list."""
+        now = time.time()
+        mock_redis.get.return_value = CacheEntry.from_payload(
+            {"city": "Berlin", "current": {"temperature": 15.5}},
+            fetched_at=now,
+            soft_expires_at=now + 300,
+            expires_at=now + 600,
+        ).encode()
+
+        tracking_client.get("/weather?city=Berlin")
+        tracking_client.get("/weather?city=berlin")
+        tracking_client.get("/weather?city=Paris")
+        response = tracking_client.get("/debug/hot-cities")
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["local"] == [
+            {"city": "berlin", "count": 2},
+            {"city": "paris", "count": 1},
+        ]
+        assert data["global"] == []
+
+    def test_due_flush_runs_off_request_thread(
+        self, tracking_client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """A due flush to Redis should not run on the request thread."""
+        mock_redis.get.return_value = stored_entry(
+            {"city": "Berlin", "current": {"temperature": 15.5}}
+        )
+        tracker = weather.get_heavy_hitters()
+        tracker._next_flush = 0
+        flushed = threading.Event()
+        threads = []
+
+        def flush() -> bool:
+            threads.append(threading.current_thread())
+            flushed.set()
+            return True
+
+        with patch.object(tracker, "flush", new=flush):
+            tracking_client.get("/weather?city=Berlin")
+            assert flushed.wait(2)
+
+        assert threads != [threading.current_thread()]
+
+    @pytest.mark.usefixtures("mock_redis")
+    def test_hot_cities_not_tracked_when_disabled(self, client: FlaskClient) -> None:
+        """Requests should not be counted or exposed when tracking is off."""
+        client.get("/weather?city=Berlin")
+
+        assert weather.get_heavy_hitters().local_top() == []
+        assert client.get("/debug/hot-cities").status_code == 404
+        assert "GET /debug/hot-cities" not in client.get("/").get_json()["endpoints"]
+
+    def test_cities_tracked_when_l1_admission_configured(
+        self, client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """L1 admission alone should count cities so popular ones get admitted."""
+        now = time.time()
+        mock_redis.get.return_value = CacheEntry.from_payload(
+            {"city": "Berlin", "current": {"temperature": 15.5}},
+            fetched_at=now,
+            soft_expires_at=now + 300,
+            expires_at=now + 600,
+        ).encode()
+
+        with patch.object(get_config(), "heavy_hitters_l1_min_count", 2):
+            client.get("/weather?city=Berlin")
+            client.get("/weather?city=Berlin")
+
+            assert weather.get_heavy_hitters().local_top() == [("berlin", 2)]
+            assert weather._admit_to_l1("berlin")
@@ -0,0 +1,73 @@
+"""Integration tests for refresh-ahead of hot cities."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask.testing import FlaskClient
+
+from tests.conftest import stored_entry
+from weather_proxy.config import get_config
+from weather_proxy.routes import weather
+
+CACHED_BERLIN = {"city": "Berlin", "current": {"temperature": 15.5}}
+
+
+@pytest.mark.integration
+class TestRefreshAhead:
+    """Tests for the refresh-ahead wiring of the weather routes."""
+
+    def test_hot_cities_combine_config_and_traffic(
+        self, client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """Hot cities should be the configured list plus observed traffic."""
+        mock_redis.get.return_value = stored_entry(CACHED_BERLIN, soft_ttl=300, age=0)
+
+        with (
+            patch.object(get_config(), "refresh_ahead_enabled", True),
+            patch.object(get_config(), "refresh_ahead_cities", ["Berlin"]),
+        ):
+            client.get("/weather?city=Paris")
+            client.get("/weather?city=berlin")
+            hot = weather._hot_cities()
+
+        assert hot == ["Berlin", "paris"]
+
+    def test_refresh_ahead_skips_entries_far_from_expiry(
+        self, mock_redis: MagicMock
+    ) -> None:
+        """Entries with plenty of freshness left should not be re-fetched."""
+        mock_redis.get.return_value = stored_entry(CACHED_BERLIN, soft_ttl=300, age=0)
+
+        with patch.object(weather, "_fetch_from_upstream") as fetch:
+            assert weather._refresh_ahead("Berlin") is False
+
+        fetch.assert_not_called()
+
+    def test_refresh_ahead_fetches_entries_near_expiry(
+        self, mock_redis: MagicMock
+    ) -> None:
+        """Entries inside the margin should be re-fetched under a lease."""
+        mock_redis.get.return_value = stored_entry(CACHED_BERLIN, soft_ttl=10, age=0)
+        mock_redis.set.return_value = True
+
+        with patch.object(weather, "_fetch_from_upstream") as fetch:
+            assert weather._refresh_ahead("Berlin") is True
+
+        fetch.assert_called_once_with("Berlin", "berlin")
+        mock_redis.eval.assert_called_once()
+
+    def test_refresh_ahead_skips_entries_refreshed_under_the_lease(
+        self, mock_redis: MagicMock
+    ) -> None:
+        """An entry another worker refreshed before the lease should be kept."""
+        mock_redis.get.side_effect = [
+            stored_entry(CACHED_BERLIN, soft_ttl=10, age=0),
+            stored_entry(CACHED_BERLIN, soft_ttl=300, age=0),
+        ]
+        mock_redis.set.return_value = True
+
+        with patch.object(weather, "_fetch_from_upstream") as fetch:
+            assert weather._refresh_ahead("Berlin") is False
+
+        fetch.assert_not_called()
+        mock_redis.eval.assert_called_once()
@@ -0,0 +1,189 @@
+"""Integration tests for /weather/batch endpoint."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+import respx
+from flask.testing import FlaskClient
+
+from weather_proxy.config import get_config
+from weather_proxy.services.cache_service import CacheEntry
+
+GEOCODING_RESULTS = {
+    "Berlin": {"latitude": 52.52, "longitude": 13.41, "name": "Berlin"},
+    "Paris": {"latitude": 48.85, "longitude": 2.35, "name": "Paris"},
+}
+
+
+def _geocode(request: httpx.Request) -> httpx.Response:
+    """Resolve known city names, return no results for anything else."""
+    result = GEOCODING_RESULTS.get(request.url.params["name"])
+    return httpx.Response(200, json={"results": [result] if result else []})
+
+
+@pytest.mark.integration
+class TestWeatherBatchEndpoint:
+    """Tests for the batch weather endpoint."""
+
+    def test_batch_requires_cities_list(self, client: FlaskClient) -> None:
+        """Batch endpoint should return 400 without a cities list."""
+        response = client.post("/weather/batch", json={})
+        assert response.status_code == 400
+        assert response.get_json()["error"]["code"] == "MISSING_PARAMETER"
+
+    def test_batch_rejects_oversized_batch(self, client: FlaskClient) -> None:
+        """Batch endpoint should return 400 when too many cities are sent."""
+        response = client.post("/weather/batch", json={"cities": ["Berlin"] * 201})
+        assert response.status_code == 400
+        assert response.get_json()["error"]["code"] == "INVALID_PARAMETER"
+
+    @respx.mock
+    def test_batch_returns_results_in_input_order(self, client: FlaskClient) -> None:
+        """Results should follow input order with a status per city."""
+        respx.get("https://geocoding-api.open-meteo.com/v1/search").mock(
+            side_effect=_geocode
+        )
+        forecast = respx.get("https://api.open-meteo.com/v1/forecast").mock(
+            return_value=httpx.Response(
+                200,
+                json=[
+                    {"current": {"temperature_2m": 20.0, "weather_code": 0}},
+                    {"current": {"temperature_2m": 15.5, "weather_code": 3}},
+                ],
+            )
+        )
+
+        response = client.post(
+            "/weather/batch", json={"cities": ["Paris", "Nowhere", "", "Berlin"]}
+        )
+
+        assert response.status_code == 200
+        results = response.get_json()["results"]
+        assert [r["status"] for r in results] == ["ok", "not_found", "invalid", "ok"]
+        assert results[0]["data"]["city"] == "Paris"
+        assert results[0]["data"]["current"]["temperature"] == 20.0
+        assert results[3]["data"]["current"]["temperature"] == 15.5
+        assert forecast.call_count == 1
+
+    @respx.mock
+    def test_batch_serves_cache_hits_without_upstream(
+        self, client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """Cached cities should be read with one MGET and not fetched."""
+        now = time.time()
+        mock_redis.mget.return_value = [
+            CacheEntry.from_payload(
+                {"city": "Berlin", "current": {"temperature": 15.5}},
+                fetched_at=now,
+                soft_expires_at=now + 300,
+                expires_at=now + 600,
+            ).encode()
+        ]
+        forecast = respx.get("https://api.open-meteo.com/v1/forecast")
+
+        response = client.post("/weather/batch", json={"cities": ["Berlin"]})
+
+        result = response.get_json()["results"][0]
+        assert result["status"] == "ok"
+        assert result["cached"] is True
+        assert result["data"]["current"]["temperature"] == 15.5
+        assert not forecast.called
+
+    @respx.mock
+    def test_batch_negative_cache_hit_skips_geocoding(
+        self, client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """Known-unknown cities should be reported without geocoding them."""
+        now = time.time()
+        not_found = CacheEntry.from_payload(
+            {"query": "asdfgh"},
+            fetched_at=now,
+            soft_expires_at=now + 60,
+            expires_at=now + 60,
+        ).encode()
+        mock_redis.mget.side_effect = lambda keys: [
+            not_found if key.startswith("notfound:") else None for key in keys
+        ]
+        geocoding = respx.get("https://geocoding-api.open-meteo.com/v1/search")
+
+        response = client.post("/weather/batch", json={"cities": ["asdfgh"]})
+
+        result = response.get_json()["results"][0]
+        assert result["status"] == "not_found"
+        assert result["error"]["code"] == "CITY_NOT_FOUND"
+        assert not geocoding.called
+
+    @respx.mock
+    def test_batch_geocodes_uncached_cities_concurrently(
+        self, client: FlaskClient
+    ) -> None:
+        """Uncached cities should be geocoded in parallel, up to the limit."""
+        cities = [f"City{i}" for i in range(30)]
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def geocode(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            name = request.url.params["name"]
+            return httpx.Response(
+                200,
+                json={"results": [{"latitude": 1.0, "longitude": 2.0, "name": name}]},
+            )
+
+        respx.get("https://geocoding-api.open-meteo.com/v1/search").mock(
+            side_effect=geocode
+        )
+        forecast = respx.get("https://api.open-meteo.com/v1/forecast").mock(
+            return_value=httpx.Response(
+                200,
+                json=[{"current": {"temperature_2m": 20.0}}] * len(cities),
+            )
+        )
+
+        with patch.object(get_config(), "weather_batch_geocoding_concurrency", 4):
+            response = client.post("/weather/batch", json={"cities": cities})
+
+        results = response.get_json()["results"]
+        assert [r["status"] for r in results] == ["ok"] * len(cities)
+        assert [r["data"]["city"] for r in results] == cities
+        assert 1 < peak <= 4
+        assert forecast.call_count == 1
+
+    @respx.mock
+    def test_batch_not_found_filter_skips_geocoding(
+        self, client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """Names rejected by the not-found filter should not be geocoded."""
+        now = time.time()
+        not_found = CacheEntry.from_payload(
+            {"query": "asdfgh"},
+            fetched_at=now,
+            soft_expires_at=now + 60,
+            expires_at=now + 60,
+        ).encode()
+        mock_redis.mget.side_effect = lambda keys: [
+            not_found if key.startswith("notfound:") else None for key in keys
+        ]
+        geocoding = respx.get("https://geocoding-api.open-meteo.com/v1/search")
+
+        with (
+            patch.object(get_config(), "not_found_filter_enabled", True),
+            patch("weather_proxy.routes.weather.get_not_found_filter") as get_filter,
+        ):
+            get_filter.return_value.claim_sync.return_value = False
+            get_filter.return_value.might_contain.return_value = True
+            response = client.post("/weather/batch", json={"cities": ["asdfgh"]})
+
+        result = response.get_json()["results"][0]
+        assert result["status"] == "not_found"
+        assert not geocoding.called
@@ -1,10 +1,28 @@
 """Integration tests for /weather endpoint."""
 
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
 import httpx
 import pytest
 import respx
 from flask.testing import FlaskClient
 
+from tests.conftest import stored_entry
+from weather_proxy.config import get_config
+from weather_proxy.resilience.deadline import remaining, stage_timeout
+from weather_proxy.routes import weather as weather_routes
+from weather_proxy.services.cache_service import CacheEntry
+from weather_proxy.services.io_executor import IOExecutorSaturated
+
+CACHED_BERLIN = {
+    "city": "Berlin",
+    "country": "Germany",
+    "coordinates": {"latitude": 52.52, "longitude": 13.41},
+    "current": {"temperature": 15.5, "weather_code": 3},
+}
+
 
 @pytest.mark.integration
 class TestWeatherEndpoint:
@@ -206,3 +224,600 @@ class TestWeatherEndpoint:
         """Weather endpoint should always return JSON."""
         response = client.get("/weather")
         assert response.content_type == "application/json"
+
+    def test_weather_fresh_cache_hit(
+        self, client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """Weather endpoint should serve fresh cached data without refreshing."""
+        mock_redis.get.return_value = stored_entry(CACHED_BERLIN, soft_ttl=120)
+
+        with patch("weather_proxy.routes.weather._schedule_refresh") as refresh:
+            response = client.get("/weather?city=Berlin")
+
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data["cached"] is True
+        assert data["stale"] is False
+        assert 115 <= data["cache_expires_in"] <= 120
+        assert 55 <= int(response.headers["Age"]) <= 65
+        assert response.content_type == "application/json"
+        assert data["current"] == CACHED_BERLIN["current"]
+        assert data["degraded"] is False
+        assert "request_id" in data
+        refresh.assert_not_called()
+
+    def test_weather_stale_cache_hit_triggers_refresh(
+        self, client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """Stale entries should be served immediately and refreshed once."""
+        mock_redis.get.return_value = stored_entry(CACHED_BERLIN, soft_ttl=-30)
+
+        with patch("weather_proxy.routes.weather._schedule_refresh") as refresh:
+            response = client.get("/weather?city=Berlin")
+
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data["cached"] is True
+        assert data["stale"] is True
+        assert data["current"]["temperature"] == 15.5
+        refresh.assert_called_once_with("Berlin", "berlin")
+
+    @respx.mock
+    def test_weather_serves_last_known_good_on_timeout(
+        self, client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """Upstream timeouts should fall back to the last-known-good copy."""
+        mock_redis.get.side_effect = lambda key: (
+            stored_entry(CACHED_BERLIN, soft_ttl=86000)
+            if key.startswith("lkg:")
+            else None
+        )
+        respx.get("https://geocoding-api.open-meteo.com/v1/search").mock(
+            side_effect=httpx.TimeoutException("Connection timed out")
+        )
+
+        response = client.get("/weather?city=Berlin")
+
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data["degraded"] is True
+        assert data["stale"] is True
+        assert data["city"] == "Berlin"
+
+    def test_weather_io_executor_timeout_serves_last_known_good(
+        self, client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """A miss slower than the executor deadline should fall back."""
+        mock_redis.get.side_effect = lambda key: (
+            stored_entry(CACHED_BERLIN, soft_ttl=86000)
+            if key.startswith("lkg:")
+            else None
+        )
+        release = threading.Event()
+
+        def slow_fetch(_city: str, _cache_key: str) -> dict:
+            release.wait(2)
+            return CACHED_BERLIN
+
+        with (
+            patch.object(get_config(), "io_executor_enabled", True),
+            patch.object(get_config(), "io_executor_timeout_seconds", 0.05),
+            patch("weather_proxy.routes.weather._fetch_and_cache", new=slow_fetch),
+        ):
+            response = client.get("/weather?city=Berlin")
+            release.set()
+
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data["degraded"] is True
+
+    @pytest.mark.usefixtures("mock_redis")
+    def test_weather_io_executor_fetch_outlives_request_deadline(
+        self, client: FlaskClient
+    ) -> None:
+        """A pool fetch should run without the deadline of the waiting request."""
+        budgets: list[float | None] = []
+
+        def fetch(_city: str, _cache_key: str) -> dict:
+            budgets.append(remaining())
+            return CACHED_BERLIN
+
+        with (
+            patch.object(get_config(), "io_executor_enabled", True),
+            patch("weather_proxy.routes.weather._fetch_and_cache", new=fetch),
+        ):
+            response = client.get(
+                "/weather?city=Berlin", headers={"X-Request-Timeout": "5"}
+            )
+
+        assert response.status_code == 200
+        assert budgets == [None]
+
+    @pytest.mark.parametrize("io_executor_enabled", [False, True])
+    @pytest.mark.usefixtures("mock_redis")
+    def test_weather_short_leader_deadline_does_not_fail_followers(
+        self, client: FlaskClient, io_executor_enabled: bool
+    ) -> None:
+        """A coalesced fetch should not inherit the first caller's deadline."""
+        started = threading.Event()
+
+        def fetch(_city: str, _cache_key: str) -> dict:
+            started.set()
+            time.sleep(0.2)
+            stage_timeout("weather", 5)
+            return CACHED_BERLIN
+
+        with (
+            patch.object(get_config(), "io_executor_enabled", io_executor_enabled),
+            patch.object(get_config(), "io_executor_timeout_seconds", 2),
+            patch("weather_proxy.routes.weather._fetch_and_cache", new=fetch),
+        ):
+            leader = threading.Thread(
+                target=client.application.test_client().get,
+                args=("/weather?city=Berlin",),
+                kwargs={"headers": {"X-Request-Timeout": "0.05"}},
+            )
+            leader.start()
+            assert started.wait(2)
+            response = client.get("/weather?city=Berlin")
+            leader.join(2)
+
+        assert response.status_code == 200
+        assert response.get_json()["current"] == CACHED_BERLIN["current"]
+
+    def test_weather_io_executor_saturated_returns_503(
+        self, client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """A miss should be rejected with 503 when the executor is full."""
+        with (
+            patch.object(get_config(), "io_executor_enabled", True),
+            patch(
+                "weather_proxy.routes.weather.get_io_executor",
+                return_value=MagicMock(
+                    submit=MagicMock(side_effect=IOExecutorSaturated("full"))
+                ),
+            ),
+        ):
+            response = client.get("/weather?city=Berlin")
+
+        assert response.status_code == 503
+        assert response.get_json()["error"]["code"] == "SERVICE_UNAVAILABLE"
+        mock_redis.get.assert_any_call("lkg:berlin")
+
+    @respx.mock
+    @pytest.mark.usefixtures("mock_redis")
+    def test_weather_io_executor_fetches_off_request_thread(
+        self, client: FlaskClient
+    ) -> None:
+        """With the executor enabled, a miss should be fetched on a pool thread."""
+        threads = []
+        real_fetch = weather_routes._fetch_and_cache
+
+        def fetch(city: str, cache_key: str) -> dict:
+            threads.append(threading.current_thread().name)
+            return real_fetch(city, cache_key)
+
+        respx.get("https://geocoding-api.open-meteo.com/v1/search").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "results": [
+                        {
+                            "name": "Berlin",
+                            "latitude": 52.52,
+                            "longitude": 13.41,
+                            "country": "Germany",
+                        }
+                    ]
+                },
+            )
+        )
+        respx.get("https://api.open-meteo.com/v1/forecast").mock(
+            return_value=httpx.Response(
+                200, json={"current": {"temperature_2m": 15.5}, "current_units": {}}
+            )
+        )
+
+        with (
+            patch.object(get_config(), "io_executor_enabled", True),
+            patch("weather_proxy.routes.weather._fetch_and_cache", new=fetch),
+        ):
+            response = client.get("/weather?city=Berlin")
+
+        assert response.status_code == 200
+        assert response.get_json()["current"]["temperature"] == 15.5
+        assert threads[0].startswith("weather-io")
+
+    @respx.mock
+    def test_weather_does_not_mask_upstream_errors_with_last_known_good(
+        self, client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """Non-outage upstream errors should still surface as 502."""
+        mock_redis.get.side_effect = lambda key: (
+            stored_entry(CACHED_BERLIN, soft_ttl=86000)
+            if key.startswith("lkg:")
+            else None
+        )
+        respx.get("https://geocoding-api.open-meteo.com/v1/search").mock(
+            return_value=httpx.Response(500)
+        )
+
+        response = client.get("/weather?city=Berlin")
+
+        assert response.status_code == 502
+        assert response.get_json()["error"]["code"] == "GEOCODING_ERROR"
+
+    @respx.mock
+    def test_weather_spent_deadline_serves_last_known_good(
+        self, client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """A request whose budget has run out should not call upstream."""
+        mock_redis.get.side_effect = lambda key: (
+            stored_entry(CACHED_BERLIN, soft_ttl=86000)
+            if key.startswith("lkg:")
+            else None
+        )
+        geocoding = respx.get("https://geocoding-api.open-meteo.com/v1/search")
+
+        response = client.get(
+            "/weather?city=Berlin", headers={"X-Request-Timeout": "0.000001"}
+        )
+
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data["degraded"] is True
+        assert not geocoding.called
+
+    @respx.mock
+    def test_weather_reuses_grid_cell_entry(
+        self, client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """With the grid cache on, a city in a cached cell skips the forecast."""
+        mock_redis.get.side_effect = lambda key: (
+            stored_entry(CACHED_BERLIN["current"], soft_ttl=120)
+            if key == "cell:0.1:525:134"
+            else None
+        )
+        respx.get("https://geocoding-api.open-meteo.com/v1/search").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "results": [
+                        {
+                            "latitude": 52.54,
+                            "longitude": 13.46,
+                            "name": "Pankow",
+                            "country": "Germany",
+                        }
+                    ]
+                },
+            )
+        )
+        forecast = respx.get("https://api.open-meteo.com/v1/forecast")
+
+        with patch.object(get_config(), "grid_cache_enabled", True):
+            response = client.get("/weather?city=Pankow")
+
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data["city"] == "Pankow"
+        assert data["current"] == CACHED_BERLIN["current"]
+        assert not forecast.called
+        city_writes = [
+            c.args
+            for c in mock_redis.setex.call_args_list
+            if c.args[0] == "weather:pankow"
+        ]
+        # The city entry goes stale with the cell it was built from
+        assert city_writes and city_writes[0][1] <= 120 + 300
+
+    @respx.mock
+    def test_weather_entry_expires_with_next_upstream_update(
+        self, client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """The cached entry should go stale when the next value is published."""
+        respx.get("https://geocoding-api.open-meteo.com/v1/search").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "results": [
+                        {"latitude": 52.52, "longitude": 13.41, "name": "Berlin"}
+                    ]
+                },
+            )
+        )
+        respx.get("https://api.open-meteo.com/v1/forecast").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "current": {
+                        "time": int(time.time()) - 840,
+                        "interval": 900,
+                        "temperature_2m": 15.5,
+                    }
+                },
+            )
+        )
+
+        with patch.object(get_config(), "cache_ttl_jitter", 0):
+            response = client.get("/weather?city=Berlin")
+
+        assert response.status_code == 200
+        stored = next(
+            c.args[2]
+            for c in mock_redis.setex.call_args_list
+            if c.args[0] == "weather:berlin"
+        )
+        entry = CacheEntry.decode(stored)
+        # Published 14 minutes ago: expire at the next update, not in 300s
+        assert 55 <= entry.soft_expires_at - time.time() <= 61
+
+    def test_weather_equivalent_spellings_share_entry(
+        self, client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """Differently written queries should be served from one cache key."""
+        mock_redis.get.return_value = stored_entry(CACHED_BERLIN, soft_ttl=120)
+
+        client.get("/weather?city=São Paulo")
+        client.get("/weather?city=sao%20%20PAULO")
+
+        keys = {c.args[0] for c in mock_redis.get.call_args_list}
+        assert keys == {"weather:sao paulo"}
+
+    def test_weather_rejects_query_without_letters(self, client: FlaskClient) -> None:
+        """A query that normalizes to nothing should be a 400."""
+        response = client.get("/weather?city=!!!")
+
+        assert response.status_code == 400
+        assert response.get_json()["error"]["code"] == "INVALID_PARAMETER"
+
+    @respx.mock
+    def test_weather_known_alias_skips_geocoding(
+        self, client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """A resolved query should be served from its canonical location entry."""
+        mock_redis.get.side_effect = lambda key: {
+            "alias:berlin,de": "2950159",
+            "weather:loc:2950159": stored_entry(CACHED_BERLIN, soft_ttl=120),
+        }.get(key)
+        geocoding = respx.get("https://geocoding-api.open-meteo.com/v1/search")
+
+        with patch.object(get_config(), "location_aliases_enabled", True):
+            response = client.get("/weather?city=Berlin, DE")
+
+        assert response.status_code == 200
+        assert response.get_json()["city"] == "Berlin"
+        mock_redis.get.assert_any_call("alias:berlin,de")
+        assert not geocoding.called
+
+    @respx.mock
+    def test_weather_stores_entry_under_canonical_location(
+        self, client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """A first-time query should cache weather under its location ID."""
+        respx.get("https://geocoding-api.open-meteo.com/v1/search").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "results": [
+                        {
+                            "id": 2950159,
+                            "latitude": 52.52,
+                            "longitude": 13.41,
+                            "name": "Berlin",
+                        }
+                    ]
+                },
+            )
+        )
+        respx.get("https://api.open-meteo.com/v1/forecast").mock(
+            return_value=httpx.Response(
+                200, json={"current": {"temperature_2m": 15.5, "weather_code": 3}}
+            )
+        )
+
+        with patch.object(get_config(), "location_aliases_enabled", True):
+            response = client.get("/weather?city=Berlin, DE")
+
+        assert response.status_code == 200
+        written = {c.args[0] for c in mock_redis.setex.call_args_list}
+        assert "weather:loc:2950159" in written
+        assert "weather:berlin,de" not in written
+        mock_redis.set.assert_any_call(
+            "alias:berlin,de", 2950159, ex=get_config().geocoding_cache_ttl_seconds
+        )
+
+    @respx.mock
+    def test_weather_not_found_is_remembered(
+        self, client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """A query that matches no city should be stored in the negative cache."""
+        respx.get("https://geocoding-api.open-meteo.com/v1/search").mock(
+            return_value=httpx.Response(200, json={"results": []})
+        )
+
+        response = client.get("/weather?city=asdfgh")
+
+        assert response.status_code == 404
+        pipe = mock_redis.pipeline.return_value
+        assert "notfound:asdfgh" in {c.args[0] for c in pipe.setex.call_args_list}
+
+    @respx.mock
+    def test_weather_negative_cache_hit_skips_geocoding(
+        self, client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """Known-unknown queries should get a 404 without any upstream call."""
+        mock_redis.mget.side_effect = lambda keys: [
+            stored_entry({"query": "asdfgh"}, soft_ttl=30, stale_ttl=0)
+            if key == "notfound:asdfgh"
+            else None
+            for key in keys
+        ]
+        geocoding = respx.get("https://geocoding-api.open-meteo.com/v1/search")
+
+        response = client.get("/weather?city=asdfgh")
+
+        assert response.status_code == 404
+        assert response.get_json()["error"]["code"] == "CITY_NOT_FOUND"
+        assert not geocoding.called
+
+    @respx.mock
+    def test_weather_not_found_filter_rejects_without_upstream(
+        self, client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """A filter hit confirmed by the negative cache should skip geocoding."""
+        mock_redis.mget.side_effect = lambda keys: [
+            stored_entry({"query": "asdfgh"}, soft_ttl=30, stale_ttl=0)
+            if key == "notfound:asdfgh"
+            else None
+            for key in keys
+        ]
+        geocoding = respx.get("https://geocoding-api.open-meteo.com/v1/search")
+
+        with (
+            patch.object(get_config(), "not_found_filter_enabled", True),
+            patch("weather_proxy.routes.weather.get_not_found_filter") as get_filter,
+        ):
+            get_filter.return_value.claim_sync.return_value = False
+            get_filter.return_value.might_contain.return_value = True
+            response = client.get("/weather?city=asdfgh")
+
+        assert response.status_code == 404
+        assert response.get_json()["error"]["code"] == "CITY_NOT_FOUND"
+        assert not geocoding.called
+
+    @respx.mock
+    def test_weather_not_found_filter_false_positive_is_served(
+        self, client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """A filter hit missing from the negative cache should still be fetched."""
+        mock_redis.mget.side_effect = lambda keys: [None for _ in keys]
+        respx.get("https://geocoding-api.open-meteo.com/v1/search").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "results": [
+                        {
+                            "latitude": 52.52,
+                            "longitude": 13.41,
+                            "name": "Berlin",
+                            "country": "Germany",
+                        }
+                    ]
+                },
+            )
+        )
+        respx.get("https://api.open-meteo.com/v1/forecast").mock(
+            return_value=httpx.Response(
+                200, json={"current": {"temperature_2m": 15.5, "weather_code": 3}}
+            )
+        )
+
+        with (
+            patch.object(get_config(), "not_found_filter_enabled", True),
+            patch("weather_proxy.routes.weather.get_not_found_filter") as get_filter,
+        ):
+            get_filter.return_value.claim_sync.return_value = False
+            get_filter.return_value.might_contain.return_value = True
+            response = client.get("/weather?city=Berlin")
+
+        assert response.status_code == 200
+        assert any(
+            "notfound:berlin" in c.args[0] for c in mock_redis.mget.call_args_list
+        )
+
+    @respx.mock
+    def test_weather_not_found_filter_miss_skips_negative_cache(
+        self, client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """Queries the filter has never seen should not read the negative cache."""
+        respx.get("https://geocoding-api.open-meteo.com/v1/search").mock(
+            return_value=httpx.Response(200, json={"results": []})
+        )
+
+        with (
+            patch.object(get_config(), "not_found_filter_enabled", True),
+            patch("weather_proxy.routes.weather.get_not_found_filter") as get_filter,
+        ):
+            get_filter.return_value.claim_sync.return_value = False
+            get_filter.return_value.might_contain.return_value = False
+            response = client.get("/weather?city=asdfgh")
+
+        assert response.status_code == 404
+        assert not any(
+            "notfound:asdfgh" in c.args[0] for c in mock_redis.mget.call_args_list
+        )
+
+    def test_weather_not_found_filter_syncs_off_request_thread(
+        self, client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """A due filter sync should be handed to the background."""
+        mock_redis.get.return_value = None
+
+        with (
+            patch.object(get_config(), "not_found_filter_enabled", True),
+            patch("weather_proxy.routes.weather.get_not_found_filter") as get_filter,
+            patch.object(weather_routes, "_run_in_background") as background,
+            patch.object(weather_routes, "_fetch_coalesced", side_effect=RuntimeError),
+        ):
+            get_filter.return_value.claim_sync.return_value = True
+            get_filter.return_value.might_contain.return_value = False
+            client.get("/weather?city=asdfgh")
+
+        background.assert_any_call(get_filter.return_value.sync)
+        get_filter.return_value.sync.assert_not_called()
+
+    def test_weather_not_found_filter_never_hides_cached_city(
+        self, client: FlaskClient, mock_redis: MagicMock
+    ) -> None:
+        """A filter false positive should not turn a cache hit into a 404."""
+        mock_redis.get.return_value = stored_entry(CACHED_BERLIN, soft_ttl=600)
+
+        with (
+            patch.object(get_config(), "not_found_filter_enabled", True),
+            patch("weather_proxy.routes.weather.get_not_found_filter") as get_filter,
+        ):
+            get_filter.return_value.might_contain.return_value = True
+            response = client.get("/weather?city=Berlin")
+
+        assert response.status_code == 200
+        get_filter.return_value.might_contain.assert_not_called()
+
+    @pytest.mark.usefixtures("client")
+    def test_background_refresh_skips_entry_refreshed_elsewhere(
+        self, mock_redis: MagicMock
+    ) -> None:
+        """A refresh should re-read Redis under the lease and skip fresh entries."""
+        mock_redis.get.return_value = stored_entry(CACHED_BERLIN, soft_ttl=600)
+        mock_redis.set.return_value = True
+
+        with patch.object(weather_routes, "_fetch_from_upstream") as fetch:
+            weather_routes._refresh_in_background("Berlin", "berlin")
+
+        fetch.assert_not_called()
+        mock_redis.eval.assert_called_once()
+
+    @pytest.mark.usefixtures("client")
+    def test_background_refresh_fetches_stale_entry(
+        self, mock_redis: MagicMock
+    ) -> None:
+        """A refresh should fetch when Redis still holds a stale entry."""
+        mock_redis.get.return_value = stored_entry(CACHED_BERLIN, soft_ttl=-30)
+        mock_redis.set.return_value = True
+
+        with patch.object(weather_routes, "_fetch_from_upstream") as fetch:
+            weather_routes._refresh_in_background("Berlin", "berlin")
+
+        fetch.assert_called_once_with("Berlin", "berlin")
+
+    @pytest.mark.usefixtures("client")
+    def test_miss_uses_value_written_before_lease(self, mock_redis: MagicMock) -> None:
+        """A miss that takes the lease should first re-read Redis."""
+        mock_redis.get.side_effect = [None, stored_entry(CACHED_BERLIN, soft_ttl=600)]
+        mock_redis.set.return_value = True
+
+        with patch.object(weather_routes, "_fetch_from_upstream") as fetch:
+            data = weather_routes._fetch_and_cache("Berlin", "berlin")
+
+        assert data == CACHED_BERLIN
+        fetch.assert_not_called()
@@ -0,0 +1,175 @@
+"""Unit tests for the asyncio cache, geocoding and weather services."""
+
+import time
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+import respx
+
+from weather_proxy.services.async_cache_service import AsyncCacheService
+from weather_proxy.services.async_geocoding_service import AsyncGeocodingService
+from weather_proxy.services.async_weather_service import AsyncWeatherService
+from weather_proxy.services.cache_service import CacheEntry
+from weather_proxy.services.geocoding_service import CityNotFoundError
+from weather_proxy.services.weather_service import WeatherServiceError
+
+BERLIN_RESULTS = {
+    "results": [
+        {
+            "name": "Berlin",
+            "latitude": 52.52,
+            "longitude": 13.41,
+            "country": "Germany",
+            "country_code": "DE",
+        }
+    ]
+}
+
+CURRENT_WEATHER = {
+    "current": {
+        "time": 1_700_000_000,
+        "temperature_2m": 15.5,
+        "relative_humidity_2m": 65,
+        "apparent_temperature": 14.2,
+        "weather_code": 3,
+        "wind_speed_10m": 12.5,
+        "precipitation": 0,
+        "is_day": 1,
+    },
+    "current_units": {"temperature_2m": "°C", "wind_speed_10m": "km/h"},
+}
+
+
+def _no_l1(_key: str) -> bool:
+    """Keep entries out of the L1 tier so every read reaches Redis."""
+    return False
+
+
+@pytest.mark.unit
+@pytest.mark.anyio
+class TestAsyncCacheService:
+    """Tests for AsyncCacheService class."""
+
+    async def test_get_miss(self, async_redis: AsyncMock) -> None:
+        """get should return None when the key is absent."""
+        cache = AsyncCacheService(admission=_no_l1)
+
+        assert await cache.get("berlin") is None
+        async_redis.get.assert_awaited_once_with("weather:berlin")
+
+    async def test_set_then_get_round_trip(self, async_redis: AsyncMock) -> None:
+        """Values written by set should decode back on get."""
+        cache = AsyncCacheService(ttl_seconds=60, admission=_no_l1)
+
+        assert await cache.set("berlin", {"temperature": 15.5}) is True
+        stored = async_redis.set.await_args.args[1]
+        async_redis.get.return_value = stored
+
+        assert await cache.get("berlin") == {"temperature": 15.5}
+
+    async def test_entries_are_shared_with_sync_format(
+        self, async_redis: AsyncMock
+    ) -> None:
+        """Entries written in the sync envelope should be readable."""
+        async_redis.get.return_value = CacheEntry.from_payload(
+            payload={"city": "Berlin"},
+            fetched_at=1.0,
+            soft_expires_at=2.0,
+            expires_at=3.0,
+        ).encode()
+        cache = AsyncCacheService(admission=_no_l1)
+
+        entry = await cache.get_entry("berlin")
+
+        assert entry is not None
+        assert entry.payload == {"city": "Berlin"}
+
+    async def test_acquire_lease_held_elsewhere(self, async_redis: AsyncMock) -> None:
+        """acquire_lease should return None if another process holds it."""
+        async_redis.set.return_value = None
+        cache = AsyncCacheService()
+
+        assert await cache.acquire_lease("berlin", ttl=10) is None
+
+    async def test_wait_for_stops_when_lease_holder_is_gone(
+        self, async_redis: AsyncMock
+    ) -> None:
+        """wait_for should give up at once if the lease was released unfilled."""
+        async_redis.exists.return_value = 0
+        cache = AsyncCacheService()
+
+        started = time.monotonic()
+        value = await cache.wait_for("berlin", timeout=5, poll_interval=0.01)
+
+        assert value is None
+        assert time.monotonic() - started < 1
+
+    async def test_wait_for_returns_value_written_by_holder(
+        self, async_redis: AsyncMock
+    ) -> None:
+        """wait_for should return the value once the lease holder writes it."""
+        async_redis.exists.return_value = 1
+        stored = CacheEntry.from_payload(
+            {"city": "Berlin"},
+            fetched_at=time.time(),
+            soft_expires_at=time.time() + 60,
+            expires_at=time.time() + 120,
+        ).encode()
+        async_redis.get.side_effect = [None, stored]
+        cache = AsyncCacheService()
+
+        value = await cache.wait_for("berlin", timeout=5, poll_interval=0.01)
+
+        assert value == {"city": "Berlin"}
+
+
+@pytest.mark.unit
+@pytest.mark.anyio
+@pytest.mark.usefixtures("async_http_client")
+class TestAsyncServices:
+    """Tests for AsyncGeocodingService and AsyncWeatherService."""
+
+    @respx.mock
+    async def test_city_to_coords(self) -> None:
+        """city_to_coords should resolve a city through the async client."""
+        respx.get("https://geocoding-api.open-meteo.com/v1/search").mock(
+            return_value=httpx.Response(200, json=BERLIN_RESULTS)
+        )
+
+        coords = await AsyncGeocodingService().city_to_coords("Berlin")
+
+        assert coords.latitude == 52.52
+        assert coords.country == "Germany"
+
+    @respx.mock
+    async def test_city_not_found(self) -> None:
+        """city_to_coords should raise CityNotFoundError for no results."""
+        respx.get("https://geocoding-api.open-meteo.com/v1/search").mock(
+            return_value=httpx.Response(200, json={"results": []})
+        )
+
+        with pytest.raises(CityNotFoundError):
+            await AsyncGeocodingService().city_to_coords("Nowhere")
+
+    @respx.mock
+    async def test_get_weather(self) -> None:
+        """get_weather should parse the current weather."""
+        respx.get("https://api.open-meteo.com/v1/forecast").mock(
+            return_value=httpx.Response(200, json=CURRENT_WEATHER)
+        )
+
+        weather = await AsyncWeatherService().get_weather(52.52, 13.41)
+
+        assert weather.temperature == 15.5
+        assert weather.weather_description == "Overcast"
+
+    @respx.mock
+    async def test_get_weather_api_error(self) -> None:
+        """get_weather should raise WeatherServiceError on API errors."""
+        respx.get("https://api.open-meteo.com/v1/forecast").mock(
+            return_value=httpx.Response(500)
+        )
+
+        with pytest.raises(WeatherServiceError):
+            await AsyncWeatherService().get_weather(52.52, 13.41)
@@ -0,0 +1,72 @@
+"""Unit tests for BloomFilter."""
+
+import pytest
+
+from weather_proxy.utils.bloom import BloomFilter, optimal_size
+
+
+@pytest.mark.unit
+class TestBloomFilter:
+    """Tests for BloomFilter class."""
+
+    def test_optimal_size(self) -> None:
+        """optimal_size should follow the standard Bloom filter formulas."""
+        size_bits, hash_count = optimal_size(1000, 0.01)
+
+        assert 9500 <= size_bits <= 9600
+        assert hash_count == 7
+
+    def test_added_items_are_contained(self) -> None:
+        """Items added to the filter should never be reported missing."""
+        bloom = BloomFilter(*optimal_size(100, 0.01))
+        items = [f"city-{i}" for i in range(100)]
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+
+    def test_false_positive_rate_is_bounded(self) -> None:
+        """Unseen items should rarely be reported present at capacity."""
+        bloom = BloomFilter(*optimal_size(1000, 0.01))
+        for i in range(1000):
+            bloom.add(f"bad-{i}")
+
+        false_positives = sum(f"good-{i}" in bloom for i in range(10000))
+
+        assert false_positives < 300
+
+    def test_round_trips_through_bytes(self) -> None:
+        """A filter rebuilt from its bitmap should contain the same items."""
+        bloom = BloomFilter(1024, 3, seed=b"1")
+        bloom.add("asdfgh")
+
+        copy = BloomFilter(1024, 3, seed=b"1", data=bloom.to_bytes())
+
+        assert "asdfgh" in copy
+
+    def test_merge_keeps_items_of_both_filters(self) -> None:
+        """A merged filter should contain the items added to either one."""
+        bloom = BloomFilter(1024, 3, seed=b"1")
+        other = BloomFilter(1024, 3, seed=b"1")
+        bloom.add("asdfgh")
+        other.add("qwerty")
+
+        bloom.merge(other)
+
+        assert "asdfgh" in bloom
+        assert "qwerty" in bloom
+
+    def test_bits_follow_redis_bit_order(self) -> None:
+        """Bit offsets should count from the most significant bit like SETBIT."""
+        bloom = BloomFilter(16, 1)
+        position = bloom.positions("x")[0]
+        bloom.add("x")
+
+        data = bloom.to_bytes()
+        assert data[position >> 3] == 0x80 >> (position & 7)
+
+    def test_seed_changes_positions(self) -> None:
+        """Filters with different seeds should map items differently."""
+        assert BloomFilter(1 << 20, 4, seed=b"1").positions("berlin") != (
+            BloomFilter(1 << 20, 4, seed=b"2").positions("berlin")
+        )
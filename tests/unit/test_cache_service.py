@@ -1,11 +1,14 @@
 """Unit tests for CacheService."""
 
 import json
+import time
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from weather_proxy.services.cache_service import CacheService
+from tests.conftest import stored_entry
+from weather_proxy.services.cache_service import CacheEntry, CacheService
+from weather_proxy.services.local_cache import LocalCache
 
 
 @pytest.mark.unit
@@ -21,6 +24,12 @@ class TestCacheService:
         assert service._make_key("  Berlin  ") == "weather:berlin"
         assert service._make_key("New York") == "weather:new york"
 
+    def test_make_key_uses_custom_prefix(self) -> None:
+        """_make_key should namespace keys with the configured prefix."""
+        service = CacheService(key_prefix="geocode")
+
+        assert service._make_key(" Berlin ") == "geocode:berlin"
+
     @patch("weather_proxy.services.cache_service.redis.from_url")
     def test_get_returns_cached_data(self, mock_redis: Mock) -> None:
         """get should return cached data when found."""
@@ -28,7 +37,7 @@ class TestCacheService:
         mock_redis.return_value = mock_client
 
         cached_data = {"city": "Berlin", "temperature": 15.5}
-        mock_client.get.return_value = json.dumps(cached_data)
+        mock_client.get.return_value = stored_entry(cached_data)
 
         service = CacheService()
         result = service.get("Berlin")
@@ -36,6 +45,70 @@ class TestCacheService:
         assert result == cached_data
         mock_client.get.assert_called_once_with("weather:berlin")
 
+    @patch("weather_proxy.services.cache_service.redis.from_url")
+    def test_get_serves_repeat_reads_from_local_cache(self, mock_redis: Mock) -> None:
+        """Repeated get calls should be served by the L1 tier without Redis."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        mock_client.get.return_value = stored_entry({"city": "Berlin"})
+
+        service = CacheService()
+        service.get("Berlin")
+        result = service.get("berlin ")
+
+        assert result == {"city": "Berlin"}
+        mock_client.get.assert_called_once()
+        assert service.local_cache.hits == 1
+
+    @patch("weather_proxy.services.cache_service.redis.from_url")
+    def test_local_cache_skips_keys_not_admitted(self, mock_redis: Mock) -> None:
+        """Only keys the admission policy accepts should be copied into L1."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        mock_client.get.return_value = stored_entry({"city": "Berlin"})
+        admitted: list[str] = []
+
+        def admission(key: str) -> bool:
+            admitted.append(key)
+            return key == "paris"
+
+        service = CacheService(admission=admission)
+        service.get("Berlin")
+        service.get("Berlin")
+        service.get("Paris")
+        service.get("Paris")
+
+        assert mock_client.get.call_count == 3
+        assert admitted == ["berlin", "berlin", "paris"]
+
+    @patch("weather_proxy.services.cache_service.redis.from_url")
+    def test_local_cache_never_outlives_redis_entry(self, mock_redis: Mock) -> None:
+        """L1 entries should expire no later than the Redis key."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        mock_client.get.return_value = stored_entry(
+            {"city": "Berlin"}, soft_ttl=1, stale_ttl=2
+        )
+
+        service = CacheService(local_cache=LocalCache(max_size=10, ttl_seconds=60))
+        service.get("Berlin")
+
+        assert service.get_ttl("Berlin") <= 3
+        mock_client.ttl.assert_not_called()
+
+    @patch("weather_proxy.services.cache_service.redis.from_url")
+    def test_delete_invalidates_local_cache(self, mock_redis: Mock) -> None:
+        """delete should drop the L1 copy as well as the Redis key."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+
+        service = CacheService()
+        service.set("Berlin", {"city": "Berlin"})
+        service.delete("Berlin")
+        mock_client.get.return_value = None
+
+        assert service.get("Berlin") is None
+
     @patch("weather_proxy.services.cache_service.redis.from_url")
     def test_get_returns_none_when_not_found(self, mock_redis: Mock) -> None:
         """get should return None when key doesn't exist."""
@@ -80,7 +153,7 @@ class TestCacheService:
         mock_client = MagicMock()
         mock_redis.return_value = mock_client
 
-        service = CacheService(ttl_seconds=300)
+        service = CacheService(ttl_seconds=300, stale_ttl_seconds=60, ttl_jitter=0)
         data = {"city": "Berlin", "temperature": 15.5}
         result = service.set("Berlin", data)
 
@@ -88,8 +161,14 @@ class TestCacheService:
         mock_client.setex.assert_called_once()
         call_args = mock_client.setex.call_args
         assert call_args[0][0] == "weather:berlin"
-        assert call_args[0][1] == 300
-        assert json.loads(call_args[0][2]) == data
+        assert call_args[0][1] == 360  # Soft TTL plus stale window
+        header, body = call_args[0][2].split("\n", 1)
+        stored = json.loads(header)
+        assert stored["v"] == 2
+        assert json.loads(body) == data
+        assert stored["fetched_at"] == pytest.approx(time.time(), abs=5)
+        assert stored["soft_expires_at"] == pytest.approx(time.time() + 300, abs=5)
+        assert stored["expires_at"] == pytest.approx(time.time() + 360, abs=5)
 
     @patch("weather_proxy.services.cache_service.redis.from_url")
     def test_set_uses_custom_ttl(self, mock_redis: Mock) -> None:
@@ -97,13 +176,106 @@ class TestCacheService:
         mock_client = MagicMock()
         mock_redis.return_value = mock_client
 
-        service = CacheService(ttl_seconds=300)
+        service = CacheService(ttl_seconds=300, stale_ttl_seconds=0, ttl_jitter=0)
         data = {"city": "Berlin"}
         service.set("Berlin", data, ttl=600)
 
         call_args = mock_client.setex.call_args
         assert call_args[0][1] == 600  # Custom TTL used
 
+    @patch("weather_proxy.services.cache_service.redis.from_url")
+    def test_set_jitters_soft_ttl(self, mock_redis: Mock) -> None:
+        """set should shorten the soft TTL by a random fraction up to the jitter."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+
+        service = CacheService(ttl_seconds=300, stale_ttl_seconds=0, ttl_jitter=0.2)
+        for _ in range(20):
+            service.set("Berlin", {"city": "Berlin"})
+
+        ttls = [c[0][1] for c in mock_client.setex.call_args_list]
+        assert all(240 <= ttl <= 300 for ttl in ttls)
+        assert len(set(ttls)) > 1
+
+    @patch("weather_proxy.services.cache_service.redis.from_url")
+    def test_set_stores_fetch_duration(self, mock_redis: Mock) -> None:
+        """set should record the fetch duration in the envelope."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+
+        CacheService().set("Berlin", {"city": "Berlin"}, fetch_duration=0.25)
+
+        entry = CacheEntry.decode(mock_client.setex.call_args[0][2])
+        assert entry.fetch_duration == 0.25
+
+    @patch("weather_proxy.services.cache_service.redis.from_url")
+    def test_get_uses_single_round_trip(self, mock_redis: Mock) -> None:
+        """get_entry should read expiry and age from the envelope, not TTL."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        mock_client.get.return_value = stored_entry({"city": "Berlin"})
+
+        entry = CacheService().get_entry("Berlin")
+
+        assert entry is not None
+        assert 55 <= entry.age <= 65
+        mock_client.get.assert_called_once()
+        mock_client.ttl.assert_not_called()
+
+    @patch("weather_proxy.services.cache_service.redis.from_url")
+    def test_get_ignores_other_schema_versions(self, mock_redis: Mock) -> None:
+        """Entries written with another schema version should read as misses."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        header, body = stored_entry({"city": "Berlin"}).split("\n", 1)
+        stored = json.loads(header)
+        stored["v"] = 1
+        mock_client.get.return_value = f"{json.dumps(stored)}\n{body}"
+
+        assert CacheService().get("Berlin") is None
+
+    def test_entry_round_trips_through_encoding(self) -> None:
+        """decode should restore an encoded entry without touching the body."""
+        entry = CacheEntry.from_payload(
+            {"city": "Berlin"},
+            fetched_at=100.0,
+            soft_expires_at=400.0,
+            expires_at=700.0,
+        )
+
+        decoded = CacheEntry.decode(entry.encode())
+
+        assert decoded == entry
+        assert decoded.body == '{"city":"Berlin"}'
+        assert decoded.payload == {"city": "Berlin"}
+
+    @patch("weather_proxy.services.cache_service.redis.from_url")
+    def test_get_entry_reports_fresh_entry(self, mock_redis: Mock) -> None:
+        """get_entry should report entries before their soft expiry as fresh."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        mock_client.get.return_value = stored_entry({"city": "Berlin"}, soft_ttl=120)
+
+        entry = CacheService().get_entry("Berlin")
+
+        assert entry is not None
+        assert entry.is_stale is False
+        assert 115 <= entry.fresh_ttl <= 120
+
+    @patch("weather_proxy.services.cache_service.redis.from_url")
+    def test_get_entry_reports_stale_entry(self, mock_redis: Mock) -> None:
+        """get_entry should flag entries past their soft expiry as stale."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        mock_client.get.return_value = stored_entry({"city": "Berlin"}, soft_ttl=-10)
+
+        entry = CacheService().get_entry("Berlin")
+
+        assert entry is not None
+        assert entry.payload == {"city": "Berlin"}
+        assert entry.is_stale is True
+        assert entry.fresh_ttl == 0
+
     @patch("weather_proxy.services.cache_service.redis.from_url")
     def test_set_returns_false_on_redis_error(self, mock_redis: Mock) -> None:
         """set should return False on Redis errors."""
@@ -204,3 +376,143 @@ class TestCacheService:
         )
         assert service.redis_url == "redis://custom:6380/1"
         assert service.ttl_seconds == 600
+
+    @patch("weather_proxy.services.cache_service.redis.from_url")
+    def test_acquire_lease_uses_set_nx_with_expiry(self, mock_redis: Mock) -> None:
+        """acquire_lease should atomically set the lease key with a TTL."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        mock_client.set.return_value = True
+
+        service = CacheService()
+        token = service.acquire_lease("Berlin", ttl=10)
+
+        assert token is not None
+        mock_client.set.assert_called_once_with(
+            "lease:weather:berlin", token, nx=True, ex=10
+        )
+
+    @patch("weather_proxy.services.cache_service.redis.from_url")
+    def test_acquire_lease_returns_none_when_held(self, mock_redis: Mock) -> None:
+        """acquire_lease should return None when another process holds it."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        mock_client.set.return_value = None
+
+        service = CacheService()
+        assert service.acquire_lease("Berlin", ttl=10) is None
+
+    @patch("weather_proxy.services.cache_service.redis.from_url")
+    def test_acquire_lease_fails_open_on_redis_error(self, mock_redis: Mock) -> None:
+        """acquire_lease should grant a token when Redis is unavailable."""
+        import redis as redis_lib
+
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        mock_client.set.side_effect = redis_lib.RedisError("Connection failed")
+
+        service = CacheService()
+        assert service.acquire_lease("Berlin", ttl=10) is not None
+
+    @patch("weather_proxy.services.cache_service.redis.from_url")
+    def test_wait_for_returns_value_written_by_holder(self, mock_redis: Mock) -> None:
+        """wait_for should return the value once the lease holder writes it."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        mock_client.exists.return_value = 1
+        mock_client.get.side_effect = [None, stored_entry({"city": "Berlin"})]
+
+        service = CacheService()
+        result = service.wait_for("Berlin", timeout=1, poll_interval=0.01)
+
+        assert result == {"city": "Berlin"}
+
+    @patch("weather_proxy.services.cache_service.redis.from_url")
+    def test_wait_for_returns_none_when_holder_dies(self, mock_redis: Mock) -> None:
+        """wait_for should stop waiting once the lease disappears unfilled."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        mock_client.exists.return_value = 0
+        mock_client.get.return_value = None
+
+        service = CacheService()
+        result = service.wait_for("Berlin", timeout=5, poll_interval=0.01)
+
+        assert result is None
+        mock_client.get.assert_called_once()
+
+    @patch("weather_proxy.services.cache_service.redis.from_url")
+    def test_get_many_uses_single_mget(self, mock_redis: Mock) -> None:
+        """get_many should read all keys with one MGET and skip misses."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        mock_client.mget.return_value = [stored_entry({"city": "Berlin"}), None]
+
+        service = CacheService()
+        result = service.get_many(["Berlin", "Paris"])
+
+        assert list(result) == ["Berlin"]
+        assert result["Berlin"].payload == {"city": "Berlin"}
+        mock_client.mget.assert_called_once_with(["weather:berlin", "weather:paris"])
+        mock_client.get.assert_not_called()
+
+    @patch("weather_proxy.services.cache_service.redis.from_url")
+    def test_set_many_pipelines_writes(self, mock_redis: Mock) -> None:
+        """set_many should write all values through one pipeline."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        pipe = mock_client.pipeline.return_value
+
+        service = CacheService(ttl_seconds=300, stale_ttl_seconds=60, ttl_jitter=0)
+        result = service.set_many(
+            {"Berlin": {"city": "Berlin"}, "Paris": {"city": "Paris"}}
+        )
+
+        assert result is True
+        assert [c[0][:2] for c in pipe.setex.call_args_list] == [
+            ("weather:berlin", 360),
+            ("weather:paris", 360),
+        ]
+        pipe.execute.assert_called_once()
+        assert service.get("Paris") == {"city": "Paris"}
+
+
+@pytest.mark.unit
+class TestCacheEntry:
+    """Tests for CacheEntry early refresh."""
+
+    def _entry(self, fresh_for: float, fetch_duration: float) -> CacheEntry:
+        now = time.time()
+        return CacheEntry.from_payload(
+            {"city": "Berlin"},
+            fetched_at=now - 60,
+            soft_expires_at=now + fresh_for,
+            expires_at=now + fresh_for + 300,
+            fetch_duration=fetch_duration,
+        )
+
+    def test_refreshes_early_near_expiry(self) -> None:
+        """Entries about to expire relative to their fetch cost should refresh."""
+        entry = self._entry(fresh_for=0.001, fetch_duration=10)
+
+        hits = sum(entry.should_refresh_early(beta=1.0) for _ in range(100))
+
+        assert hits > 90
+
+    def test_rarely_refreshes_far_from_expiry(self) -> None:
+        """Entries far from expiry should almost never refresh early."""
+        entry = self._entry(fresh_for=300, fetch_duration=0.1)
+
+        assert not any(entry.should_refresh_early(beta=1.0) for _ in range(100))
+
+    def test_disabled_without_beta_or_duration(self) -> None:
+        """A zero beta or unknown fetch duration should disable early refresh."""
+        assert not self._entry(0.001, 10).should_refresh_early(beta=0)
+        assert not self._entry(0.001, 0).should_refresh_early(beta=1.0)
+
+    def test_decodes_entries_without_fetch_duration(self) -> None:
+        """Envelopes written before fetch_duration existed should still decode."""
+        header = {"v": 2, "fetched_at": 1, "soft_expires_at": 2, "expires_at": 3}
+        entry = CacheEntry.decode(f'{json.dumps(header)}\n{{"city":"Berlin"}}')
+
+        assert entry.fetch_duration == 0.0
@@ -0,0 +1,168 @@
+"""Unit tests for circuit breaker and retry helpers."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from weather_proxy.config import get_config
+from weather_proxy.resilience.circuit_breaker import (
+    CircuitBreakerOpen,
+    is_retryable,
+    with_retry,
+)
+from weather_proxy.resilience.retry_budget import RetryBudget
+
+
+class UpstreamError(Exception):
+    """Service-level error wrapping an HTTP failure."""
+
+
+def _status_error(status: int) -> httpx.HTTPStatusError:
+    """Build an HTTPStatusError for a response status."""
+    request = httpx.Request("GET", "https://api.open-meteo.com/v1/forecast")
+    return httpx.HTTPStatusError(
+        "error", request=request, response=httpx.Response(status, request=request)
+    )
+
+
+def _wrapped(error: Exception) -> UpstreamError:
+    """Wrap an error the way the services do."""
+    try:
+        raise UpstreamError("upstream failed") from error
+    except UpstreamError as e:
+        return e
+
+
+@pytest.fixture
+def budget():
+    """Use a generous retry budget with instant backoff."""
+    budget = RetryBudget(ratio=1, min_retries=100, window_seconds=3600, shared=False)
+    with (
+        patch(
+            "weather_proxy.resilience.circuit_breaker.get_retry_budget",
+            return_value=budget,
+        ),
+        patch.object(get_config(), "retry_backoff_base_seconds", 0),
+    ):
+        yield budget
+
+
+@pytest.mark.unit
+class TestIsRetryable:
+    """Tests for is_retryable."""
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            httpx.ConnectTimeout("timed out"),
+            httpx.ConnectError("refused"),
+            _status_error(503),
+            _status_error(429),
+        ],
+    )
+    def test_transient_errors_are_retryable(self, error: Exception) -> None:
+        """Timeouts, connection errors, 5xx and 429 should be retried."""
+        assert is_retryable(error) is True
+        assert is_retryable(_wrapped(error)) is True
+
+    def test_client_errors_are_not_retryable(self) -> None:
+        """Other 4xx responses should not be retried."""
+        assert is_retryable(_wrapped(_status_error(400))) is False
+
+    def test_open_breaker_is_not_retryable(self) -> None:
+        """An open circuit breaker should fail fast."""
+        assert is_retryable(CircuitBreakerOpen("open")) is False
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("budget")
+class TestWithRetry:
+    """Tests for the with_retry decorator."""
+
+    def test_retries_wrapped_transient_errors(self) -> None:
+        """Service errors caused by transient HTTP errors should be retried."""
+        calls = []
+
+        @with_retry(max_attempts=3)
+        def fetch() -> str:
+            calls.append(1)
+            if len(calls) < 3:
+                raise _wrapped(httpx.ConnectTimeout("timed out"))
+            return "weather"
+
+        assert fetch() == "weather"
+        assert len(calls) == 3
+
+    def test_does_not_retry_client_errors(self) -> None:
+        """Non-retryable errors should be raised after one attempt."""
+        calls = []
+
+        @with_retry(max_attempts=3)
+        def fetch() -> None:
+            calls.append(1)
+            raise _wrapped(_status_error(404))
+
+        with pytest.raises(UpstreamError):
+            fetch()
+        assert len(calls) == 1
+
+    def test_stops_when_budget_is_spent(self, budget: RetryBudget) -> None:
+        """Retries should stop once the budget refuses them."""
+        budget.min_retries = 0
+        budget.ratio = 0
+        calls = []
+
+        @with_retry(max_attempts=3)
+        def fetch() -> None:
+            calls.append(1)
+            raise _wrapped(httpx.ConnectTimeout("timed out"))
+
+        with pytest.raises(UpstreamError):
+            fetch()
+        assert len(calls) == 1
+
+    def test_stops_at_deadline(self) -> None:
+        """No retry should start once the retry deadline has passed."""
+        calls = []
+
+        @with_retry(max_attempts=3)
+        def fetch() -> None:
+            calls.append(1)
+            raise _wrapped(httpx.ConnectTimeout("timed out"))
+
+        with (
+            patch.object(get_config(), "retry_deadline_seconds", 0),
+            pytest.raises(UpstreamError),
+        ):
+            fetch()
+        assert len(calls) == 1
+
+    def test_backoff_is_capped_by_deadline(self) -> None:
+        """Backoff sleeps should never run past the retry deadline."""
+        sleeps: list[float] = []
+
+        @with_retry(max_attempts=2, min_wait=60, max_wait=60)
+        def fetch() -> None:
+            raise _wrapped(httpx.ConnectTimeout("timed out"))
+
+        with (
+            patch.object(get_config(), "retry_deadline_seconds", 0.5),
+            patch("tenacity.nap.time.sleep", side_effect=sleeps.append),
+            pytest.raises(UpstreamError),
+        ):
+            fetch()
+        assert len(sleeps) == 1
+        assert sleeps[0] <= 0.5
+
+    def test_primary_calls_are_counted(self, budget: RetryBudget) -> None:
+        """Each decorated call should count once as a primary call."""
+
+        @with_retry(max_attempts=1)
+        def fetch() -> str:
+            return "weather"
+
+        fetch()
+        fetch()
+
+        assert sum(calls for calls, _ in budget._counts.values()) == 2
@@ -65,3 +65,12 @@ class TestConfig:
         assert isinstance(config, Config)
         assert hasattr(config, "flask_env")
         assert hasattr(config, "redis_url")
+
+    @pytest.mark.parametrize("value", ["0", "-0.1"])
+    def test_config_rejects_non_positive_grid_resolution(self, value: str) -> None:
+        """A grid resolution that cannot divide coordinates should fail at startup."""
+        with (
+            patch.dict(os.environ, {"GRID_CACHE_RESOLUTION_DEG": value}),
+            pytest.raises(ValueError, match="GRID_CACHE_RESOLUTION_DEG"),
+        ):
+            Config()
@@ -0,0 +1,80 @@
+"""Unit tests for request deadlines."""
+
+from unittest.mock import patch
+
+import pytest
+
+from weather_proxy.config import get_config
+from weather_proxy.resilience.deadline import (
+    DeadlineExceeded,
+    cap,
+    parse_timeout_header,
+    remaining,
+    request_deadline,
+    shared_deadline,
+    stage_timeout,
+)
+
+
+@pytest.mark.unit
+class TestRequestDeadline:
+    """Tests for deadline propagation helpers."""
+
+    def test_no_deadline_by_default(self) -> None:
+        """Without a deadline, timeouts should be left unchanged."""
+        assert remaining() is None
+        assert cap(5) == 5
+        assert stage_timeout("weather", 5) == 5
+
+    def test_timeouts_are_capped_by_remaining_budget(self) -> None:
+        """Stages should get at most the time left before the deadline."""
+        with request_deadline(1):
+            assert 0 < cap(5) <= 1
+            assert 0 < stage_timeout("weather", 5) <= 1
+            assert cap(0.5) == 0.5
+
+    def test_stage_fails_fast_once_deadline_passed(self) -> None:
+        """A stage starting after the deadline should raise DeadlineExceeded."""
+        with request_deadline(0), pytest.raises(DeadlineExceeded):
+            stage_timeout("geocoding", 5)
+
+    def test_nested_deadline_is_restored(self) -> None:
+        """Leaving a block should restore the outer deadline."""
+        with request_deadline(1):
+            with request_deadline(None):
+                assert remaining() is None
+            assert remaining() is not None
+        assert remaining() is None
+
+    def test_shared_deadline_uses_configured_budget(self) -> None:
+        """Shared work should get the configured budget, not the caller's."""
+        with (
+            patch.object(get_config(), "request_deadline_seconds", 10),
+            request_deadline(0.1),
+            shared_deadline(),
+        ):
+            left = remaining()
+            assert left is not None
+            assert left > 5
+        with (
+            patch.object(get_config(), "request_deadline_seconds", 0),
+            request_deadline(0.1),
+            shared_deadline(),
+        ):
+            assert remaining() is None
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (None, 10),
+            ("2.5", 2.5),
+            ("30", 10),
+            ("0", 10),
+            ("-1", 10),
+            ("nan", 10),
+            ("soon", 10),
+        ],
+    )
+    def test_parse_timeout_header(self, value: str | None, expected: float) -> None:
+        """Clients should only be able to shorten the configured budget."""
+        assert parse_timeout_header(value, 10) == expected
@@ -1,5 +1,7 @@
 """Unit tests for GeocodingService."""
 
+from unittest.mock import MagicMock
+
 import httpx
 import pytest
 import respx
@@ -139,6 +141,152 @@ class TestGeocodingService:
         service = GeocodingService()
         assert service.validate_city("NonExistentCity") is False
 
+    @respx.mock
+    def test_city_to_coords_uses_cached_coordinates(self) -> None:
+        """city_to_coords should skip the API when coordinates are cached."""
+        route = respx.get("https://geocoding-api.open-meteo.com/v1/search")
+        cache = MagicMock()
+        cache.get.return_value = {
+            "latitude": 52.52,
+            "longitude": 13.41,
+            "city_name": "Berlin",
+            "country": "Germany",
+            "country_code": "DE",
+        }
+
+        service = GeocodingService(cache=cache)
+        coords = service.city_to_coords("Berlin")
+
+        assert coords.city_name == "Berlin"
+        assert coords.latitude == 52.52
+        assert not route.called
+
+    @respx.mock
+    def test_city_to_coords_searches_within_country_hint(self) -> None:
+        """A trailing country should filter the search and key the cache."""
+        route = respx.get("https://geocoding-api.open-meteo.com/v1/search").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "results": [
+                        {"latitude": 33.66, "longitude": -95.56, "name": "Paris"}
+                    ]
+                },
+            )
+        )
+        cache = MagicMock()
+        cache.get.return_value = None
+
+        service = GeocodingService(cache=cache)
+        service.city_to_coords("Paris, United States")
+
+        params = route.calls.last.request.url.params
+        assert params["name"] == "Paris"
+        assert params["countryCode"] == "US"
+        cache.get.assert_called_once_with("paris,us")
+        assert cache.set.call_args[0][0] == "paris,us"
+
+    @respx.mock
+    def test_city_to_coords_stores_result_in_cache(self) -> None:
+        """city_to_coords should cache coordinates resolved from the API."""
+        respx.get("https://geocoding-api.open-meteo.com/v1/search").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "results": [{"latitude": 48.85, "longitude": 2.35, "name": "Paris"}]
+                },
+            )
+        )
+        cache = MagicMock()
+        cache.get.return_value = None
+
+        service = GeocodingService(cache=cache)
+        service.city_to_coords("Paris")
+
+        cache.set.assert_called_once()
+        key, value = cache.set.call_args[0]
+        assert key == "paris"
+        assert value["latitude"] == 48.85
+        assert value["city_name"] == "Paris"
+
+    @respx.mock
+    def test_city_to_coords_records_location_alias(self) -> None:
+        """city_to_coords should map the query to the upstream location ID."""
+        respx.get("https://geocoding-api.open-meteo.com/v1/search").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "results": [
+                        {
+                            "id": 5128581,
+                            "latitude": 40.71,
+                            "longitude": -74.01,
+                            "name": "New York",
+                        }
+                    ]
+                },
+            )
+        )
+        aliases = MagicMock()
+
+        service = GeocodingService(aliases=aliases)
+        coords = service.city_to_coords(" NYC ")
+
+        assert coords.location_id == 5128581
+        aliases.set.assert_called_once_with("NYC", 5128581)
+
+    def test_city_to_coords_skips_alias_without_location_id(self) -> None:
+        """Coordinates cached before IDs were stored should not be aliased."""
+        cache = MagicMock()
+        cache.get.return_value = {
+            "latitude": 52.52,
+            "longitude": 13.41,
+            "city_name": "Berlin",
+        }
+        aliases = MagicMock()
+
+        service = GeocodingService(cache=cache, aliases=aliases)
+        coords = service.city_to_coords("Berlin")
+
+        assert coords.location_id is None
+        aliases.set.assert_not_called()
+
+    @respx.mock
+    def test_cities_to_coords_reports_per_city_results(self) -> None:
+        """cities_to_coords should geocode only uncached names and keep errors per city."""
+
+        def geocode(request: httpx.Request) -> httpx.Response:
+            if request.url.params["name"] == "Paris":
+                return httpx.Response(
+                    200,
+                    json={
+                        "results": [
+                            {"latitude": 48.85, "longitude": 2.35, "name": "Paris"}
+                        ]
+                    },
+                )
+            return httpx.Response(200, json={"results": []})
+
+        route = respx.get("https://geocoding-api.open-meteo.com/v1/search").mock(
+            side_effect=geocode
+        )
+        cached_entry = MagicMock()
+        cached_entry.payload = {
+            "latitude": 52.52,
+            "longitude": 13.41,
+            "city_name": "Berlin",
+        }
+        cache = MagicMock()
+        cache.get_many.return_value = {"berlin": cached_entry}
+
+        service = GeocodingService(cache=cache)
+        results = service.cities_to_coords(["Berlin", "Paris", "Nowhere"])
+
+        assert results["Berlin"].city_name == "Berlin"
+        assert results["Paris"].latitude == 48.85
+        assert isinstance(results["Nowhere"], CityNotFoundError)
+        assert route.call_count == 2
+
     def test_service_uses_custom_base_url(self) -> None:
         """Service should use custom base URL if provided."""
         service = GeocodingService(base_url="https://custom.example.com")
@@ -0,0 +1,120 @@
+"""Unit tests for HeavyHitterTracker."""
+
+import time
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+import redis
+
+from weather_proxy.services.heavy_hitters import HeavyHitterTracker
+
+
+@pytest.mark.unit
+class TestHeavyHitterTracker:
+    """Tests for HeavyHitterTracker class."""
+
+    def test_record_tracks_local_top(self) -> None:
+        """Recorded queries should be normalized and ranked locally."""
+        tracker = HeavyHitterTracker(k=2, flush_seconds=60)
+        for query in ["Berlin", " berlin ", "Paris", "BERLIN", "Tokyo", "tokyo"]:
+            tracker.record(query)
+
+        assert tracker.local_top() == [("berlin", 3), ("tokyo", 2)]
+        assert tracker.estimate("Paris") == 1
+
+    @patch("weather_proxy.services.heavy_hitters.redis.from_url")
+    def test_flush_pushes_deltas_and_merges_windows(self, mock_redis: Mock) -> None:
+        """flush should add only new counts and merge both windows' top-K."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        pipe = mock_client.pipeline.return_value
+        pipe.execute.return_value = [
+            3.0,
+            True,
+            [("berlin", 10.0), ("paris", 4.0)],
+            [("paris", 8.0)],
+        ]
+
+        tracker = HeavyHitterTracker(k=5, flush_seconds=60, window_seconds=3600)
+        for _ in range(3):
+            tracker.record("berlin")
+        assert tracker.flush() is True
+
+        key = f"hot:{int(time.time() // 3600)}"
+        pipe.zincrby.assert_called_once_with(key, 3, "berlin")
+        pipe.expire.assert_called_once_with(key, 7200)
+        assert tracker.global_top() == [("paris", 12), ("berlin", 10)]
+
+        pipe.reset_mock()
+        tracker.record("berlin")
+        tracker.flush()
+        pipe.zincrby.assert_called_once_with(key, 1, "berlin")
+
+    @patch("weather_proxy.services.heavy_hitters.redis.from_url")
+    def test_record_reports_due_flush_without_flushing(self, mock_redis: Mock) -> None:
+        """record should leave the Redis round trip to one caller per interval."""
+        tracker = HeavyHitterTracker(flush_seconds=60)
+        tracker._next_flush = 0
+
+        assert tracker.record("Berlin") is True
+        assert tracker.record("Berlin") is False
+        mock_redis.return_value.pipeline.assert_not_called()
+
+    @patch("weather_proxy.services.heavy_hitters.redis.from_url")
+    def test_returning_city_is_not_counted_twice(self, mock_redis: Mock) -> None:
+        """A city re-entering the top-K should only push its new growth."""
+        pipe = mock_redis.return_value.pipeline.return_value
+        pipe.execute.return_value = [True, [], []]
+        tracker = HeavyHitterTracker(k=1, flush_seconds=60)
+
+        for query in ["Berlin"] * 2:
+            tracker.record(query)
+        tracker.flush()
+        for query in ["Paris"] * 3:
+            tracker.record(query)
+        tracker.flush()
+        for query in ["Berlin"] * 2:
+            tracker.record(query)
+        pipe.reset_mock()
+        tracker.flush()
+
+        key = f"hot:{tracker._window}"
+        pipe.zincrby.assert_called_once_with(key, 2, "berlin")
+
+    @patch("weather_proxy.services.heavy_hitters.redis.from_url")
+    def test_failed_flush_is_retried(self, mock_redis: Mock) -> None:
+        """Growth that did not reach Redis should be pushed by the next flush."""
+        pipe = mock_redis.return_value.pipeline.return_value
+        pipe.execute.side_effect = [redis.RedisError(), [3.0, True, [], []]]
+        tracker = HeavyHitterTracker(flush_seconds=60)
+        for query in ["Berlin"] * 3:
+            tracker.record(query)
+
+        assert tracker.flush() is False
+        pipe.reset_mock()
+        assert tracker.flush() is True
+        pipe.zincrby.assert_called_once_with(f"hot:{tracker._window}", 3, "berlin")
+
+    @patch("weather_proxy.services.heavy_hitters.redis.from_url")
+    def test_redis_error_keeps_last_global_top(self, mock_redis: Mock) -> None:
+        """Redis errors should keep the last snapshot and local counts."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        mock_client.pipeline.return_value.execute.side_effect = redis.RedisError()
+
+        tracker = HeavyHitterTracker(flush_seconds=60)
+        tracker.record("Berlin")
+
+        assert tracker.flush() is False
+        assert tracker.global_top() == []
+        assert tracker.local_top() == [("berlin", 1)]
+
+    def test_new_window_restarts_local_counts(self) -> None:
+        """Local counts should start over when the window rolls."""
+        tracker = HeavyHitterTracker(flush_seconds=60)
+        tracker.record("Berlin")
+
+        tracker._window -= 1
+        tracker.record("Paris")
+
+        assert tracker.local_top() == [("paris", 1)]
@@ -0,0 +1,170 @@
+"""Unit tests for hedged upstream requests."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+import respx
+
+from weather_proxy.config import get_config
+from weather_proxy.resilience.hedging import Hedger, get_hedger
+from weather_proxy.services.weather_service import WeatherService
+
+
+def _warm(hedger: Hedger, seconds: float = 0.01, count: int = 20) -> None:
+    """Feed the hedger enough latencies to start hedging."""
+    for _ in range(count):
+        hedger.observe(seconds)
+
+
+def _hedger(**kwargs: float) -> Hedger:
+    """Create a hedger with a generous budget and a short delay floor."""
+    defaults = {"quantile": 0.95, "min_delay": 0.01, "budget_ratio": 1.0}
+    return Hedger("weather", **{**defaults, **kwargs})
+
+
+@pytest.mark.unit
+class TestHedger:
+    """Tests for Hedger class."""
+
+    def test_no_delay_until_enough_samples(self) -> None:
+        """Hedging should not start before enough latencies were seen."""
+        hedger = _hedger()
+        _warm(hedger, count=19)
+
+        assert hedger.delay() is None
+
+    def test_delay_is_latency_quantile(self) -> None:
+        """The delay should be the configured quantile of observed latencies."""
+        hedger = _hedger(quantile=0.95)
+        for ms in range(1, 101):
+            hedger.observe(ms / 1000)
+
+        assert hedger.delay() == pytest.approx(0.095)
+
+    def test_delay_has_a_floor(self) -> None:
+        """Very fast upstreams should not be hedged after a few microseconds."""
+        hedger = _hedger(min_delay=0.05)
+        _warm(hedger, seconds=0.001)
+
+        assert hedger.delay() == 0.05
+
+    def test_fast_call_is_not_hedged(self) -> None:
+        """A call returning before the delay should run once."""
+        hedger = _hedger()
+        _warm(hedger)
+        calls = []
+
+        def fetch() -> str:
+            calls.append(1)
+            return "weather"
+
+        assert hedger.call(fetch) == "weather"
+        assert len(calls) == 1
+
+    def test_slow_call_is_hedged(self) -> None:
+        """A duplicate should be sent and win when the primary is slow."""
+        hedger = _hedger()
+        _warm(hedger)
+        release = threading.Event()
+        calls = []
+
+        def fetch() -> str:
+            calls.append(1)
+            if len(calls) == 1:
+                release.wait(2)
+                return "primary"
+            return "hedge"
+
+        started = time.monotonic()
+        result = hedger.call(fetch)
+        release.set()
+
+        assert result == "hedge"
+        assert len(calls) == 2
+        assert time.monotonic() - started < 1
+
+    def test_no_hedge_without_budget(self) -> None:
+        """Slow calls should not be duplicated once the budget is spent."""
+        hedger = _hedger(budget_ratio=0)
+        _warm(hedger)
+        calls = []
+
+        def fetch() -> str:
+            calls.append(1)
+            time.sleep(0.05)
+            return "primary"
+
+        assert hedger.call(fetch) == "primary"
+        assert len(calls) == 1
+
+    def test_failed_primary_waits_for_hedge(self) -> None:
+        """A failing call should not beat a successful one."""
+        hedger = _hedger()
+        _warm(hedger)
+        calls = []
+
+        def fetch() -> str:
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.05)
+                raise TimeoutError("primary timed out")
+            time.sleep(0.1)
+            return "hedge"
+
+        assert hedger.call(fetch) == "hedge"
+
+    @pytest.mark.anyio
+    async def test_async_slow_call_is_hedged(self) -> None:
+        """The async hedge should win and the slow primary be cancelled."""
+        hedger = _hedger()
+        _warm(hedger)
+        cancelled = asyncio.Event()
+        calls = []
+
+        async def fetch() -> str:
+            calls.append(1)
+            if len(calls) == 1:
+                try:
+                    await asyncio.sleep(2)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+                return "primary"
+            return "hedge"
+
+        assert await hedger.acall(fetch) == "hedge"
+        await asyncio.wait_for(cancelled.wait(), 1)
+        assert len(calls) == 2
+
+    @respx.mock
+    def test_slow_hedged_call_does_not_block_others(self) -> None:
+        """A call waiting on its hedge should not hold up other service calls."""
+        release = threading.Event()
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            if request.url.params["latitude"] == "1.0":
+                release.wait(2)
+            return httpx.Response(
+                200, json={"current": {"temperature_2m": 15.5, "weather_code": 3}}
+            )
+
+        respx.get("https://api.open-meteo.com/v1/forecast").mock(side_effect=respond)
+        with patch.object(get_config(), "hedging_enabled", True):
+            _warm(get_hedger("weather"))
+            slow = threading.Thread(
+                target=WeatherService().get_weather, args=(1.0, 1.0), daemon=True
+            )
+            slow.start()
+            time.sleep(0.05)
+
+            started = time.monotonic()
+            WeatherService().get_weather(52.52, 13.41)
+            elapsed = time.monotonic() - started
+            release.set()
+            slow.join(2)
+
+        assert elapsed < 0.5
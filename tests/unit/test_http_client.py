@@ -0,0 +1,67 @@
+"""Unit tests for the shared upstream HTTP client."""
+
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import httpx
+import pytest
+import respx
+
+from weather_proxy.services import http_client
+from weather_proxy.services.http_client import close_http_client, get_http_client
+
+
+@pytest.fixture(autouse=True)
+def fresh_client() -> Iterator[None]:
+    """Ensure each test starts and ends without a shared client."""
+    close_http_client()
+    yield
+    close_http_client()
+
+
+@pytest.mark.unit
+class TestHttpClient:
+    """Tests for the pooled HTTP client helpers."""
+
+    def test_get_http_client_returns_shared_instance(self) -> None:
+        """get_http_client should reuse one client across calls."""
+        assert get_http_client() is get_http_client()
+
+    def test_close_http_client_creates_new_client_next_time(self) -> None:
+        """A closed client should be replaced on the next call."""
+        client = get_http_client()
+        close_http_client()
+
+        assert client.is_closed
+        assert get_http_client() is not client
+
+    def test_reset_after_fork_drops_client_without_closing(self) -> None:
+        """Forked workers should build their own client and leave the parent's open."""
+        client = get_http_client()
+        http_client._reset_after_fork()
+
+        assert not client.is_closed
+        assert get_http_client() is not client
+        client.close()
+
+    def test_http2_falls_back_when_h2_missing(self) -> None:
+        """HTTP/2 should only be requested when the h2 package is installed."""
+        with (
+            patch.object(http_client.get_config(), "http2_enabled", True),
+            patch.object(http_client, "_http2_available", return_value=False),
+            patch.object(http_client.httpx, "Client") as client_cls,
+        ):
+            get_http_client()
+
+        assert client_cls.call_args.kwargs["http2"] is False
+
+    @respx.mock
+    def test_client_requests_are_mockable(self) -> None:
+        """Requests through the shared client should go through httpx transports."""
+        respx.get("https://api.open-meteo.com/v1/forecast").mock(
+            return_value=httpx.Response(200, json={"ok": True})
+        )
+
+        response = get_http_client().get("https://api.open-meteo.com/v1/forecast")
+
+        assert response.json() == {"ok": True}
@@ -0,0 +1,77 @@
+"""Unit tests for the background I/O executor."""
+
+import contextvars
+import threading
+
+import pytest
+
+from weather_proxy.services.io_executor import (
+    IOExecutor,
+    IOExecutorSaturated,
+    IOExecutorTimeout,
+)
+
+_request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
+
+
+@pytest.mark.unit
+class TestIOExecutor:
+    """Tests for IOExecutor class."""
+
+    def test_run_returns_result(self) -> None:
+        """run should return the call's result."""
+        executor = IOExecutor(max_workers=2, max_pending=4)
+
+        assert executor.run(lambda x: x * 2, 21, timeout=1) == 42
+        executor.shutdown()
+
+    def test_run_reraises_call_errors(self) -> None:
+        """Errors raised by the call should reach the waiting caller."""
+        executor = IOExecutor(max_workers=2, max_pending=4)
+
+        def fail() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            executor.run(fail, timeout=1)
+        executor.shutdown()
+
+    def test_run_times_out_but_task_completes(self) -> None:
+        """A caller should stop waiting at its deadline while the task finishes."""
+        executor = IOExecutor(max_workers=1, max_pending=4)
+        release = threading.Event()
+        finished = threading.Event()
+
+        def slow() -> None:
+            release.wait(2)
+            finished.set()
+
+        with pytest.raises(IOExecutorTimeout):
+            executor.run(slow, timeout=0.05)
+        release.set()
+        executor.shutdown()
+
+        assert finished.is_set()
+
+    def test_submit_rejects_when_saturated(self) -> None:
+        """Submissions beyond max_pending should be rejected, not queued."""
+        executor = IOExecutor(max_workers=1, max_pending=2)
+        release = threading.Event()
+        executor.submit(release.wait, 2)
+        executor.submit(release.wait, 2)
+
+        with pytest.raises(IOExecutorSaturated):
+            executor.submit(release.wait, 2)
+        assert executor.pending == 2
+
+        release.set()
+        executor.shutdown()
+        assert executor.pending == 0
+
+    def test_tasks_run_in_caller_context(self) -> None:
+        """Context variables of the submitting thread should carry over."""
+        executor = IOExecutor(max_workers=1, max_pending=4)
+        _request_id.set("req-123")
+
+        assert executor.run(_request_id.get, timeout=1) == "req-123"
+        executor.shutdown()
@@ -0,0 +1,68 @@
+"""Unit tests for LocalCache."""
+
+from unittest.mock import patch
+
+import pytest
+
+from weather_proxy.services.local_cache import LocalCache
+
+
+@pytest.mark.unit
+class TestLocalCache:
+    """Tests for LocalCache class."""
+
+    def test_get_returns_stored_value(self) -> None:
+        """get should return a value stored with set."""
+        cache = LocalCache(max_size=10, ttl_seconds=60)
+        cache.set("berlin", {"city": "Berlin"})
+
+        assert cache.get("berlin") == {"city": "Berlin"}
+        assert cache.hits == 1
+
+    def test_get_counts_misses(self) -> None:
+        """get should return None and count a miss for unknown keys."""
+        cache = LocalCache(max_size=10, ttl_seconds=60)
+
+        assert cache.get("unknown") is None
+        assert cache.misses == 1
+
+    def test_entries_expire(self) -> None:
+        """Entries should not be returned after their TTL elapses."""
+        cache = LocalCache(max_size=10, ttl_seconds=60)
+
+        with patch("weather_proxy.services.local_cache.time.monotonic") as clock:
+            clock.return_value = 1000.0
+            cache.set("berlin", "value", ttl=5)
+            clock.return_value = 1006.0
+            assert cache.get("berlin") is None
+
+    def test_ttl_is_capped_by_cache_ttl(self) -> None:
+        """A per-entry TTL above the cache TTL should be capped."""
+        cache = LocalCache(max_size=10, ttl_seconds=5)
+
+        with patch("weather_proxy.services.local_cache.time.monotonic") as clock:
+            clock.return_value = 1000.0
+            cache.set("berlin", "value", ttl=300)
+            clock.return_value = 1006.0
+            assert cache.get("berlin") is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        """The least recently used entry should be evicted when full."""
+        cache = LocalCache(max_size=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def test_zero_ttl_disables_cache(self) -> None:
+        """A zero TTL should disable storage entirely."""
+        cache = LocalCache(max_size=10, ttl_seconds=0)
+        cache.set("berlin", "value")
+
+        assert cache.get("berlin") is None
+        assert cache.stats()["size"] == 0
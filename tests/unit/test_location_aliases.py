@@ -0,0 +1,85 @@
+"""Unit tests for LocationAliases."""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+import redis
+
+from weather_proxy.services.location_aliases import LocationAliases
+
+
+@pytest.mark.unit
+class TestLocationAliases:
+    """Tests for LocationAliases class."""
+
+    @patch("weather_proxy.services.location_aliases.redis.from_url")
+    def test_get_reads_normalized_key(self, mock_redis: Mock) -> None:
+        """get should read the alias key of the normalized query."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        mock_client.get.return_value = "5128581"
+
+        aliases = LocationAliases()
+
+        assert aliases.get("  New York ") == 5128581
+        mock_client.get.assert_called_once_with("alias:new york")
+
+    @patch("weather_proxy.services.location_aliases.redis.from_url")
+    def test_get_serves_repeat_reads_from_local_cache(self, mock_redis: Mock) -> None:
+        """Repeated lookups should not go back to Redis."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        mock_client.get.return_value = "5128581"
+
+        aliases = LocationAliases()
+        aliases.get("NYC")
+        aliases.get("nyc")
+
+        mock_client.get.assert_called_once()
+
+    @patch("weather_proxy.services.location_aliases.redis.from_url")
+    def test_get_returns_none_for_unknown_query(self, mock_redis: Mock) -> None:
+        """get should return None for queries that were never resolved."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        mock_client.get.return_value = None
+
+        assert LocationAliases().get("asdfgh") is None
+
+    @patch("weather_proxy.services.location_aliases.redis.from_url")
+    def test_get_returns_none_on_redis_error(self, mock_redis: Mock) -> None:
+        """get should treat Redis errors as an unknown alias."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        mock_client.get.side_effect = redis.RedisError("Connection failed")
+
+        assert LocationAliases().get("NYC") is None
+
+    @patch("weather_proxy.services.location_aliases.redis.from_url")
+    def test_set_writes_key_with_own_expiry(self, mock_redis: Mock) -> None:
+        """set should store each alias under its own key and TTL."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+
+        aliases = LocationAliases(ttl_seconds=3600)
+
+        assert aliases.set("NYC", 5128581) is True
+        assert aliases.set("New York", 5128581) is True
+        mock_client.set.assert_any_call("alias:nyc", 5128581, ex=3600)
+        mock_client.set.assert_any_call("alias:new york", 5128581, ex=3600)
+        mock_client.expire.assert_not_called()
+        assert aliases.get("nyc") == 5128581
+        mock_client.get.assert_not_called()
+
+    @patch("weather_proxy.services.location_aliases.redis.from_url")
+    def test_set_returns_false_on_redis_error(self, mock_redis: Mock) -> None:
+        """A failed write should not be served from the local cache."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        mock_client.set.side_effect = redis.RedisError("Connection failed")
+        mock_client.get.return_value = None
+
+        aliases = LocationAliases()
+
+        assert aliases.set("NYC", 5128581) is False
+        assert aliases.get("NYC") is None
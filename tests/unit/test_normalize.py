@@ -0,0 +1,132 @@
+"""Unit tests for query normalization."""
+
+import time
+
+import pytest
+
+from weather_proxy.utils.normalize import (
+    NormalizedQuery,
+    normalize_query,
+    normalize_text,
+    query_key,
+)
+
+
+@pytest.mark.unit
+class TestNormalizeText:
+    """Tests for normalize_text function."""
+
+    def test_folds_case_and_accents(self) -> None:
+        """Accented and differently cased spellings should match."""
+        assert normalize_text("São Paulo") == normalize_text("SAO PAULO")
+        assert normalize_text("Zürich") == "zurich"
+        assert normalize_text("Düsseldorf") == "dusseldorf"
+
+    def test_folds_letters_without_decomposition(self) -> None:
+        """Letters that are not base letter plus accent should be folded too."""
+        assert normalize_text("Łódź") == "lodz"
+        assert normalize_text("Tromsø") == "tromso"
+        assert normalize_text("Straße") == "strasse"
+
+    def test_applies_nfkc(self) -> None:
+        """Compatibility characters should fold to their plain forms."""
+        assert normalize_text("Ｂｅｒｌｉｎ") == "berlin"
+
+    def test_collapses_whitespace_and_punctuation(self) -> None:
+        """Runs of spaces and punctuation should become a single space."""
+        assert normalize_text("  Saint-Étienne ") == "saint etienne"
+        assert normalize_text("St. John's") == "st john s"
+        assert normalize_text("New\tYork") == normalize_text("new  york")
+
+    def test_keeps_non_latin_scripts(self) -> None:
+        """Letters of other scripts should survive normalization."""
+        assert normalize_text("東京") == "東京"
+        assert normalize_text("Москва") == "москва"
+
+
+@pytest.mark.unit
+class TestNormalizeQuery:
+    """Tests for normalize_query and query_key functions."""
+
+    def test_splits_country_code_suffix(self) -> None:
+        """A trailing ISO code should become the country hint."""
+        assert normalize_query("Paris, FR") == NormalizedQuery("paris", "FR")
+        assert normalize_query("paris,fr").key == "paris,fr"
+
+    def test_splits_country_name_suffix(self) -> None:
+        """A trailing country name should map to the same hint as its code."""
+        assert query_key("Paris, France") == query_key("PARIS,  fr")
+        assert query_key("London, United Kingdom") == "london,gb"
+        assert query_key("Portland, USA") == "portland,us"
+
+    def test_keeps_unknown_suffix_in_name(self) -> None:
+        """Suffixes that are not countries should stay part of the name."""
+        assert normalize_query("Paris, Texas") == NormalizedQuery("paris texas")
+        assert normalize_query("Springfield, XX") == NormalizedQuery("springfield xx")
+
+    def test_country_alone_is_a_name(self) -> None:
+        """A suffix without a city in front of it should not be a hint."""
+        assert normalize_query(", France") == NormalizedQuery("france")
+
+    def test_equivalent_spellings_share_key(self) -> None:
+        """Spellings that differ only in form should map to one key."""
+        keys = {query_key(q) for q in ["Zürich", " zurich ", "ZURICH", "Zürich"]}
+        assert keys == {"zurich"}
+
+    def test_empty_queries_have_empty_key(self) -> None:
+        """Queries with no letters or digits should normalize to nothing."""
+        assert query_key("  ") == ""
+        assert query_key("!!!") == ""
+
+    def test_results_are_memoized(self) -> None:
+        """Repeated queries should be served from the memo."""
+        normalize_query.cache_clear()
+        normalize_query("Berlin")
+        normalize_query("Berlin")
+
+        assert normalize_query.cache_info().hits == 1
+
+    def test_repeated_queries_hit_the_memo(self) -> None:
+        """A second pass over the same queries should be served from the memo."""
+        normalize_query.cache_clear()
+        distinct = [f"Zürich {i}, CH" for i in range(2000)]
+        for query in distinct:
+            normalize_query(query)
+        misses = normalize_query.cache_info().misses
+
+        for query in distinct:
+            normalize_query(query)
+
+        info = normalize_query.cache_info()
+        assert info.hits == len(distinct)
+        assert info.misses == misses == len(distinct)
+
+
+def _time_queries(queries: list[str]) -> float:
+    """Seconds taken to normalize each query in turn."""
+    started = time.perf_counter()
+    for query in queries:
+        normalize_query(query)
+    return time.perf_counter() - started
+
+
+@pytest.mark.benchmark
+class TestNormalizeBenchmark:
+    """Rough benchmarks of the normalization pipeline, run with -m benchmark."""
+
+    def test_uncached_queries_are_cheap(self) -> None:
+        """Normalizing distinct queries should take microseconds each."""
+        normalize_query.cache_clear()
+        queries = [f"Saint-Étienne {i}, France" for i in range(5000)]
+
+        # About 80ms here; the bound leaves room for slow CI machines
+        assert _time_queries(queries) < 1
+
+    def test_memoized_queries_skip_normalization(self) -> None:
+        """Repeated queries should be much cheaper than distinct ones."""
+        normalize_query.cache_clear()
+        distinct = [f"Zürich {i}, CH" for i in range(2000)]
+        uncached = _time_queries(distinct)
+        cached = _time_queries(distinct)
+
+        assert cached * 5 < uncached
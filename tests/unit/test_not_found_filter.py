@@ -0,0 +1,139 @@
+"""Unit tests for NotFoundFilter."""
+
+import time
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+import redis
+
+from weather_proxy.services.not_found_filter import NotFoundFilter
+
+
+@pytest.mark.unit
+class TestNotFoundFilter:
+    """Tests for NotFoundFilter class."""
+
+    @patch("weather_proxy.services.not_found_filter.redis.from_url")
+    def test_added_query_is_rejected_locally(self, mock_redis: Mock) -> None:
+        """An added query should be matched without another Redis read."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        mock_client.mget.return_value = [None, None]
+
+        bloom = NotFoundFilter(capacity=100, error_rate=0.01, sync_seconds=60)
+        bloom.sync()
+        bloom.add(["Asdfgh"])
+
+        assert bloom.might_contain(" asdfgh ")
+        assert not bloom.might_contain("Berlin")
+        mock_client.mget.assert_called_once()
+
+    @patch("weather_proxy.services.not_found_filter.redis.from_url")
+    def test_add_sets_bits_in_current_generation(self, mock_redis: Mock) -> None:
+        """add should SETBIT each position and expire after two generations."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        mock_client.mget.return_value = [None, None]
+        pipe = mock_client.pipeline.return_value
+
+        bloom = NotFoundFilter(capacity=100, error_rate=0.01, rotate_seconds=3600)
+        bloom.add(["asdfgh"])
+
+        generation = int(time.time() // 3600)
+        key = f"notfound:bloom:{generation}"
+        assert pipe.setbit.call_count == bloom.hash_count
+        assert {c.args[0] for c in pipe.setbit.call_args_list} == {key}
+        pipe.expire.assert_any_call(key, 7200)
+        pipe.incrby.assert_called_once_with(f"{key}:count", 1)
+
+    @patch("weather_proxy.services.not_found_filter.redis.from_url")
+    def test_loads_bitmaps_written_by_other_workers(self, mock_redis: Mock) -> None:
+        """A worker should see queries added through another instance."""
+        writer_client = MagicMock()
+        reader_client = MagicMock()
+        mock_redis.side_effect = [writer_client, reader_client]
+        writer_client.mget.return_value = [None, None]
+
+        writer = NotFoundFilter(capacity=100, error_rate=0.01)
+        writer.sync()
+        writer.add(["asdfgh"])
+        generation = int(time.time() // writer.rotate_seconds)
+        reader_client.mget.return_value = [
+            writer._filters[generation].to_bytes(),
+            None,
+        ]
+
+        reader = NotFoundFilter(capacity=100, error_rate=0.01)
+        assert reader.sync() is True
+
+        assert reader.might_contain("asdfgh")
+        assert not reader.might_contain("Berlin")
+
+    @patch("weather_proxy.services.not_found_filter.redis.from_url")
+    def test_redis_error_keeps_last_known_copy(self, mock_redis: Mock) -> None:
+        """A failed sync should keep the local copy, including local bits."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        mock_client.mget.return_value = [None, None]
+        mock_client.pipeline.return_value.execute.side_effect = redis.RedisError(
+            "Connection failed"
+        )
+
+        bloom = NotFoundFilter(capacity=100, error_rate=0.01, sync_seconds=0)
+        bloom.sync()
+        assert bloom.add(["asdfgh"]) is False
+        mock_client.mget.side_effect = redis.RedisError("Connection failed")
+
+        assert bloom.sync() is False
+        assert bloom.might_contain("asdfgh")
+        assert not bloom.might_contain("Berlin")
+
+    @patch("weather_proxy.services.not_found_filter.redis.from_url")
+    def test_unloaded_filter_rules_nothing_out(self, mock_redis: Mock) -> None:
+        """Before a sync succeeds, every query should be a possible hit."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        mock_client.mget.side_effect = redis.RedisError("Connection failed")
+
+        bloom = NotFoundFilter(capacity=100, error_rate=0.01)
+
+        assert bloom.might_contain("Berlin")
+        assert bloom.sync() is False
+        assert bloom.might_contain("Berlin")
+
+    @patch("weather_proxy.services.not_found_filter.redis.from_url")
+    def test_checks_never_read_redis(self, mock_redis: Mock) -> None:
+        """Checks should use the local copy; syncs are claimed once per interval."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        mock_client.mget.return_value = [None, None]
+
+        bloom = NotFoundFilter(capacity=100, error_rate=0.01, sync_seconds=60)
+
+        assert bloom.claim_sync() is True
+        assert bloom.claim_sync() is False
+        bloom.sync()
+        for _ in range(10):
+            bloom.might_contain("Berlin")
+
+        mock_client.mget.assert_called_once()
+
+    @patch("weather_proxy.services.not_found_filter.redis.from_url")
+    def test_full_generation_takes_no_more_queries(self, mock_redis: Mock) -> None:
+        """Once a generation holds capacity queries, new ones should be dropped."""
+        mock_client = MagicMock()
+        mock_redis.return_value = mock_client
+        mock_client.mget.return_value = [None, None]
+        pipe = mock_client.pipeline.return_value
+        # Other workers already filled the generation
+        pipe.execute.return_value = [100, True, True]
+
+        bloom = NotFoundFilter(capacity=100, error_rate=0.01, sync_seconds=60)
+        bloom.sync()
+        assert bloom.add(["asdfgh"]) is True
+        pipe.reset_mock()
+
+        assert bloom.add(["qwerty"]) is False
+        pipe.setbit.assert_not_called()
+        # A full generation no longer rules queries out
+        assert bloom.might_contain("Berlin")
@@ -0,0 +1,105 @@
+"""Unit tests for RefreshAheadScheduler."""
+
+import threading
+import time
+
+import pytest
+
+from weather_proxy.services.refresh_ahead import RefreshAheadScheduler
+
+
+def _scheduler(refresh, cities, **kwargs) -> RefreshAheadScheduler:
+    options = {
+        "interval_seconds": 60,
+        "max_concurrency": 2,
+        "rate_per_second": 1000,
+    }
+    options.update(kwargs)
+    return RefreshAheadScheduler(refresh=refresh, hot_cities=lambda: cities, **options)
+
+
+@pytest.mark.unit
+class TestRefreshAheadScheduler:
+    """Tests for RefreshAheadScheduler class."""
+
+    def test_run_once_refreshes_every_hot_city(self) -> None:
+        """A round should offer each hot city to the refresh function."""
+        seen = []
+        lock = threading.Lock()
+
+        def refresh(city: str) -> bool:
+            with lock:
+                seen.append(city)
+            return city != "Paris"
+
+        scheduler = _scheduler(refresh, ["Berlin", "Paris", "Rome"])
+
+        assert scheduler.run_once() == 2
+        assert sorted(seen) == ["Berlin", "Paris", "Rome"]
+
+    def test_run_once_skips_when_not_leader(self) -> None:
+        """Only the leader process should refresh."""
+        seen = []
+        scheduler = _scheduler(seen.append, ["Berlin"], is_leader=lambda: False)
+
+        assert scheduler.run_once() == 0
+        assert seen == []
+
+    def test_refresh_errors_do_not_stop_the_round(self) -> None:
+        """A failing city should not prevent the others from refreshing."""
+
+        def refresh(city: str) -> bool:
+            if city == "Berlin":
+                raise RuntimeError("boom")
+            return True
+
+        scheduler = _scheduler(refresh, ["Berlin", "Paris"])
+
+        assert scheduler.run_once() == 1
+
+    def test_concurrency_is_bounded(self) -> None:
+        """No more than max_concurrency refreshes should run at once."""
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def refresh(_city: str) -> bool:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return True
+
+        scheduler = _scheduler(refresh, [str(i) for i in range(8)], max_concurrency=2)
+
+        assert scheduler.run_once() == 8
+        assert peak <= 2
+
+    def test_rate_limit_spaces_out_refreshes(self) -> None:
+        """Refreshes should start no faster than the configured rate."""
+        scheduler = _scheduler(
+            lambda _city: True, ["Berlin", "Paris", "Rome"], rate_per_second=50
+        )
+
+        started = time.monotonic()
+        scheduler.run_once()
+
+        assert time.monotonic() - started >= 0.04
+
+    def test_start_and_stop(self) -> None:
+        """The scheduler thread should run rounds until stopped."""
+        ran = threading.Event()
+
+        def refresh(_city: str) -> bool:
+            ran.set()
+            return True
+
+        scheduler = _scheduler(refresh, ["Berlin"], interval_seconds=0.01)
+        scheduler.start()
+        try:
+            assert ran.wait(2)
+        finally:
+            scheduler.stop(timeout=2)
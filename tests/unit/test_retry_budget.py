@@ -0,0 +1,95 @@
+"""Unit tests for the retry budget."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import redis
+
+from weather_proxy.resilience.retry_budget import RetryBudget
+
+
+def _budget(**kwargs: object) -> RetryBudget:
+    """Create a local budget with a long window so counts don't slide."""
+    defaults = {
+        "ratio": 0.1,
+        "min_retries": 0,
+        "window_seconds": 3600,
+        "shared": False,
+    }
+    return RetryBudget(**{**defaults, **kwargs})  # type: ignore[arg-type]
+
+
+@pytest.mark.unit
+class TestRetryBudget:
+    """Tests for RetryBudget class."""
+
+    def test_no_retries_without_calls(self) -> None:
+        """With no floor, a budget without primary calls should refuse retries."""
+        assert _budget().try_acquire() is False
+
+    def test_retries_are_a_fraction_of_calls(self) -> None:
+        """Retries should be capped at ratio times the primary calls."""
+        budget = _budget(ratio=0.1)
+        for _ in range(100):
+            budget.record_call()
+
+        granted = sum(budget.try_acquire() for _ in range(50))
+
+        assert granted == 10
+
+    def test_min_retries_floor(self) -> None:
+        """The floor should allow a few retries even without traffic."""
+        budget = _budget(min_retries=3)
+
+        assert [budget.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+    def test_shared_budget_uses_cluster_counts(self) -> None:
+        """A shared budget should decide from the totals read back from Redis."""
+        client = MagicMock()
+        pipe = client.pipeline.return_value
+        # Other workers made 1000 calls and no retries this window
+        pipe.execute.return_value = [1, 0, True, [None, None], ["1000", "0"]]
+        budget = _budget(shared=True, sync_seconds=60)
+
+        with patch(
+            "weather_proxy.resilience.retry_budget.redis.from_url",
+            return_value=client,
+        ):
+            budget.record_call()
+
+        assert [c.args[1:] for c in pipe.hincrby.call_args_list] == [
+            ("calls", 1),
+            ("retries", 0),
+        ]
+        assert sum(budget.try_acquire() for _ in range(200)) == 100
+
+    def test_shared_budget_falls_back_to_local_counts(self) -> None:
+        """Redis errors should leave the decision to local counts."""
+        client = MagicMock()
+        client.pipeline.return_value.execute.side_effect = redis.ConnectionError()
+        budget = _budget(shared=True, sync_seconds=60)
+
+        with patch(
+            "weather_proxy.resilience.retry_budget.redis.from_url",
+            return_value=client,
+        ):
+            for _ in range(10):
+                budget.record_call()
+
+        assert budget.sync() is False
+        assert [budget.try_acquire() for _ in range(2)] == [True, False]
+
+    def test_local_budget_keeps_only_recent_windows(self) -> None:
+        """Counts should not pile up for old windows or for Redis syncs."""
+        budget = _budget(window_seconds=10)
+
+        for step in range(100):
+            with patch(
+                "weather_proxy.resilience.retry_budget.time.time",
+                return_value=step * 10.0,
+            ):
+                budget.record_call()
+                budget.try_acquire()
+
+        assert sorted(budget._counts) == [98, 99]
+        assert budget._unsynced == {}
@@ -0,0 +1,111 @@
+"""Unit tests for SingleFlight request coalescing."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from weather_proxy.resilience.single_flight import SingleFlight, SingleFlightTimeout
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    """Tests for SingleFlight class."""
+
+    def test_do_returns_function_result(self) -> None:
+        """do should return the result of the function."""
+        flight = SingleFlight()
+
+        assert flight.do("berlin", lambda: 42, timeout=1) == 42
+        assert flight.in_flight() == 0
+
+    def test_concurrent_callers_share_one_execution(self) -> None:
+        """Concurrent calls for the same key should run the function once."""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def fetch() -> str:
+            calls.append(1)
+            started.set()
+            release.wait(2)
+            return "weather"
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            leader = pool.submit(flight.do, "berlin", fetch, 2)
+            started.wait(2)
+            waiters = [pool.submit(flight.do, "berlin", fetch, 2) for _ in range(4)]
+            release.set()
+            results = [leader.result()] + [w.result() for w in waiters]
+
+        assert results == ["weather"] * 5
+        assert len(calls) == 1
+
+    def test_waiters_receive_leader_error(self) -> None:
+        """Waiters should re-raise the error raised by the leader."""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def fetch() -> str:
+            started.set()
+            release.wait(2)
+            raise ValueError("upstream failed")
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(flight.do, "berlin", fetch, 2)
+            started.wait(2)
+            waiter = pool.submit(flight.do, "berlin", fetch, 2)
+            release.set()
+
+            with pytest.raises(ValueError):
+                leader.result()
+            with pytest.raises(ValueError):
+                waiter.result()
+
+    def test_waiter_times_out(self) -> None:
+        """Waiters should give up after the timeout elapses."""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def fetch() -> str:
+            started.set()
+            release.wait(2)
+            return "weather"
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(flight.do, "berlin", fetch, 2)
+            started.wait(2)
+            with pytest.raises(SingleFlightTimeout):
+                flight.do("berlin", fetch, timeout=0.05)
+            release.set()
+            assert leader.result() == "weather"
+
+    def test_different_keys_do_not_coalesce(self) -> None:
+        """Calls for different keys should run independently."""
+        flight = SingleFlight()
+
+        assert flight.do("berlin", lambda: "b", timeout=1) == "b"
+        assert flight.do("paris", lambda: "p", timeout=1) == "p"
+
+    def test_submit_shares_one_background_call(self) -> None:
+        """Concurrent submits for a key should share the call in flight."""
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def fetch() -> str:
+            release.wait(2)
+            return "weather"
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            first = flight.submit("berlin", lambda: pool.submit(fetch))
+            second = flight.submit("berlin", lambda: pool.submit(fetch))
+            assert second is first
+            assert flight.in_flight() == 1
+
+            release.set()
+            assert first.result(2) == "weather"
+
+        assert flight.in_flight() == 0
@@ -0,0 +1,72 @@
+"""Unit tests for the count-min sketch and top-K tracker."""
+
+import pytest
+
+from weather_proxy.utils.sketch import CountMinSketch, TopK
+
+
+@pytest.mark.unit
+class TestCountMinSketch:
+    """Tests for CountMinSketch class."""
+
+    def test_estimate_is_exact_without_collisions(self) -> None:
+        """Counts of a few items in a wide sketch should be exact."""
+        sketch = CountMinSketch(width=1024, depth=4)
+        for _ in range(5):
+            sketch.add("berlin")
+        sketch.add("paris", 3)
+
+        assert sketch.estimate("berlin") == 5
+        assert sketch.estimate("paris") == 3
+        assert sketch.estimate("tokyo") == 0
+
+    def test_add_returns_new_estimate(self) -> None:
+        """add should return the item's estimate after counting."""
+        sketch = CountMinSketch(width=64, depth=2)
+
+        assert sketch.add("berlin") == 1
+        assert sketch.add("berlin", 4) == 5
+
+    def test_never_undercounts(self) -> None:
+        """A narrow sketch may overcount but never undercount."""
+        sketch = CountMinSketch(width=8, depth=2)
+        for i in range(200):
+            sketch.add(f"city-{i % 50}")
+
+        assert all(sketch.estimate(f"city-{i}") >= 4 for i in range(50))
+
+
+@pytest.mark.unit
+class TestTopK:
+    """Tests for TopK class."""
+
+    def test_keeps_highest_counts(self) -> None:
+        """Items with higher counts should evict the smallest tracked one."""
+        top = TopK(k=2)
+        top.update("berlin", 5)
+        top.update("paris", 1)
+        top.update("tokyo", 3)
+
+        assert top.items() == [("berlin", 5), ("tokyo", 3)]
+        assert len(top) == 2
+
+    def test_updated_counts_replace_old_ones(self) -> None:
+        """Repeated updates should track the latest count of an item."""
+        top = TopK(k=2)
+        top.update("paris", 1)
+        top.update("berlin", 2)
+        top.update("paris", 4)
+        top.update("tokyo", 3)
+
+        assert top.items() == [("paris", 4), ("tokyo", 3)]
+
+    def test_stays_bounded_under_many_updates(self) -> None:
+        """Outdated heap entries should be compacted away."""
+        top = TopK(k=3)
+        sketch = CountMinSketch(width=256, depth=4)
+        for i in range(1000):
+            city = f"city-{i % 10}"
+            top.update(city, sketch.add(city))
+
+        assert len(top) == 3
+        assert len(top._heap) <= 4 * 16
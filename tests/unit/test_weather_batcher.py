@@ -0,0 +1,163 @@
+"""Unit tests for WeatherBatcher."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from weather_proxy.config import get_config
+from weather_proxy.resilience.deadline import (
+    DeadlineExceeded,
+    remaining,
+    request_deadline,
+)
+from weather_proxy.services.weather_batcher import WeatherBatcher
+from weather_proxy.services.weather_service import WeatherData, WeatherServiceError
+
+
+def _weather(temperature: float) -> WeatherData:
+    return WeatherData(
+        temperature=temperature,
+        temperature_unit="°C",
+        weather_code=0,
+        weather_description="Clear sky",
+        wind_speed=10.0,
+        wind_speed_unit="km/h",
+    )
+
+
+def _echo_service() -> MagicMock:
+    """Service whose results encode each location's latitude as temperature."""
+    service = MagicMock()
+    service.get_weather_many.side_effect = lambda locations: [
+        _weather(lat) for lat, _ in locations
+    ]
+    return service
+
+
+@pytest.mark.unit
+class TestWeatherBatcher:
+    """Tests for WeatherBatcher class."""
+
+    def test_single_lookup_flushes_after_window(self) -> None:
+        """A lone lookup should be sent once the window elapses."""
+        service = _echo_service()
+        batcher = WeatherBatcher(
+            window_seconds=0.01, max_batch_size=10, weather_service=service
+        )
+
+        result = batcher.get_weather(52.52, 13.41)
+
+        assert result.temperature == 52.52
+        service.get_weather_many.assert_called_once_with([(52.52, 13.41)])
+
+    def test_concurrent_lookups_share_one_request(self) -> None:
+        """Lookups within one window should go out as one upstream call."""
+        service = _echo_service()
+        batcher = WeatherBatcher(
+            window_seconds=2, max_batch_size=4, weather_service=service
+        )
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [
+                pool.submit(batcher.get_weather, float(lat), 0.0) for lat in range(4)
+            ]
+            results = [f.result(timeout=2) for f in futures]
+
+        assert [r.temperature for r in results] == [0.0, 1.0, 2.0, 3.0]
+        service.get_weather_many.assert_called_once()
+        assert len(service.get_weather_many.call_args.args[0]) == 4
+
+    def test_duplicate_locations_are_requested_once(self) -> None:
+        """The same coordinates should appear once in the upstream request."""
+        service = _echo_service()
+        batcher = WeatherBatcher(
+            window_seconds=2, max_batch_size=3, weather_service=service
+        )
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(batcher.get_weather, 1.0, 2.0) for _ in range(3)]
+            results = [f.result(timeout=2) for f in futures]
+
+        assert all(r.temperature == 1.0 for r in results)
+        service.get_weather_many.assert_called_once_with([(1.0, 2.0)])
+
+    def test_upstream_error_is_raised_to_every_caller(self) -> None:
+        """A failed batch request should fail every lookup in the batch."""
+        service = MagicMock()
+        service.get_weather_many.side_effect = WeatherServiceError("boom")
+        batcher = WeatherBatcher(
+            window_seconds=2, max_batch_size=2, weather_service=service
+        )
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(batcher.get_weather, 1.0, 2.0) for _ in range(2)]
+            for future in futures:
+                with pytest.raises(WeatherServiceError):
+                    future.result(timeout=2)
+
+    def test_next_window_starts_a_new_batch(self) -> None:
+        """Lookups after a flush should not join the already-sent batch."""
+        service = _echo_service()
+        batcher = WeatherBatcher(
+            window_seconds=0.01, max_batch_size=10, weather_service=service
+        )
+
+        batcher.get_weather(1.0, 0.0)
+        batcher.get_weather(2.0, 0.0)
+
+        assert service.get_weather_many.call_args_list[0].args[0] == [(1.0, 0.0)]
+        assert service.get_weather_many.call_args_list[1].args[0] == [(2.0, 0.0)]
+
+    def test_waiter_gives_up_on_stalled_batch(self) -> None:
+        """A lookup should not wait forever for a batch that never finishes."""
+        release = threading.Event()
+
+        def stalled(locations: list[tuple[float, float]]) -> list[WeatherData]:
+            release.wait(2)
+            return [_weather(lat) for lat, _ in locations]
+
+        service = MagicMock()
+        service.get_weather_many.side_effect = stalled
+        batcher = WeatherBatcher(
+            window_seconds=0.2,
+            max_batch_size=10,
+            weather_service=service,
+            wait_seconds=0.3,
+        )
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            leader = pool.submit(batcher.get_weather, 1.0, 0.0)
+            time.sleep(0.02)
+            with pytest.raises(WeatherServiceError) as exc_info:
+                batcher.get_weather(2.0, 0.0)
+            release.set()
+            assert leader.result(timeout=2).temperature == 1.0
+
+        assert isinstance(exc_info.value.__cause__, DeadlineExceeded)
+        assert len(service.get_weather_many.call_args.args[0]) == 2
+
+    def test_batch_ignores_flushing_caller_deadline(self) -> None:
+        """The upstream call should not inherit the deadline of its flusher."""
+        budgets: list[float | None] = []
+
+        def fetch(locations: list[tuple[float, float]]) -> list[WeatherData]:
+            budgets.append(remaining())
+            return [_weather(lat) for lat, _ in locations]
+
+        service = MagicMock()
+        service.get_weather_many.side_effect = fetch
+        batcher = WeatherBatcher(
+            window_seconds=0.01, max_batch_size=10, weather_service=service
+        )
+
+        with (
+            patch.object(get_config(), "request_deadline_seconds", 10),
+            request_deadline(1),
+        ):
+            batcher.get_weather(1.0, 0.0)
+
+        assert budgets[0] is not None
+        assert budgets[0] > 5
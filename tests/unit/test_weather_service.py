@@ -1,5 +1,9 @@
 """Unit tests for WeatherService."""
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
 import httpx
 import pytest
 import respx
@@ -8,6 +12,8 @@ from weather_proxy.services.weather_service import (
     WeatherData,
     WeatherService,
     WeatherServiceError,
+    grid_cell_key,
+    next_update_at,
 )
 
 
@@ -180,3 +186,141 @@ class TestWeatherService:
         """Service should use custom timeout if provided."""
         service = WeatherService(timeout=30)
         assert service.timeout == 30
+
+    @respx.mock
+    def test_get_weather_many_uses_single_request(self) -> None:
+        """get_weather_many should fetch all locations in one request."""
+        route = respx.get("https://api.open-meteo.com/v1/forecast").mock(
+            return_value=httpx.Response(
+                200,
+                json=[
+                    {"current": {"temperature_2m": 15.5, "weather_code": 3}},
+                    {"current": {"temperature_2m": 20.0, "weather_code": 0}},
+                ],
+            )
+        )
+
+        service = WeatherService()
+        results = service.get_weather_many([(52.52, 13.41), (48.85, 2.35)])
+
+        assert [w.temperature for w in results] == [15.5, 20.0]
+        assert results[1].weather_description == "Clear sky"
+        assert route.call_count == 1
+        params = route.calls[0].request.url.params
+        assert params["latitude"] == "52.52,48.85"
+        assert params["longitude"] == "13.41,2.35"
+
+    @respx.mock
+    def test_get_weather_many_accepts_single_object(self) -> None:
+        """A single-location batch should accept an object response."""
+        respx.get("https://api.open-meteo.com/v1/forecast").mock(
+            return_value=httpx.Response(
+                200, json={"current": {"temperature_2m": 15.5, "weather_code": 3}}
+            )
+        )
+
+        results = WeatherService().get_weather_many([(52.52, 13.41)])
+
+        assert len(results) == 1
+        assert results[0].temperature == 15.5
+
+    @respx.mock
+    def test_get_weather_many_rejects_mismatched_results(self) -> None:
+        """get_weather_many should fail if result count does not match input."""
+        respx.get("https://api.open-meteo.com/v1/forecast").mock(
+            return_value=httpx.Response(
+                200, json=[{"current": {"temperature_2m": 15.5}}]
+            )
+        )
+
+        with pytest.raises(WeatherServiceError):
+            WeatherService().get_weather_many([(52.52, 13.41), (48.85, 2.35)])
+
+    @respx.mock
+    def test_concurrent_requests_overlap(self) -> None:
+        """The circuit breaker should not serialize concurrent upstream calls."""
+
+        def slow_response(_request: httpx.Request) -> httpx.Response:
+            time.sleep(0.2)
+            return httpx.Response(
+                200, json={"current": {"temperature_2m": 15.5, "weather_code": 3}}
+            )
+
+        respx.get("https://api.open-meteo.com/v1/forecast").mock(
+            side_effect=slow_response
+        )
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(
+                pool.map(lambda _: WeatherService().get_weather(52.52, 13.41), range(8))
+            )
+
+        assert [w.temperature for w in results] == [15.5] * 8
+        assert time.monotonic() - started < 0.8
+
+    def test_get_weather_many_empty(self) -> None:
+        """get_weather_many should not call upstream for an empty list."""
+        assert WeatherService().get_weather_many([]) == []
+
+    def test_grid_cell_key_groups_nearby_points(self) -> None:
+        """Points in the same grid cell should share a key."""
+        city = grid_cell_key(52.52, 13.41, 0.1)
+        suburb = grid_cell_key(52.54, 13.46, 0.1)
+        neighbour = grid_cell_key(52.62, 13.41, 0.1)
+
+        assert city == suburb == "0.1:525:134"
+        assert neighbour != city
+
+    def test_grid_cell_key_handles_negative_coordinates(self) -> None:
+        """Cells should not straddle the equator or the prime meridian."""
+        assert grid_cell_key(-0.05, -0.05, 0.1) == "0.1:-1:-1"
+        assert grid_cell_key(0.05, 0.05, 0.1) == "0.1:0:0"
+
+    @respx.mock
+    def test_get_weather_expires_with_next_upstream_update(self) -> None:
+        """expires_at should be the current value's time plus its interval."""
+        route = respx.get("https://api.open-meteo.com/v1/forecast").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "current": {
+                        "time": 1_700_000_100,
+                        "interval": 900,
+                        "temperature_2m": 15.5,
+                    },
+                },
+            )
+        )
+
+        with patch("weather_proxy.services.weather_service.time.time") as now:
+            now.return_value = 1_700_000_400
+            weather = WeatherService().get_weather(52.52, 13.41)
+
+        assert weather.expires_at == 1_700_001_000
+        assert route.calls.last.request.url.params["timeformat"] == "unixtime"
+
+    def test_next_update_at_uses_configured_interval(self) -> None:
+        """Sections without an interval should use the given one."""
+        assert next_update_at({"time": 1000}, 900, now=1200) == 1900
+        assert next_update_at({"time": 1000, "interval": 60}, 900, now=1200) == 1060
+
+    def test_next_update_at_parses_local_iso_times(self) -> None:
+        """ISO8601 times should be shifted from local time to UTC."""
+        section = {"time": "2024-01-01T13:00", "interval": 900}
+
+        # 13:00 at UTC+1 is 12:00 UTC
+        assert next_update_at(section, 0, 3600, now=1_704_111_000) == 1_704_111_300
+
+    def test_next_update_at_picks_step_covering_now(self) -> None:
+        """Hourly and daily sections should use the step that has started."""
+        section = {"time": [1000, 4600, 8200]}
+
+        assert next_update_at(section, 3600, now=5000) == 8200
+        assert next_update_at(section, 3600, now=500) is None
+
+    def test_next_update_at_disabled_or_unknown(self) -> None:
+        """A zero interval or missing time should give no expiry."""
+        assert next_update_at({"time": 1000}, 0, now=1200) is None
+        assert next_update_at({}, 900, now=1200) is None
+        assert next_update_at({"time": "soon"}, 900, now=1200) is None